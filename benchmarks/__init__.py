@@ -0,0 +1 @@
+"""Performance benchmarks for elvenfire (not run as part of the tests)."""
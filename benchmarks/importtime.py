@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+import time
+
+
+"""Import-time benchmark.
+
+Each module is imported in a fresh interpreter (as a worker process or a
+short CLI run would), several times, and the median wall-clock time of the
+import alone is reported, together with the number of elvenfire modules it
+pulled in.  Compiled .pyc files are warmed up first, so the figures reflect
+repeated runs rather than the first one after an edit.
+
+  python -m benchmarks.importtime [--repeat N] [module ...]
+
+"""
+
+
+modules = ['elvenfire',
+           'elvenfire.abilities.charabilities',
+           'elvenfire.artifacts.greater',
+           'elvenfire.creatures.nontrainable',
+           'elvenfire.creatures.character',
+           'elvenfire.labyrinth.parties',
+           'elvenfire.labyrinth.rooms',
+           'elvenfire.streams']
+
+_probe = """
+import sys, time
+start = time.perf_counter()
+import %s
+elapsed = time.perf_counter() - start
+loaded = len([m for m in sys.modules if m.startswith('elvenfire')])
+print(elapsed, loaded)
+"""
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def importtime(module, repeat=7):
+    """Return (median seconds, elvenfire modules loaded) for one import."""
+    times = []
+    for i in range(repeat + 1):
+        output = subprocess.check_output([sys.executable, '-c',
+                                          _probe % module], cwd=root)
+        elapsed, loaded = output.split()
+        if i > 0:  # the first run only warms up .pyc files
+            times.append(float(elapsed))
+    times.sort()
+    return (times[len(times) // 2], int(loaded))
+
+
+def run(names=None, repeat=7):
+    """Return {module : (median seconds, modules loaded)}."""
+    return dict((name, importtime(name, repeat)) for name in names or modules)
+
+
+def report(results):
+    val = "%-36s %9s %8s\n" % ('Module', 'ms', 'loaded')
+    for name, (elapsed, loaded) in results.items():
+        val += "%-36s %9.2f %8d\n" % (name, elapsed * 1000, loaded)
+    return val
+
+
+def main(args=None):
+    args = list(sys.argv[1:] if args is None else args)
+    repeat = 7
+    if '--repeat' in args:
+        i = args.index('--repeat')
+        repeat = int(args[i + 1])
+        del args[i:i + 2]
+    print(report(run(args, repeat)), end='')
+
+
+if __name__ == '__main__':
+    main()
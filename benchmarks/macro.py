@@ -0,0 +1,33 @@
+from elvenfire.creatures.character import PlayerCharacter
+from elvenfire.creatures.pool import CharacterPool
+from elvenfire.labyrinth.parties import (PCParty, TrainableParty,
+                                         NonTrainableParty, SpecialParty)
+from elvenfire.labyrinth.rooms import Room, SecretRoom
+
+from benchmarks.runner import benchmark
+
+
+"""Macro benchmarks: characters, parties, and whole rooms."""
+
+
+@benchmark('PlayerCharacter level 0', 'creatures', macro=True)
+def _(): PlayerCharacter()
+
+@benchmark('PlayerCharacter level 25', 'creatures', macro=True)
+def _(): PlayerCharacter(charlevel=25)
+
+# maxCP as Room.maxCP() gives on average at level 3, difficulty 2
+for _class in (PCParty, TrainableParty, NonTrainableParty, SpecialParty):
+    benchmark('%s level 3' % _class.__name__, 'parties', macro=True)(
+        lambda _class=_class: _class(3, 34))
+
+_pool = CharacterPool()
+
+@benchmark('PCParty level 3 (pooled)', 'parties', macro=True)
+def _(): PCParty(3, 34, pool=_pool)
+
+for _level in (1, 5, 10):
+    benchmark('Room level %s' % _level, 'rooms', macro=True)(
+        lambda _level=_level: Room(_level, 1))
+    benchmark('SecretRoom level %s' % _level, 'rooms', macro=True)(
+        lambda _level=_level: SecretRoom(_level, 1))
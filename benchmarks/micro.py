@@ -0,0 +1,117 @@
+from elvenfire import bonus5, bonus25
+from elvenfire.abilities.charabilities import (PhysicalAbility, MentalAbility,
+                                               MentalAbilityWithOpposites)
+from elvenfire.abilities.itemabilities import (AttributeAbility, AmuletAbility,
+                                               WeaponAbility)
+from elvenfire.abilities import costs
+from elvenfire.artifacts.combat import Weapon, Armor
+from elvenfire.artifacts.greater import Ring, Rod
+from elvenfire.artifacts.lesser import Amulet, Gem
+from elvenfire.artifacts.potion import Potion
+from elvenfire.artifacts.written import Scroll, Book
+from elvenfire.artifacts.special import SpecialArtifact, STBattery
+from elvenfire.artifacts.values import ValueIndex, appraise
+from elvenfire.labyrinth.containers import ContainerSet
+from elvenfire.labyrinth.traps import Trap
+from elvenfire.labyrinth.locks import Lock
+from elvenfire.labyrinth.hexsystem.geomorphs import Geomorph
+from elvenfire.labyrinth.hexsystem import DOWNRIGHT
+from elvenfire.labyrinth.hexsystem import library
+
+from benchmarks.runner import benchmark
+
+
+"""Micro benchmarks: single rolls, abilities, artifacts, and room parts."""
+
+
+## Dice ##
+
+@benchmark('bonus5 level 1', 'dice')
+def _(): bonus5(1)
+
+@benchmark('bonus5 level 5', 'dice')
+def _(): bonus5(5)
+
+@benchmark('bonus25 level 1', 'dice')
+def _(): bonus25(1)
+
+@benchmark('bonus25 level 5', 'dice')
+def _(): bonus25(5)
+
+
+## Abilities ##
+
+for _class in (PhysicalAbility, MentalAbility, MentalAbilityWithOpposites,
+               AttributeAbility, AmuletAbility, WeaponAbility):
+    benchmark(_class.__name__, 'abilities')(_class)
+
+
+## Artifacts ##
+
+for _class in (Weapon, Armor, Ring, Rod, Amulet, Gem, Potion, Scroll, Book,
+               SpecialArtifact, STBattery):
+    benchmark(_class.__name__, 'artifacts')(_class)
+
+@benchmark('Weapon (Changling)', 'artifacts')
+def _(): Weapon(abilities=[WeaponAbility('Changling')])
+
+_ringindex = ValueIndex('Ring')
+
+@benchmark('ValueIndex Ring 100000+', 'artifacts')
+def _(): _ringindex.artifact(100000)
+
+_ringabilities = ['Speed [+ Slow] 3', 'Aid 1', 'Fireball 4']
+
+@benchmark('appraise Ring by ability names', 'artifacts')
+def _(): appraise('Ring', [costs.namedAC('Mental', name)
+                           for name in _ringabilities])
+
+
+## Labyrinth parts ##
+
+@benchmark('ContainerSet level 1', 'labyrinth')
+def _(): ContainerSet(1)
+
+@benchmark('ContainerSet level 5', 'labyrinth')
+def _(): ContainerSet(5)
+
+@benchmark('Trap.newtrap level 1', 'labyrinth')
+def _(): Trap.newtrap(1)
+
+@benchmark('Trap.newtrap level 5', 'labyrinth')
+def _(): Trap.newtrap(5)
+
+@benchmark('Trap.newtraps level 5 x100', 'labyrinth')
+def _(): Trap.newtraps(5, 100)
+
+@benchmark('Lock level 5', 'labyrinth')
+def _(): Lock(5)
+
+
+## Geomorphs ##
+
+@benchmark('Geomorph(5)', 'geomorphs')
+def _(): Geomorph(5)
+
+_geomorph = Geomorph(5)
+_rotated = Geomorph(5)
+
+@benchmark('Geomorph.rotate', 'geomorphs')
+def _(): _rotated.rotate(DOWNRIGHT)
+
+@benchmark('Geomorph.edgehexes', 'geomorphs')
+def _(): _geomorph.edgehexes()
+
+@benchmark('Geomorph.roomlist', 'geomorphs')
+def _(): _geomorph.roomlist()
+
+_packed = library.pack(_geomorph)
+
+@benchmark('library.pack', 'geomorphs')
+def _(): library.pack(_geomorph)
+
+@benchmark('library.unpack', 'geomorphs')
+def _(): library.unpack(5, *_packed)
+
+@benchmark('library.check', 'geomorphs')
+def _(): library.check(_geomorph)
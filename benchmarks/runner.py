@@ -0,0 +1,214 @@
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+
+"""Registry, timing, and reporting for the benchmark suite.
+
+Benchmarks are plain functions of no arguments, registered with @benchmark:
+
+  @benchmark('bonus5', group='dice')
+  def _():
+      bonus5(3)
+
+Every benchmark is seeded before it is timed, so two runs of the same commit
+make the same rolls, and is called once first, so that tables, samples, and
+caches built on first use are not timed.  Each is run in batches sized to
+last at least mintime seconds; the best of several batches gives ops/sec.  A
+separate, shorter pass under tracemalloc gives the average bytes allocated
+per call (and the peak for a single call), which tracks allocation churn
+rather than live memory.
+
+"""
+
+
+seed = 20121221
+
+registry = []
+
+
+class Benchmark:
+
+    """A single registered benchmark.
+
+    Attributes:
+      name  -- unique name, used as the key in JSON results
+      group -- 'dice', 'abilities', 'artifacts', 'labyrinth', etc.
+      func  -- callable taking no arguments; one call is one operation
+      macro -- boolean indicating a slow, end-to-end benchmark
+
+    """
+
+    def __init__(self, name, group, func, macro=False):
+        self.name = name
+        self.group = group
+        self.func = func
+        self.macro = macro
+
+    def _batch(self, loops):
+        func = self.func
+        start = time.perf_counter()
+        for i in range(loops):
+            func()
+        return time.perf_counter() - start
+
+    def time(self, mintime=0.2, repeat=3):
+        """Return (seconds per op, ops per batch) as best of repeat batches."""
+        random.seed(seed)
+        self.func()   # warm up any lazy tables, samples, or caches
+        random.seed(seed)
+        loops = 1
+        while True:   # calibrate
+            elapsed = self._batch(loops)
+            if elapsed >= mintime / 4 or loops >= 10**6:
+                break
+            loops *= 2 if elapsed == 0 else max(2, int(mintime / 4 / elapsed))
+        random.seed(seed)
+        gcold = gc.isenabled()
+        gc.disable()
+        try:
+            best = min(self._batch(loops) for i in range(repeat))
+        finally:
+            if gcold:
+                gc.enable()
+        return (best / loops, loops)
+
+    def allocations(self, loops=None):
+        """Return (bytes allocated per op, peak bytes for one op)."""
+        loops = loops or (5 if self.macro else 50)
+        random.seed(seed)
+        self.func()   # warm up any lazy tables or imports
+        tracemalloc.start()
+        try:
+            total = peak = 0
+            for i in range(loops):
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                self.func()
+                current, highest = tracemalloc.get_traced_memory()
+                total += highest - before
+                peak = max(peak, highest - before)
+        finally:
+            tracemalloc.stop()
+        return (total / loops, peak)
+
+
+def benchmark(name, group='misc', macro=False):
+    """Decorator registering a function of no arguments as a Benchmark."""
+    def register(func):
+        registry.append(Benchmark(name, group, func, macro))
+        return func
+    return register
+
+
+def select(patterns=None, macro=True):
+    """Return registered benchmarks whose name or group contains a pattern."""
+    chosen = []
+    for bench in registry:
+        if bench.macro and not macro:
+            continue
+        if patterns and not any(p in bench.name or p == bench.group
+                                for p in patterns):
+            continue
+        chosen.append(bench)
+    return chosen
+
+
+def _commit():
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return subprocess.check_output(['git', 'rev-parse', '--short',
+                                        'HEAD'], cwd=root,
+                                       stderr=subprocess.DEVNULL
+                                       ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(benchmarks, mintime=0.2, repeat=3, memory=True, progress=None):
+    """Run benchmarks; return results in the JSON layout (see report())."""
+    results = {}
+    for bench in benchmarks:
+        if progress is not None:
+            progress(bench.name)
+        (seconds, loops) = bench.time(mintime, repeat)
+        result = {'group' : bench.group, 'seconds' : seconds,
+                  'opspersec' : 1 / seconds if seconds else None,
+                  'loops' : loops}
+        if memory:
+            (result['bytesperop'], result['peakbytes']) = bench.allocations()
+        results[bench.name] = result
+    return {'meta' : {'commit' : _commit(), 'seed' : seed,
+                      'python' : platform.python_version(),
+                      'platform' : platform.platform(),
+                      'time' : time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'results' : results}
+
+
+def report(data, baseline=None):
+    """Return a printable table of results, compared to baseline if given."""
+    val = "%-34s %12s %12s %10s" % ('Benchmark', 'ops/sec', 'us/op', 'KB/op')
+    if baseline is not None:
+        val += " %8s" % 'change'
+    val += '\n'
+    for name, result in data['results'].items():
+        val += "%-34s %12.1f %12.2f" % (name, result['opspersec'] or 0,
+                                         result['seconds'] * 1e6)
+        if 'bytesperop' in result:
+            val += " %10.1f" % (result['bytesperop'] / 1024)
+        else:
+            val += " %10s" % '-'
+        if baseline is not None:
+            old = baseline['results'].get(name)
+            if old is not None and result['seconds']:
+                val += " %7.2fx" % (old['seconds'] / result['seconds'])
+            else:
+                val += " %8s" % 'new'
+        val += '\n'
+    return val
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(data, path):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+
+
+def main(args=None):
+    """Command line: [--quick] [--no-memory] [--json OUT] [--compare OLD]
+    [--micro] [pattern ...]"""
+    import argparse
+    import benchmarks.micro, benchmarks.macro   # register everything
+    parser = argparse.ArgumentParser(description="Run elvenfire benchmarks")
+    parser.add_argument('patterns', nargs='*',
+                        help="only benchmarks whose name contains a pattern"
+                             " or whose group matches one")
+    parser.add_argument('--json', help="write results to this file")
+    parser.add_argument('--compare', help="compare against this JSON file")
+    parser.add_argument('--micro', action='store_true',
+                        help="skip the slow end-to-end benchmarks")
+    parser.add_argument('--quick', action='store_true',
+                        help="shorter timing runs (less stable)")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="skip the tracemalloc allocation pass")
+    options = parser.parse_args(args)
+
+    chosen = select(options.patterns, macro=not options.micro)
+    mintime = 0.05 if options.quick else 0.2
+    progress = lambda name: print("  %s..." % name, file=sys.stderr)
+    data = run(chosen, mintime, 1 if options.quick else 3,
+               not options.no_memory, progress)
+    baseline = load(options.compare) if options.compare else None
+    print(report(data, baseline), end='')
+    if options.json:
+        save(data, options.json)
@@ -1,5 +1,6 @@
 __version__ = '1.1.0'
 
+import bisect
 import random
 
 class ELFError (Exception):
@@ -36,7 +37,11 @@ def bonus5(level=1):
     weighted than a higher level.
 
     """
-    roll = random.randint(1, 20)
+    return _bonus5result(random.randint(1, 20), level)
+
+
+def _bonus5result(roll, level):
+    """Return the Bonus5 result for a given d20 roll."""
     if roll <= level:
         return 5
     elif roll < (2 * level + 1):
@@ -49,6 +54,15 @@ def bonus5(level=1):
         return 1
 
 
+def bonus5odds(level=1):
+    """Return the exact odds of each Bonus5 result as {result : probability}."""
+    odds = {}
+    for roll in range(1, 21):
+        result = _bonus5result(roll, level)
+        odds[result] = odds.get(result, 0) + 1 / 20
+    return odds
+
+
 def bonus25(level=1):
     """Return the result of rolling the Bonus25 table (integer 1..25).
 
@@ -72,3 +86,117 @@ def bonus25(level=1):
     else:
         return random.randint(1, 8)
 
+
+def bonus25odds(level=1):
+    """Return the exact odds of each Bonus25 result as {result : probability}.
+
+    Mirrors the branches of bonus25(), one d10 roll at a time.
+
+    """
+    odds = {}
+    for roll in range(1, 11):
+        if roll == 1 and level > 1:
+            result = {25 : 1.0}
+        elif roll <= level:
+            result = dieodds(12, plus=12)
+        elif roll <= 1 + level + max(0, level-2):
+            result = dieodds(12, 2)
+        elif roll <= 3 + level + max(0, level-2):
+            result = dieodds(12, plus=4)
+        elif roll <= 5 + level:
+            result = dieodds(8, 2)
+        elif roll <= min(9, 7 + level):
+            result = dieodds(12)
+        else:
+            result = dieodds(8)
+        for value, chance in result.items():
+            odds[value] = odds.get(value, 0) + chance / 10
+    return odds
+
+
+def dieodds(sides, num=1, plus=0):
+    """Return the odds of rolling num dice of the given size, plus a constant.
+
+    dieodds(6, 2) = odds of 2d6, as {result : probability}
+
+    """
+    single = dict((i, 1 / sides) for i in range(1, sides + 1))
+    odds = {plus : 1.0}
+    for i in range(num):
+        odds = convolve(odds, single)
+    return odds
+
+
+def convolve(*oddslist):
+    """Return the odds of the sum of independent results.
+
+    Each argument is a {result : probability} mapping; the return value is a
+    mapping of the same form for the total.
+
+    """
+    total = {0 : 1.0}
+    for odds in oddslist:
+        combined = {}
+        for a, pa in total.items():
+            for b, pb in odds.items():
+                combined[a + b] = combined.get(a + b, 0) + pa * pb
+        total = combined
+    return total
+
+
+class OddsTable:
+
+    """A table of results, sampled by looking up a single random() draw.
+
+    pairs is a sequence of (result, probability); the first result is given
+    to the lowest draws, and so on, so a table can reproduce (draw for draw)
+    any formula that is monotonic in random().  Probabilities should total 1.
+
+      OddsTable(sorted(dieodds(6, 2).items())).sample()  # 2d6
+
+    Attributes:
+      results -- the possible results, in order
+      bounds  -- cumulative probability after each result (the last is 1)
+      odds    -- {result : probability}
+
+    """
+
+    def __init__(self, pairs):
+        self.results = []
+        self.odds = {}
+        self.bounds = []
+        total = 0
+        for result, chance in pairs:
+            if chance <= 0:
+                continue
+            total += chance
+            self.results.append(result)
+            self.bounds.append(total)
+            self.odds[result] = self.odds.get(result, 0) + chance
+        self.bounds[-1] = 1.0   # absorb rounding; random() is below 1
+
+    def sample(self):
+        """Return one random result."""
+        return self.results[bisect.bisect_right(self.bounds, random.random())]
+
+    def samples(self, count):
+        """Return a list of count random results."""
+        (results, bounds) = (self.results, self.bounds)
+        (find, draw) = (bisect.bisect_right, random.random)
+        return [results[find(bounds, draw())] for i in range(count)]
+
+
+########## Lazy Submodules ##########
+
+# Nothing below elvenfire is imported until it is first used, so that short
+# lived processes only pay for the tables they need:
+#   import elvenfire; elvenfire.streams.iter_rooms(1)
+_submodules = ['abilities', 'artifacts', 'creatures', 'labyrinth', 'mundane',
+               'utilities', 'streams', 'aio', 'tables', 'instrument',
+               'storemanager', 'export']
+
+def __getattr__(name):
+    if name in _submodules:
+        import importlib
+        return importlib.import_module('%s.%s' % (__name__, name))
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -0,0 +1,6 @@
+import sys
+
+from elvenfire.cli import main
+
+
+sys.exit(main())
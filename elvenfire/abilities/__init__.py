@@ -29,14 +29,14 @@ class _Ability:
         self.name = name
         if self.name is None:
             self._randomize()
-        elif 'typelist' in dir(self):
+        elif hasattr(self, 'typelist'):
             if self.name not in self.typelist:
                 raise AbilityError("Invalid ability name '%s'" % self.name)
         self._lookup()
 
     def _randomize(self):
         """Set self.name to a random ability."""
-        if 'typelist' in dir(self):
+        if hasattr(self, 'typelist'):
             self.name = random.choice(self.typelist)
         else:
             raise NotImplementedError()
@@ -51,7 +51,7 @@ class _Ability:
 
     def description(self):
         """Return a long-hand description of the ability."""
-        if 'desc' in dir(self):
+        if hasattr(self, 'desc'):
             return self.desc
         return str(self)
 
@@ -91,10 +91,22 @@ class _Ability:
                               on the same item/character?
           worsethan(other) -- given that other is a duplicate of this Ability,
                               is other "better"?
+          duplicatekeys()  -- hashable keys, such that two duplicates always
+                              share at least one key (used for indexing)
 
         """
         return self.name == other.name
 
+    def duplicatekeys(self):
+        """Return a tuple of keys shared by any duplicate of this Ability.
+
+        Abilities with no key in common are never duplicates; abilities with
+        a key in common may or may not be (check with duplicate()).  This lets
+        a long list of abilities be searched for duplicates by key.
+
+        """
+        return (self.name,)
+
     def worsethan(self, other):
         """Return boolean indicating if other is "better" than self.
 
@@ -0,0 +1,116 @@
+from elvenfire.abilities import AbilityError
+from elvenfire.abilities.charabilities import (PhysicalAbility,
+                                               MentalAbilityWithOpposites)
+from elvenfire.abilities.itemabilities import (AttributeAbility, AmuletAbility,
+                                               WeaponAbility)
+
+
+"""Precomputed Ability Costs (AC) of every ability an artifact may carry.
+
+Each family of abilities is tabled in full, the first time it is asked for,
+by building every ability it has once; the ability classes remain the only
+source of truth.  Prices can then be looked up without building abilities:
+
+  from elvenfire.abilities import costs
+  costs.AC('Mental', 'Speed [+ Slow]', 3)          # by name, IIQ, element
+  costs.AC('Amulet', 'Proof', element='Cold')
+  costs.namedAC('Attribute', 'DX+2')               # by str(ability)
+
+  from elvenfire.artifacts.values import appraise
+  appraise('Ring', [costs.namedAC('Mental', name) for name in names])
+
+A table is keyed by (name, level, element):
+
+  family      name                    level            element
+  Physical    ability (e.g. 'Sword')  IIQ              element or language
+  Mental      ability or pair         IIQ              element
+  Attribute   attribute (e.g. 'DX')   size             None
+  Amulet      type (e.g. 'Proof')     Skepticism size  element or attribute
+  Weapon      type (e.g. 'Animated')  range or size    None
+
+with None where a level or element does not apply.  An IIQ above an
+ability's maximum costs what the maximum does, as it would when built.
+Enhanced weapon abilities cost what a Ring of their abilities is worth, so
+are not tabled; appraise() prices them from their abilities' ACs.
+
+"""
+
+
+families = {'Physical' : PhysicalAbility,
+            'Mental' : MentalAbilityWithOpposites,
+            'Attribute' : AttributeAbility,
+            'Amulet' : AmuletAbility,
+            'Weapon' : WeaponAbility}
+
+_tables = {}   # {family : {(name, level, element) : AC}}
+_named = {}    # {family : {str(ability) : AC}}
+
+
+def _abilities(family):
+    """Yield ((name, level, element), ability) for every ability in family."""
+    cls = families[family]
+    if family in ('Physical', 'Mental'):
+        for name in cls.abilities:
+            for IIQ in range(1, 6):
+                for element in cls.elements.get(name) or [None]:
+                    yield (name, IIQ, element), cls(name, IIQ, element)
+    elif family == 'Attribute':
+        for attr in cls.attributeAC:
+            for size in range(1, 6):
+                yield (attr, size, None), cls(attr, size)
+    elif family == 'Amulet':
+        for type in cls.typelist:
+            if type == 'Proof':
+                for element in cls.elements:
+                    yield (type, None, element), cls(type, element=element)
+            elif type == 'Attribute':
+                for attr in cls.attributes:
+                    yield (type, None, attr), cls(type, attr=attr)
+            elif type == 'Skepticism':
+                for size in range(1, 6):
+                    yield (type, size, None), cls(type, size=size)
+            else:
+                yield (type, None, None), cls(type)
+    else:
+        for type in cls.typelist:
+            if type == 'Animated':
+                for range_ in range(1, 6):
+                    yield (type, range_, None), cls(type, range=range_)
+            elif type == 'Defender':
+                for size in range(1, 6):
+                    yield (type, size, None), cls(type, size=size)
+            elif type != 'Enhanced':
+                yield (type, None, None), cls(type)
+
+
+def table(family):
+    """Return {(name, level, element) : AC} for a family of abilities."""
+    if family not in _tables:
+        if family not in families:
+            raise AbilityError("Unknown family of abilities '%s'" % family)
+        keyed = {}
+        named = {}
+        for key, ability in _abilities(family):
+            keyed[key] = ability.AC
+            named[str(ability)] = ability.AC
+        _tables[family] = keyed
+        _named[family] = named
+    return _tables[family]
+
+
+def AC(family, name, level=None, element=None):
+    """Return the AC of an ability, by name, level and element (see above)."""
+    try:
+        return table(family)[name, level, element]
+    except KeyError:
+        raise AbilityError("No %s ability %s" %
+                           (family, (name, level, element)))
+
+
+def namedAC(family, name):
+    """Return the AC of an ability, by its full name (e.g. 'Speed 3')."""
+    table(family)
+    try:
+        return _named[family][name]
+    except KeyError:
+        raise AbilityError("No %s ability '%s'" % (family, name))
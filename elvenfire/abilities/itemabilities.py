@@ -1,6 +1,5 @@
 
 import random
-import re
 
 from elvenfire import bonus5
 from elvenfire.abilities import AbilityError, _Ability
@@ -26,8 +25,18 @@ class AttributeAbility (_Ability):
       self.size   -- amount added to attribute (1..5)
       self.listAC -- tuple containing the AC at each size, in 1000s
 
+    Class Attributes:
+      attributeAC -- {attr : listAC} for every attribute
+
     """
 
+    attributeAC = {'ST' : (2, 4, 7, 15, 25),
+                   'DX' : (2, 4, 7, 15, 25),
+                   'IQ' : (1, 2, 3.5, 7, 15),
+                   'MA' : (1, 2, 3, 6, 12),
+                   'Dam' : (1, 2, 3.5, 7, 15),
+                   'Hit' : (1, 2.5, 5, 10, 18)}
+
     def __init__(self, attr=('ST', 'DX', 'IQ', 'MA'), size=None):
         """Initialize the AttributeAbility.
 
@@ -39,7 +48,7 @@ class AttributeAbility (_Ability):
         """
         if isinstance(attr, str):
             self.attr = attr
-        elif '__iter__' in dir(attr):
+        elif hasattr(attr, '__iter__'):
             self.attr = random.choice(attr)
         else:
             raise AbilityError("Invalid attribute list specification: %s" %
@@ -68,15 +77,9 @@ class AttributeAbility (_Ability):
 
     def _lookupAC(self):
         """Determine self.listAC tuple based on attribute type."""
-        map = {'ST' : (2, 4, 7, 15, 25),
-               'DX' : (2, 4, 7, 15, 25),
-               'IQ' : (1, 2, 3.5, 7, 15),
-               'MA' : (1, 2, 3, 6, 12),
-               'Dam' : (1, 2, 3.5, 7, 15),
-               'Hit' : (1, 2.5, 5, 10, 18)}
-        if self.attr not in map:
+        if self.attr not in self.attributeAC:
             raise AbilityError("Unrecognized attr '%s'" % self.attr)
-        self.listAC = map[self.attr]
+        self.listAC = self.attributeAC[self.attr]
 
     def _computeAC(self):
         """Determine self.AC based on self.size and self.listAC."""
@@ -90,6 +93,9 @@ class AttributeAbility (_Ability):
             return self.attr == other.attr
         return False
 
+    def duplicatekeys(self):
+        return (self.attr,)
+
     def worsethan(self, other):
         """Return boolean indicating if other is a larger bonus."""
         return other.size > self.size
@@ -119,6 +125,20 @@ class AmuletAbility (_Ability):
 
     attributes = ['ST', 'DX', 'IQ']
 
+    # AC of each type (by element, or by Skepticism size, where it varies)
+    typeAC = {'Control NPC' : 10000,
+              'Control Trainable Riding Animal' : 2000,
+              'Control Trainable Non-Riding Animal' : 2000,
+              'Control Non-Trainable Mammal' : 3000,
+              'Control Non-Trainable Reptile' : 3000,
+              'Control Non-Trainable Insect' : 3000,
+              'Control Dragon' : 25000,
+              'Control Elemental' : 5000,
+              'Proof' : {'Fire' : 2000, 'Water' : 2000, 'Cold' : 4000,
+                         'Lightning' : 2000},
+              'Attribute' : 5000,
+              'Skepticism' : (100, 250, 1000, 2000, 5000)}
+
     def __init__(self, type=None, element=None, attr=None, size=None):
         """Initialize the AmuletAbility.
 
@@ -148,19 +168,10 @@ class AmuletAbility (_Ability):
         """Define self.desc and self.AC based on self.name."""
         self.type = self.name  # name will be updated with element/size
         if self.name.startswith('Control'):
-            if self.name.endswith('NPC'):
-                self.AC = 10000
-            elif self.name.endswith('Dragon'):
-                self.AC = 25000
-            elif self.name.endswith('Elemental'):
-                self.AC = 5000
-            elif self.name.startswith('Control Trainable'):
-                self.AC = 2000
-            elif self.name.startswith('Control Non-Trainable'):
-                self.AC = 3000
-            else:
+            if self.name not in self.typeAC:
                 raise AbilityError('Unknown type of control amulet: %s' %
                                    self.name)
+            self.AC = self.typeAC[self.name]
             self.desc = "When encountered, if creature fails 3vIQ," + \
                         " amulet holder controls the creature totally."
         elif self.name == 'Proof':
@@ -170,10 +181,7 @@ class AmuletAbility (_Ability):
                 raise AbilityError("Invalid amulet Proof element: '%s'" % 
                                    self.element)
             self.name += ': %s' % self.element
-            if self.element == 'Cold':
-                self.AC = 4000
-            else:
-                self.AC = 2000
+            self.AC = self.typeAC['Proof'][self.element]
             self.desc = "Makes wearer immune to damage by " + \
                         self.element.lower() + '.'
             if self.element == 'Water':
@@ -187,7 +195,7 @@ class AmuletAbility (_Ability):
                 raise AbilityError('Unknown amulet attribute: %s' % 
                                    self.attribute)
             self.name = "%s+1" % self.attribute
-            self.AC = 5000
+            self.AC = self.typeAC['Attribute']
             self.desc = "Increases %s by 1 while worn." % self.attribute
             if self.attribute == 'IQ':
                 self.desc += '  Does not allow learning of new abilities.'
@@ -197,7 +205,7 @@ class AmuletAbility (_Ability):
             elif not (isinstance(self.size, int) and 1 <= self.size <= 5):
                 raise AbilityError('Invalid Skepticism size: %s' % self.size)
             self.name += ' +%s' % self.size
-            self.AC = (100, 250, 1000, 2000, 5000)[self.size-1]
+            self.AC = self.typeAC['Skepticism'][self.size-1]
             self.desc = 'Adjust roll by %s for each attempt to disbelieve.' \
                         % self.size
         else:
@@ -223,14 +231,19 @@ class AmuletAbility (_Ability):
         """
         if not isinstance(other, AmuletAbility):
             return False
-        if (re.match('Skepticism', self.name) and 
-            re.match('Skepticism', other.name)):
+        if (self.name.startswith('Skepticism') and
+            other.name.startswith('Skepticism')):
             return True
         return self.name == other.name
 
+    def duplicatekeys(self):
+        if self.name.startswith('Skepticism'):
+            return ('Skepticism',)
+        return (self.name,)
+
     def worsethan(self, other):
         """Return indicating if other is a larger Skepticism bonus."""
-        if re.match('Skepticism', self.name):
+        if self.name.startswith('Skepticism'):
             return other.size > self.size
         return False  # otherwise, they are identical
 
@@ -243,6 +256,16 @@ class WeaponAbility(_Ability):
                 'EverPoisoned', 'AutoPoisoned', 'Flaming', 'Frosted',
                 'Guided', 'Replenisher']
 
+    # AC of each type (by range or size, where it varies); Changling is
+    # priced with the whole weapon, and Enhanced as a ring of its abilities
+    typeAC = {'Animated' : (20000, 22000, 25000, 30000, 40000),
+              'Changling' : 0,
+              'Defender' : (2000, 4000, 7000, 15000, 25000),
+              'Electrified' : 10000, 'EverPoisoned' : 10000,
+              'AutoPoisoned' : 10000, 'Flaming' : 10000, 'Frosted' : 10000,
+              'Guided' : 12000,
+              'Replenisher' : 2000}
+
     def __init__(self, type=None, range=None, size=None, abilities=None):
         """Initialize the WeaponAbility.
 
@@ -282,12 +305,12 @@ class WeaponAbility(_Ability):
                 raise AbilityError("Invalid Animated weapon range: %s" %
                                    self.range)
             self.name += ' (%s MH)' % self.range
-            self.AC = 1000 * (20, 22, 25, 30, 40)[self.range-1]
+            self.AC = self.typeAC['Animated'][self.range-1]
             self.desc = 'User can control weapon up to %s MH away' % self.range
             self.desc += ' Target is engaged; owner is not.'
 
         elif self.type == 'Changling':
-            self.AC = 0  # calculated after both weapons determined
+            self.AC = self.typeAC['Changling']  # see Weapon._handlespecials
             self.desc = "Transforms between missile and melee weapon types" + \
                         " on bearer's command, even between rounds."
             self.desc += '  As a missile weapon, acts as a Replenisher.'
@@ -299,17 +322,17 @@ class WeaponAbility(_Ability):
                 raise AbilityError("Invalid Defender weapon size: %s" %
                                    self.size)
             self.name += ' (DX-%s)' % self.size
-            self.AC = 1000 * (2, 4, 7, 15, 25)[self.size-1]
+            self.AC = self.typeAC['Defender'][self.size-1]
             self.desc = "Holding weapon subtracts %s" % self.size + \
                         " from attacker's DX"
 
         elif self.type == 'Guided':
-            self.AC = 12000
+            self.AC = self.typeAC['Guided']
             self.desc = 'Can follow any course desired, flying around' + \
                         ' obstacles and friends to its full range.'
 
         elif self.type == 'Replenisher':
-            self.AC = 2000
+            self.AC = self.typeAC['Replenisher']
             self.desc = "Once the weapon completes its flight, it" + \
                         " reappears in the owner's hand, ready for reuse."
 
@@ -332,7 +355,7 @@ class WeaponAbility(_Ability):
                         ' just like a ring.'
 
         else:  # Electrified, Flaming, etc
-            self.AC = 10000
+            self.AC = self.typeAC[self.type]
             if self.type == 'AutoPoisoned':
                 self.desc = 'Can be preloaded with up to 12 weapon poisons.'
                 self.desc += ' Wielder can invoke any loaded poison just\n' + \
@@ -352,6 +375,9 @@ class WeaponAbility(_Ability):
             return self.type == other.type
         return False
 
+    def duplicatekeys(self):
+        return (self.type,)
+
     def worsethan(self, other):
         """Return boolean indicating if other has a stronger ability.
 
@@ -0,0 +1,209 @@
+import asyncio
+import time
+
+from elvenfire import ELFError
+from elvenfire.streams import newartifact, newcreature, artifactkinds
+
+
+"""Asyncio front end for room, party, and treasure generation.
+
+Generating a room (particularly a high-level room full of characters) is
+CPU-bound and can take long enough to stall an event loop.  A Generator runs
+the work in an executor instead:
+
+  gen = Generator(ProcessPoolExecutor())
+  room = await gen.room(level, number, timeout=0.5)
+
+Small requests made at about the same time are collected into one batch, so
+that each trip to the executor (and, for a process pool, each round of
+pickling) carries several results.  Each request may be given a time budget;
+a request that runs out of time raises GenerationTimeout, and if its batch
+has not yet started in the executor by then it is skipped rather than run.
+
+The module-level functions room(), party(), artifact() and creature() use a
+shared Generator on the loop's default (thread) executor; configure() sets
+its executor and batching options.
+
+"""
+
+
+class GenerationTimeout (ELFError):
+    pass
+
+
+## Work done in the executor ##
+
+def _room(level, number, difficulty, roomclass):
+    if roomclass is None:
+        from elvenfire.labyrinth.rooms import Room as roomclass
+    return roomclass(level, number, difficulty)
+
+
+def _party(creaturetype, level, maxCP):
+    from elvenfire.labyrinth.parties import partyclasses
+    return partyclasses[creaturetype](level, maxCP)
+
+
+def _artifact(kind):
+    if kind is None:
+        import random
+        kind = random.choice(artifactkinds)
+    return newartifact(kind)
+
+
+def _creature(kind, level):
+    if kind is None:
+        from elvenfire.labyrinth.rooms import Room
+        kind = Room.__new__(Room).randomcreaturetype(level)
+    return newcreature(kind, level)
+
+
+jobs = {'room' : _room, 'party' : _party,
+        'artifact' : _artifact, 'creature' : _creature}
+
+
+def _runbatch(batch):
+    """Run each (job, args, deadline) in batch; return [(ok, result), ...].
+
+    This runs inside the executor, so it must stay a picklable module-level
+    function.  Deadlines are wall-clock times, so that they mean the same
+    thing in a worker process.
+
+    """
+    results = []
+    for job, args, deadline in batch:
+        if deadline is not None and time.time() > deadline:
+            results.append((False, GenerationTimeout("Out of time for %s"
+                                                     % job)))
+            continue
+        try:
+            results.append((True, jobs[job](*args)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+
+## Event loop side ##
+
+class Generator:
+
+    """Generates rooms, parties, artifacts and creatures off the event loop.
+
+    Attributes:
+      executor   -- concurrent.futures executor for the work (None for the
+                    loop's default thread pool)
+      batchsize  -- most requests sent to the executor at once
+      batchdelay -- seconds to wait for more requests before sending a batch
+      timeout    -- default time budget per request, in seconds (None for
+                    no limit)
+
+    With a thread pool, all workers share the global random module, so
+    results are random but not reproducible; use streams.py for that.
+
+    """
+
+    def __init__(self, executor=None, batchsize=8, batchdelay=0.001,
+                 timeout=None):
+        self.executor = executor
+        self.batchsize = batchsize
+        self.batchdelay = batchdelay
+        self.timeout = timeout
+        self._pending = []
+        self._flusher = None
+
+    async def room(self, level, number=1, difficulty=2, roomclass=None,
+                   timeout=None):
+        """Return a new Room (or roomclass)."""
+        return await self._submit('room', (level, number, difficulty,
+                                           roomclass), timeout)
+
+    async def party(self, creaturetype, level, maxCP, timeout=None):
+        """Return a new party; creaturetype is as for Room.creatures."""
+        return await self._submit('party', (creaturetype, level, maxCP),
+                                  timeout)
+
+    async def artifact(self, kind=None, timeout=None):
+        """Return a new artifact of the given kind (see streams.py)."""
+        return await self._submit('artifact', (kind,), timeout)
+
+    async def creature(self, kind=None, level=1, timeout=None):
+        """Return a new creature of the given kind (see streams.py)."""
+        return await self._submit('creature', (kind, level), timeout)
+
+    async def treasure(self, count, kind=None, timeout=None):
+        """Return a list of count new artifacts, generated concurrently."""
+        return list(await asyncio.gather(*[self.artifact(kind, timeout)
+                                           for i in range(count)]))
+
+    async def _submit(self, job, args, timeout):
+        if timeout is None:
+            timeout = self.timeout
+        deadline = time.time() + timeout if timeout is not None else None
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((job, args, deadline, future))
+        if len(self._pending) >= self.batchsize:
+            self._flush(loop)
+        elif self._flusher is None:
+            self._flusher = loop.call_later(self.batchdelay, self._flush, loop)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise GenerationTimeout("%s took longer than %ss" % (job, timeout))
+
+    def _flush(self, loop):
+        """Send all pending requests to the executor as one batch."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        batch = [entry for entry in self._pending if not entry[3].done()]
+        self._pending = []
+        if not batch:
+            return
+        work = [(job, args, deadline) for job, args, deadline, f in batch]
+        done = loop.run_in_executor(self.executor, _runbatch, work)
+        done.add_done_callback(lambda d: self._deliver(batch, d))
+
+    def _deliver(self, batch, done):
+        """Hand each result in a finished batch to its waiting request."""
+        futures = [entry[3] for entry in batch]
+        if done.cancelled() or done.exception() is not None:
+            error = GenerationTimeout("Batch cancelled") if done.cancelled() \
+                    else done.exception()
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for future, (ok, result) in zip(futures, done.result()):
+            if future.done():  # timed out or cancelled while waiting
+                continue
+            if ok:
+                future.set_result(result)
+            else:
+                future.set_exception(result)
+
+
+_default = Generator()
+
+
+def configure(executor=None, batchsize=8, batchdelay=0.001, timeout=None):
+    """Replace the shared Generator used by the module-level functions."""
+    global _default
+    _default = Generator(executor, batchsize, batchdelay, timeout)
+    return _default
+
+
+async def room(level, number=1, difficulty=2, roomclass=None, timeout=None):
+    return await _default.room(level, number, difficulty, roomclass, timeout)
+
+
+async def party(creaturetype, level, maxCP, timeout=None):
+    return await _default.party(creaturetype, level, maxCP, timeout)
+
+
+async def artifact(kind=None, timeout=None):
+    return await _default.artifact(kind, timeout)
+
+
+async def creature(kind=None, level=1, timeout=None):
+    return await _default.creature(kind, level, timeout)
@@ -1,8 +1,10 @@
+import heapq
 import random
 
 from elvenfire import ELFError, bonus5
 from elvenfire.abilities import _Ability
 from elvenfire.mundane import ItemError
+from elvenfire.instrument import tally
 
 __all__ = ['special', 'combat', 'greater', 'lesser', 'written', 'potion']
 
@@ -10,6 +12,9 @@ class ArtifactError (ItemError):
     pass
 
 
+registry = {}   # {itemtype : artifact class}, filled as classes are defined
+
+
 class _Artifact:
 
     """Abstract class: an artifact with one or more abilities.
@@ -19,7 +24,9 @@ class _Artifact:
       self.desc     -- (optional)long-hand description of artifact, including
                        usage information as applicable
       self.value    -- fair market value of artifact
-      self.itemtype -- class name (sans packages and any 'StockItem' suffix)
+      self.itemtype -- class name (sans packages and any 'StockItem' suffix);
+                       set on each class as it is defined, though some
+                       artifacts (e.g. Weapons) override it per instance
 
     Note that these attributes are chosen to align with the _StockItem
     class from elvenfire.storemanager.stockitems for multiple inheritance.
@@ -31,15 +38,24 @@ class _Artifact:
 
     """
 
+    def __init_subclass__(cls, **kwargs):
+        """Set cls.itemtype and register cls, unless it is abstract."""
+        super().__init_subclass__(**kwargs)
+        if 'itemtype' not in cls.__dict__:
+            cls.itemtype = cls.__name__  # Weapon
+            if cls.itemtype.endswith('StockItem'):
+                cls.itemtype = cls.itemtype[:-9]
+        if not cls.__name__.startswith('_'):
+            registry.setdefault(cls.itemtype, cls)  # artifact before StockItem
+
     def __init__(self, name=None):
-        self._setitemtype()
         self.name = name
         if self.name is None:
             self._randomize()
         self._lookup()
 
     def _randomize(self):
-        if 'typelist' in dir(self):
+        if hasattr(self, 'typelist'):
             self.name = random.choice(self.typelist)
         else:
             raise NotImplementedError()
@@ -47,21 +63,11 @@ class _Artifact:
     def _lookup(self):
         raise NotImplementedError()
 
-    def _setitemtype(self):
-        if 'itemtype' in dir(self):
-            return
-        itemtype = str(type(self))  # <class 'Something.Weapon'>
-        i1 = itemtype.rfind('.')
-        i2 = itemtype.find("'", i1)
-        self.itemtype = itemtype[i1+1:i2]  # Weapon
-        if self.itemtype.endswith('StockItem'):
-            self.itemtype = self.itemtype[:-9]
-
     def __str__(self):
         return self.name
 
     def description(self):
-        if 'desc' in dir(self):
+        if hasattr(self, 'desc'):
             return self.desc
         return ''
 
@@ -109,11 +115,19 @@ class _MultiAbilityArtifact (_Artifact):
     def _randomize(self):
         if self.abilities is None:
             self.abilities = []
+            present = set()  # every ability so far, for exact matches
+            similar = {}     # {duplicate key : [abilities]}
+            positions = {}   # {id(ability) : index in self.abilities}
             num = self._numabilities()
             for i in range(num):
-                abil = self.__newability()  # will remove duplicates
-                if abil is not None:
+                abil = self.__newability(present, similar, positions)
+                if abil is not None:  # no duplicates
+                    positions[id(abil)] = len(self.abilities)
                     self.abilities.append(abil)
+                    present.add(abil)
+                    if not self.allowduplicates:
+                        for key in abil.duplicatekeys():
+                            similar.setdefault(key, []).append(abil)
         else:
             if not (1 <= len(self.abilities) <= self.maxabilities):
                 raise ArtifactError('Invalid number of abilities: %s' %
@@ -123,20 +137,59 @@ class _MultiAbilityArtifact (_Artifact):
                     raise ArtifactError('Invalid ability: %s' % ability)
         self._setname()
 
-    def __newability(self, count=0):
-        """Wrapper for _newability() method; removes duplicate abilities."""
-        if count > 250:
-            raise ArtifactError('Cannot add new ability to %s (%s)' % 
-                                (self.itemtype, map(str, self.abilities)))
-        ability = self._newability()
-        if ability in self.abilities:
-            return self.__newability(count+1)  # recurse; try again
-        if not self.allowduplicates:  # duplicates are same name, diff IIQ
-            for a in self.abilities:
-                if a.duplicate(ability) and a.worsethan(ability):
-                    self.abilities[self.abilities.index(a)] = ability  # replace
-                    return self.__newability(count)
-        return ability
+    def __newability(self, present, similar, positions):
+        """Wrapper for _newability() method; removes duplicate abilities.
+
+        present, similar, and positions index self.abilities (see
+        _randomize()), so that each candidate is checked in constant time.
+        A candidate identical to an existing ability is redrawn (at most 250
+        times); one that betters a duplicate replaces it, and then a new
+        ability is drawn.
+
+        """
+        rejects = 0
+        with tally('_MultiAbilityArtifact.__newability') as attempt:
+            while True:
+                ability = self._newability()
+                if ability in present:
+                    rejects += 1
+                    if rejects > 250:
+                        raise ArtifactError('Cannot add new ability to %s (%s)'
+                                            % (self.itemtype,
+                                               list(map(str, self.abilities))))
+                    attempt.reject()
+                    continue
+                if not self.allowduplicates:  # same name, different IIQ
+                    worse = self.__worseduplicate(ability, similar, positions)
+                    if worse is not None:
+                        self.__replace(worse, ability, present, similar,
+                                       positions)
+                        attempt.accept()
+                        continue
+                return ability
+
+    def __worseduplicate(self, ability, similar, positions):
+        """Return the first ability that ability duplicates and betters."""
+        candidates = {id(a) : a for key in ability.duplicatekeys()
+                                for a in similar.get(key, ())}
+        worse = [a for a in candidates.values()
+                 if a.duplicate(ability) and a.worsethan(ability)]
+        if worse:  # the first in self.abilities is replaced
+            return min(worse, key=lambda a: positions[id(a)])
+        return None
+
+    def __replace(self, old, new, present, similar, positions):
+        """Replace ability old with new, in self.abilities and its indexes."""
+        i = positions.pop(id(old))
+        self.abilities[i] = new
+        positions[id(new)] = i
+        present.discard(old)
+        present.add(new)
+        for key in old.duplicatekeys():
+            bucket = similar[key]
+            del bucket[[id(a) for a in bucket].index(id(old))]
+        for key in new.duplicatekeys():
+            similar.setdefault(key, []).append(new)
 
     def _setname(self):
         """Build self.name from type(self) and self.abilities."""
@@ -150,13 +203,23 @@ class _MultiAbilityArtifact (_Artifact):
         """Set self.value to item's FMV, based on self.abilities"""
         self.abilities.sort()
         self.abilities.reverse()
-        self.value = 0
-        for ability, multiplier in zip(self.abilities, self.multipliers):
-            self.value += ability.AC * multiplier
-        self.value = int(self.value / self.valuedivisor)
+        self.value = self._appraise([ability.AC for ability in self.abilities])
+
+    def _appraise(self, ACs):
+        """Return the FMV of this item, were its abilities to cost ACs.
+
+        Only the highest len(multipliers) ACs are valued, so they are
+        picked out with a heap; the ACs need not be sorted, and need not
+        come from ability objects (see artifacts.values.appraise()).
+
+        """
+        top = heapq.nlargest(len(self.multipliers), ACs)
+        value = sum(AC * multiplier
+                    for AC, multiplier in zip(top, self.multipliers))
+        return int(value / self.valuedivisor)
 
     def description(self):
-        if 'desc' in dir(self):
+        if hasattr(self, 'desc'):
             val = self.desc
             if len(self.abilities) <= 3:
                 val += '\n\n'
@@ -178,5 +241,24 @@ class _MultiAbilityArtifact (_Artifact):
 
 
 
+def artifactclass(itemtype):
+    """Return the artifact class registered for itemtype (e.g. 'Book').
 
+    The artifact submodules are imported if the class is not yet known.
 
+    """
+    if itemtype not in registry:
+        import importlib
+        for module in __all__:
+            importlib.import_module('%s.%s' % (__name__, module))
+    if itemtype not in registry:
+        raise ArtifactError("Unknown artifact type '%s'" % itemtype)
+    return registry[itemtype]
+
+
+def __getattr__(name):
+    """Import artifact submodules (see __all__) on first use."""
+    if name in __all__:
+        import importlib
+        return importlib.import_module('%s.%s' % (__name__, name))
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
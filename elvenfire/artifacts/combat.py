@@ -1,5 +1,5 @@
+import copy
 import random
-import pickle
 
 from elvenfire import bonus5
 from elvenfire.mundane.weapons import MundaneWeapon
@@ -9,6 +9,14 @@ from elvenfire.abilities.itemabilities import AttributeAbility, WeaponAbility
 from elvenfire.abilities.charabilities import *
 
 
+def _special(abilities, type):
+    """Return the WeaponAbility of the given type in abilities, or None."""
+    for ability in abilities:
+        if isinstance(ability, WeaponAbility) and ability.type == type:
+            return ability
+    return None
+
+
 class Weapon (MundaneWeapon, _MultiAbilityArtifact):
 
     """A weapon, with one or more enhancements.
@@ -46,7 +54,7 @@ class Weapon (MundaneWeapon, _MultiAbilityArtifact):
                         self.specials += 1
 
     def __str__(self):
-        if 'abilities' in dir(self):
+        if hasattr(self, 'abilities'):
             return _MultiAbilityArtifact.__str__(self)
         else:
             return MundaneWeapon.__str__(self)
@@ -89,8 +97,8 @@ class Weapon (MundaneWeapon, _MultiAbilityArtifact):
         """Handle any necessary adjustments based on special abilities."""
 
         # Guided weapons must be distance weapons.
-        GUIDED = WeaponAbility('Guided')
-        if GUIDED in self.abilities and not self.isdistance():
+        guided = _special(self.abilities, 'Guided')
+        if guided is not None and not self.isdistance():
             if typeset and abilitiesset:
                 raise ArtifactError("Cannot comply with both type/style" +
                                     " and ability requirements.")
@@ -98,23 +106,24 @@ class Weapon (MundaneWeapon, _MultiAbilityArtifact):
                 newstyle = random.choice(('Missile Weapon', 'Thrown Weapon'))
                 self._setweapontype(newstyle)
             else:  # not abilitiesset
-                self.abilities.remove(GUIDED)
-                replacement = WeaponAbility()
-                while (replacement == GUIDED or
-                       replacement in self.abilities):
-                    replacement = WeaponAbility()
-                self.abilities.append(replacement)
+                self.abilities.remove(guided)
+                present = [a.type for a in self.abilities
+                           if isinstance(a, WeaponAbility)]
+                types = [t for t in WeaponAbility.typelist
+                         if t != 'Guided' and t not in present]
+                self.abilities.append(WeaponAbility(random.choice(types)))
             _MultiAbilityArtifact._setname(self)
 
         # Changlings are two weapons in one, with two separate ability sets
-        CHANGLING = WeaponAbility('Changling')
+        changling = _special(self.abilities, 'Changling')
         self.changling = False
-        if not secondary and CHANGLING in self.abilities:
+        if not secondary and changling is not None:
 
-            # What we have so far becomes the primary
-            self.primaryweapon = Weapon(self.style, self.type,
-                                        abilities=list(self.abilities), 
-                                        secondary=True)
+            # What we have so far becomes the primary; it has already been
+            # drawn and checked, so copy it rather than building it again
+            self.primaryweapon = copy.copy(self)
+            self.primaryweapon.abilities = list(self.abilities)
+            self.primaryweapon._lookup()
 
             # And we roll a new set for the secondary...
             if secondaryweapon is not None:
@@ -131,8 +140,9 @@ class Weapon (MundaneWeapon, _MultiAbilityArtifact):
                 self.secondaryweapon = Weapon(style=newstyle, secondary=True)
 
             # ... which must also include Changling (so max four)
-            if CHANGLING in self.secondaryweapon.abilities:
-                self.secondaryweapon.abilities.remove(CHANGLING)
+            other = _special(self.secondaryweapon.abilities, 'Changling')
+            if other is not None:
+                self.secondaryweapon.abilities.remove(other)
             if len(self.secondaryweapon.abilities) == 5:
                 self.secondaryweapon.abilities = \
                     self.secondaryweapon.abilities[:4]
@@ -149,7 +159,7 @@ class Weapon (MundaneWeapon, _MultiAbilityArtifact):
 
             # Finally, remove 'Changling' from the primary's list
             # to clean up the display, and update.
-            self.primaryweapon.abilities.remove(CHANGLING)
+            self.primaryweapon.abilities.remove(changling)
             _MultiAbilityArtifact._setname(self.primaryweapon)
             self.changling = True
             _MultiAbilityArtifact._setname(self)
@@ -188,7 +198,7 @@ class Armor (MundaneArmor, _MultiAbilityArtifact):
             _MultiAbilityArtifact.__init__(self, abilities)
 
     def __str__(self):
-        if 'abilities' in dir(self):
+        if hasattr(self, 'abilities'):
             return _MultiAbilityArtifact.__str__(self)
         else:
             return MundaneArmor.__str__(self)
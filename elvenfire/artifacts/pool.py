@@ -0,0 +1,275 @@
+import bisect
+import collections
+import threading
+import time
+
+from elvenfire.artifacts import ArtifactError, artifactclass
+
+
+"""Pre-generated artifacts, refilled in the background, for fast requests.
+
+An ItemPool keeps a queue of finished artifacts for each item type, and
+optionally for each value band of each type.  A request is served from the
+queue when it can be (a hit) and generated on the spot when it cannot (a
+miss); a refill thread tops the queues up again in the meantime:
+
+  pool = ItemPool(size=32, bands=(100, 1000, 10000))
+  pool.start()
+  ring = pool.get('Ring')
+  cheap = pool.get('Weapon', band=0)      # value below 100
+  print(pool.stats())
+  pool.stop()
+
+Every pooled item is an ordinary, independently generated artifact, handed
+out once, so pooled items have the same distribution as new ones; an item
+from a band has the distribution of its type given that its value falls in
+the band.  Each new item goes to its type's own queue if that is short, or
+else to its band's queue; items with nowhere to go are discarded.
+
+Bands that hold less than minshare of a type's items are never generated
+for specifically (a Book worth over 10000 might take hundreds of tries), so
+they are filled only by items left over from other queues, and otherwise
+miss.
+
+The refill thread shares the global random module with the rest of the
+process, so pooled items are random but not reproducible.  Generation holds
+the GIL; give the pool a process executor to generate in other processes
+instead, leaving the thread only to wait for their results.
+
+"""
+
+
+kinds = ['Weapon', 'Armor', 'Ring', 'Amulet', 'Potion', 'Scroll', 'Book']
+
+
+def _generate(itemtype, count):
+    """Return count new artifacts of itemtype (run in an executor, maybe)."""
+    cls = artifactclass(itemtype)
+    return [cls() for i in range(count)]
+
+
+class ItemPool:
+
+    """Queues of pre-generated artifacts, by item type and value band.
+
+    Attributes:
+      kinds    -- item types kept (see artifactclass()); default kinds
+      size     -- items kept in each queue
+      bands    -- ascending value bounds: band i holds values from
+                  bands[i-1] up to (not including) bands[i]; () for none
+      batch    -- items generated per refill step
+      minshare -- smallest share of a type's items for which a band is
+                  refilled specifically (see above)
+      executor -- concurrent.futures executor to generate in (None to
+                  generate in the refill thread itself)
+      idle     -- seconds the refill thread sleeps when nothing is short
+
+    """
+
+    maxtries = 1000   # attempts at generating an item in a band, on a miss
+
+    def __init__(self, kinds=kinds, size=16, bands=(), batch=4,
+                 minshare=0.02, executor=None, idle=0.5):
+        self.kinds = list(kinds)
+        self.size = size
+        self.bands = sorted(bands)
+        self.batch = batch
+        self.minshare = minshare
+        self.executor = executor
+        self.idle = idle
+        self._queues = {}     # {(itemtype, band or None) : deque of items}
+        for itemtype in self.kinds:
+            artifactclass(itemtype)   # unknown types fail here, not later
+            for band in [None] + list(range(len(self.bands) + 1)):
+                self._queues[itemtype, band] = collections.deque()
+        self._seen = {}       # {(itemtype, band) : items generated}
+        self._short = {}      # {(itemtype, band) : time queue became short}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._stopping = False
+        self.clearstats()
+
+    def band(self, value):
+        """Return the band index for value."""
+        return bisect.bisect_right(self.bands, value)
+
+    def get(self, itemtype, band=None):
+        """Return an artifact of itemtype (and in band, if given)."""
+        try:
+            queue = self._queues[itemtype, band]
+        except KeyError:
+            raise ArtifactError("No %s queue for band %s in this pool"
+                                % (itemtype, band))
+        try:
+            item = queue.popleft()
+        except IndexError:
+            item = None
+        with self._lock:
+            if item is None:
+                self.misses[itemtype] += 1
+            else:
+                self.hits[itemtype] += 1
+            self._short.setdefault((itemtype, band), time.perf_counter())
+        self._wake.set()
+        if item is None:
+            item = self._make(itemtype, band)
+        return item
+
+    def _make(self, itemtype, band):
+        """Generate an item on the spot, keeping any from other bands."""
+        for i in range(self.maxtries):
+            item = self._file(_generate(itemtype, 1)[0], itemtype, band)
+            if item is not None:
+                return item
+        raise ArtifactError("No %s found in band %s after %d tries"
+                            % (itemtype, band, self.maxtries))
+
+    def _file(self, item, itemtype, want=-1):
+        """Queue a new item; return it instead if it is of the wanted band.
+
+        want is a band index, None for any band, or -1 to keep nothing.
+
+        """
+        band = self.band(item.value)
+        with self._lock:   # get() and _make() may run in other threads
+            key = (itemtype, band)
+            self._seen[key] = self._seen.get(key, 0) + 1
+            self.generated += 1
+            if want is None or want == band:
+                return item
+            for key in ((itemtype, None), (itemtype, band)):
+                queue = self._queues[key]
+                if len(queue) < self.size:
+                    queue.append(item)
+                    if len(queue) >= self.size and key in self._short:
+                        self._lag(time.perf_counter() - self._short.pop(key))
+                    return None
+            self.discarded += 1
+        return None
+
+    def _lag(self, seconds):
+        """Record the refill lag of one queue (self._lock must be held)."""
+        self.refills += 1
+        self.totallag += seconds
+        self.maxlag = max(self.maxlag, seconds)
+
+    def _needed(self, itemtype):
+        """Return boolean indicating if itemtype has a queue to refill."""
+        if len(self._queues[itemtype, None]) < self.size:
+            return True
+        total = sum(self._seen.get((itemtype, band), 0)
+                    for band in range(len(self.bands) + 1))
+        for band in range(len(self.bands) + 1):
+            if len(self._queues[itemtype, band]) >= self.size:
+                continue
+            if total < 1 / self.minshare or \
+               self._seen.get((itemtype, band), 0) >= self.minshare * total:
+                return True
+        return False
+
+    def refill(self):
+        """Generate one batch for each type with a short queue.
+
+        Returns the number of items generated.  The refill thread calls
+        this repeatedly; call it directly to fill a pool without a thread.
+
+        """
+        generated = 0
+        for itemtype in self.kinds:
+            if not self._needed(itemtype):
+                continue
+            if self.executor is None:
+                items = _generate(itemtype, self.batch)
+            else:
+                items = self.executor.submit(_generate, itemtype,
+                                             self.batch).result()
+            for item in items:
+                self._file(item, itemtype)
+            generated += len(items)
+        return generated
+
+    def fill(self):
+        """Refill until no queue needs more items (bands may stay short)."""
+        while self.refill():
+            pass
+
+    def start(self):
+        """Start the background refill thread."""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='ItemPool refill')
+        self._thread.start()
+
+    def stop(self):
+        """Stop the refill thread, waiting for its current batch."""
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        """Refill until stopped; a failed refill is counted, not fatal."""
+        while not self._stopping:
+            self._wake.clear()
+            try:
+                generated = self.refill()
+            except Exception as e:
+                with self._lock:
+                    self.errors += 1
+                    self.lasterror = e
+                generated = 0
+            if not generated:
+                self._wake.wait(self.idle)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def __len__(self):
+        return sum(len(queue) for queue in self._queues.values())
+
+    def clearstats(self):
+        """Reset the counters reported by stats()."""
+        self.hits = collections.Counter()
+        self.misses = collections.Counter()
+        self.generated = 0
+        self.discarded = 0
+        self.refills = 0
+        self.totallag = 0.0
+        self.maxlag = 0.0
+        self.errors = 0
+        self.lasterror = None
+
+    def stats(self):
+        """Return a dict of hit, miss, and refill counts and timings.
+
+        A queue's refill lag is the time from the first request that left it
+        short to the moment it was full again; meanlag and maxlag cover
+        every queue refilled since clearstats().  errors counts refills
+        that raised in the refill thread, and lasterror is the most recent
+        exception (the thread carries on after each).
+
+        """
+        hits = sum(self.hits.values())
+        misses = sum(self.misses.values())
+        return {'hits' : hits, 'misses' : misses,
+                'hitrate' : hits / (hits + misses) if hits + misses else None,
+                'bytype' : {itemtype : (self.hits[itemtype],
+                                        self.misses[itemtype])
+                            for itemtype in self.kinds},
+                'generated' : self.generated, 'discarded' : self.discarded,
+                'refills' : self.refills,
+                'meanlag' : self.totallag / self.refills if self.refills
+                            else None,
+                'maxlag' : self.maxlag,
+                'errors' : self.errors, 'lasterror' : self.lasterror,
+                'queued' : {key : len(queue)
+                            for key, queue in self._queues.items()}}
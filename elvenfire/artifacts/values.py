@@ -0,0 +1,151 @@
+import bisect
+import copy
+
+from elvenfire import OddsTable
+from elvenfire.artifacts import (ArtifactError, _MultiAbilityArtifact,
+                                 artifactclass)
+from elvenfire.utilities import outcomes
+
+
+"""Artifacts drawn to order: "a Ring worth 50000 to 100000".
+
+The only way to get an artifact worth a given amount is to generate them
+until one is; a high-value Ring takes thousands of attempts, and each
+attempt builds every ability of the ring from scratch.  A ValueIndex makes
+the attempts cheap instead:
+
+  index = ValueIndex('Ring')
+  ring = index.artifact(50000, 100000)
+  index.odds(50000, 100000)        # about 0.02
+
+For artifacts whose abilities are drawn independently of the artifact
+(tabled below), every ability a single draw can produce is built once, with
+its exact probability, by enumerating the draws of the ability class itself
+(see utilities.outcomes()).  Each attempt then picks finished abilities
+from that table, and only the artifact that is kept gets abilities of its
+own.  Counts, duplicates, languages, multipliers and valuedivisor are all
+handled by the artifact class as usual, so an artifact drawn from an index
+has exactly the distribution of a new one, given that its value is in
+range.
+
+Other artifacts are drawn by plain rejection.
+
+Every artifact returned is newly generated, never a copy of another.  The
+value distribution itself is sampled once per index (size attempts, on the
+first call to odds()), so odds() is a lookup.
+
+appraise() goes the other way, pricing an artifact that is never built from
+the ACs of its abilities (see abilities.costs):
+
+  from elvenfire.abilities import costs
+  appraise('Ring', [costs.namedAC('Mental', 'Speed [+ Slow] 3'),
+                    costs.namedAC('Mental', 'Aid 1')])
+
+"""
+
+
+# Artifacts whose _newability() does not depend on the artifact drawing it
+tabled = ['Ring', 'Amulet', 'Scroll', 'Book']
+
+_abilitytables = {}   # {itemtype : OddsTable of abilities}
+
+
+def _abilitykey(ability):
+    return (type(ability).__name__, str(ability))
+
+
+def abilitytable(itemtype):
+    """Return an OddsTable of every ability a tabled artifact may draw."""
+    if itemtype not in _abilitytables:
+        if itemtype not in tabled:
+            raise ArtifactError("%s abilities cannot be tabled" % itemtype)
+        cls = artifactclass(itemtype)
+        shell = cls.__new__(cls)
+        pairs = outcomes(shell._newability, key=_abilitykey)
+        pairs.sort(key=lambda pair: (pair[0].AC, _abilitykey(pair[0])))
+        _abilitytables[itemtype] = OddsTable(pairs)
+    return _abilitytables[itemtype]
+
+
+def appraise(itemtype, ACs, language='Common'):
+    """Return the value of an artifact whose abilities cost ACs.
+
+    itemtype is as for artifactclass(), and must be valued by its abilities
+    (e.g. 'Ring', 'Weapon', 'Book'); language matters to written artifacts
+    only.  Changling weapons are valued as two weapons, and cannot be
+    appraised this way.
+
+    """
+    cls = artifactclass(itemtype)
+    if not issubclass(cls, _MultiAbilityArtifact):
+        raise ArtifactError("%s is not valued by its abilities" % itemtype)
+    shell = cls.__new__(cls)
+    shell.language = language
+    return shell._appraise(ACs)
+
+
+class ValueIndex:
+
+    """Draws artifacts of one type whose value falls in a given range.
+
+    Attributes:
+      itemtype -- artifact type, as for artifactclass() (e.g. 'Ring')
+      cls      -- the artifact class
+      table    -- OddsTable of abilities (see abilitytable()), or None if
+                  the type is drawn by plain rejection
+      size     -- attempts in the value sample behind odds()
+      attempts -- artifacts tried, over every call to artifact()
+      found    -- artifacts returned by artifact()
+
+    """
+
+    maxtries = 100000
+
+    def __init__(self, itemtype, size=10000):
+        self.itemtype = itemtype
+        self.cls = artifactclass(itemtype)
+        self.table = abilitytable(itemtype) if itemtype in tabled else None
+        self.size = size
+        self.attempts = 0
+        self.found = 0
+        self._values = None   # sorted values of size attempts, for odds()
+
+    def _attempt(self):
+        """Return a new artifact, drawing abilities from self.table."""
+        if self.table is None:
+            return self.cls()
+        item = self.cls.__new__(self.cls)
+        item._newability = self.table.sample
+        item.__init__()
+        del item._newability
+        return item
+
+    def artifact(self, low=0, high=None, maxtries=None):
+        """Return a new artifact with low <= value < high (None: no limit).
+
+        Raises ArtifactError after maxtries attempts without one.
+
+        """
+        if high is not None and high <= low:
+            raise ArtifactError("Empty value range %s to %s" % (low, high))
+        for i in range(maxtries or self.maxtries):
+            item = self._attempt()
+            if item.value >= low and (high is None or item.value < high):
+                self.attempts += i + 1
+                self.found += 1
+                if self.table is not None:  # abilities of its own
+                    item.abilities = [copy.copy(a) for a in item.abilities]
+                return item
+        self.attempts += i + 1
+        raise ArtifactError("No %s worth %s to %s in %d tries"
+                            % (self.itemtype, low, high, i + 1))
+
+    def odds(self, low=0, high=None):
+        """Return the estimated chance that a new artifact is in range."""
+        if self._values is None:
+            self._values = sorted(self._attempt().value
+                                  for i in range(self.size))
+        values = self._values
+        end = len(values) if high is None else \
+              max(0, bisect.bisect_left(values, high))
+        return max(0, end - bisect.bisect_left(values, low)) / len(values)
@@ -29,12 +29,13 @@ class _WrittenArtifact (_MultiAbilityArtifact):
         _MultiAbilityArtifact.__init__(self, abilities)
         self.name += ': %s' % self.language
 
-    def _lookup(self):
-        _MultiAbilityArtifact._lookup(self)
+    def _appraise(self, ACs):
+        value = _MultiAbilityArtifact._appraise(self, ACs)
         if self.language in rarelanguages:
-            self.value = round(self.value * 0.75)
+            return round(value * 0.75)
         elif self.language != 'Common':
-            self.value = round(self.value * 0.90)
+            return round(value * 0.90)
+        return value
 
 class Scroll (_WrittenArtifact):
 
@@ -0,0 +1,177 @@
+import argparse
+import os
+import sys
+import time
+
+from elvenfire import ELFError
+from elvenfire import export
+from elvenfire.shards import (targets, defaultshards, shardcount,
+                              shardseed, shardspans, targetrecords,
+                              targetkind)
+
+
+"""Command line entry point: python -m elvenfire generate|render ...
+
+  python -m elvenfire generate treasure  --count 100000 --seed 7 --out packs
+  python -m elvenfire generate creatures --count 20000 --level 4 --workers 8
+  python -m elvenfire generate rooms     --count 5000 --level 3 --format csv
+  python -m elvenfire generate level     --count 40 --level 10
+
+treasure, creatures and rooms generate count records (at --level, where it
+matters); level generates count rooms for every labyrinth level from 1 to
+--level.  Records are written in the columns of export.py, as JSON Lines by
+default, to one file per shard:
+
+  packs/treasure-00000.jsonl, packs/treasure-00001.jsonl, ...
+
+The work is split into --shards shards (default: 8, or one per record for
+fewer records), which --workers processes generate in parallel.  Each shard
+draws from its own random stream, seeded from --seed, the target, and the
+shard number, so the same seed and shard count give the same files,
+whatever the worker count or machine.
+Room numbers run on from shard to shard, as if one process had made them.
+
+render writes one labyrinth level as a document (see labyrinth/render.py),
+to --out or to standard output, as its rooms are made:
+
+  python -m elvenfire render 3 --count 500 --format html --out level3.html
+
+"""
+
+
+class CLIError (ELFError):
+    pass
+
+
+formats = {'jsonl' : '.jsonl', 'csv' : '.csv', 'npz' : '.npz',
+           'arrow' : '.arrow'}
+
+
+def runshard(job):
+    """Generate and write one shard; return (path, records, seconds).
+
+    job is (target, shard, seed, start, count, path, options); this runs in
+    a worker process, so it is a module-level function of picklable data.
+
+    """
+    (target, shard, seed, start, count, path, options) = job
+    began = time.perf_counter()
+    records = targetrecords(target, shardseed(seed, target, shard), start,
+                            count, options)
+    written = export.export(records, targetkind(target), path,
+                            chunksize=options['chunksize'])
+    return (path, written, time.perf_counter() - began)
+
+
+def generate(target, count, seed=None, level=1, workers=1, shards=None,
+             out='.', format='jsonl', kind=None, difficulty=2,
+             chunksize=1000, progress=None):
+    """Generate count records of target into sharded files under out.
+
+    Returns [(path, records, seconds)] in shard order.  progress, if given,
+    is called with each result as its shard finishes.
+
+    """
+    if target not in targets:
+        raise CLIError("Unknown target '%s'" % target)
+    if format not in formats:
+        raise CLIError("Unknown format '%s'" % format)
+    shards = shardcount(count, shards)
+    options = {'level' : level, 'kind' : kind, 'difficulty' : difficulty,
+               'chunksize' : chunksize}
+    os.makedirs(out, exist_ok=True)
+    jobs = []
+    for shard, (start, size) in enumerate(shardspans(count, shards)):
+        path = os.path.join(out, '%s-%05d%s' % (target, shard,
+                                                formats[format]))
+        jobs.append((target, shard, seed, start, size, path, options))
+
+    if workers <= 1:
+        results = []
+        for job in jobs:
+            results.append(runshard(job))
+            if progress is not None:
+                progress(results[-1])
+        return results
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(workers) as executor:
+        futures = {executor.submit(runshard, job) : i
+                   for i, job in enumerate(jobs)}
+        results = [None] * len(jobs)
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if progress is not None:
+                progress(results[futures[future]])
+    return results
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m elvenfire',
+                                     description="Elvenfire generators")
+    commands = parser.add_subparsers(dest='command', required=True)
+    gen = commands.add_parser('generate', help="generate content to files")
+    gen.add_argument('target', choices=targets)
+    gen.add_argument('--count', type=int, default=1000,
+                     help="records (rooms per level, for level)")
+    gen.add_argument('--seed', type=int, default=None)
+    gen.add_argument('--level', type=int, default=1,
+                     help="labyrinth level (deepest level, for level)")
+    gen.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    gen.add_argument('--shards', type=int, default=None,
+                     help="output files (default: %d)" % defaultshards)
+    gen.add_argument('--out', default='.', help="output directory")
+    gen.add_argument('--format', choices=sorted(formats), default='jsonl')
+    gen.add_argument('--kind', default=None,
+                     help="artifact or creature kind (see streams.py)")
+    gen.add_argument('--difficulty', type=int, default=2)
+    gen.add_argument('--chunksize', type=int, default=1000)
+    ren = commands.add_parser('render', help="write a level as a document")
+    ren.add_argument('level', type=int)
+    ren.add_argument('--count', type=int, default=40, help="rooms")
+    ren.add_argument('--seed', type=int, default=None)
+    ren.add_argument('--workers', type=int, default=1)
+    ren.add_argument('--out', default='-', help="output file ('-': stdout)")
+    ren.add_argument('--format', default='text',
+                     choices=['text', 'markdown', 'html'])
+    ren.add_argument('--difficulty', type=int, default=2)
+    ren.add_argument('--chunksize', type=int, default=10,
+                     help="rooms per worker task")
+    options = parser.parse_args(args)
+    if options.command == 'render':
+        return _render(options)
+
+    def progress(result):
+        (path, written, seconds) = result
+        print("  %s: %d records in %.1fs" % (path, written, seconds),
+              file=sys.stderr)
+
+    began = time.perf_counter()
+    try:
+        results = generate(options.target, options.count, options.seed,
+                           options.level, options.workers, options.shards,
+                           options.out, options.format, options.kind,
+                           options.difficulty, options.chunksize, progress)
+    except ELFError as e:
+        print("error: %s" % e, file=sys.stderr)
+        return 1
+    total = sum(written for path, written, seconds in results)
+    print("Wrote %d records to %d files in %.1fs" %
+          (total, len(results), time.perf_counter() - began))
+    return 0
+
+
+def _render(options):
+    """Run the render command."""
+    from elvenfire.labyrinth.render import renderlevel
+    file = sys.stdout if options.out == '-' else open(options.out, 'w')
+    try:
+        renderlevel(file, options.level, options.count, options.difficulty,
+                    options.seed, options.format, options.workers,
+                    options.chunksize)
+    except ELFError as e:
+        print("error: %s" % e, file=sys.stderr)
+        return 1
+    finally:
+        if file is not sys.stdout:
+            file.close()
+    return 0
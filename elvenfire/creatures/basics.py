@@ -129,11 +129,11 @@ class StatSet:
             over = now - base
             while over > 0:
                 level += over
-                over -= base
+                over -= max(base, 1)   # e.g. a skeleton's IQ, 0 at base
         return level
 
     def __str__(self):
-        if isinstance(self.damage, str) or '__iter__' not in dir(self.damage):
+        if isinstance(self.damage, str) or not hasattr(self.damage, '__iter__'):
             dmgstr = str(self.damage)
         else:
             dmgstr = ', '.join(map(str, self.damage))
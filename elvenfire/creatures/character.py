@@ -2,6 +2,7 @@ import random
 
 from elvenfire import bonus5
 from elvenfire.utilities import wrapped
+from elvenfire.instrument import tally
 from elvenfire.creatures.basics import StatSet, Creature
 from elvenfire.artifacts.combat import Weapon, Armor
 from elvenfire.artifacts.special import SpecialArtifact, STBattery
@@ -42,7 +43,7 @@ class Character (Creature):
         stats = self._randomizestats(race, gender, charlevel)
         Creature.__init__(self, name, stats, self.details)
 
-        self.abilities = []
+        self.abilities = AbilitySet()
         self.inventory = []
         self.equipped = []
         self.pets = []
@@ -137,11 +138,13 @@ class Character (Creature):
         secondary = None
         if (random.randint(1, 4) == 1 and not primary.changling):
             artifact = (random.randint(1, 10) == 1)
-            while True:
-                secondary = Weapon(artifact=artifact, secondary=True, 
-                                   maxST=self.stats.ST)
-                if ('Bow' in primary.style) != ('Bow' in secondary.style):
-                    break
+            with tally('Character._randomizeequipment') as attempt:
+                while True:
+                    secondary = Weapon(artifact=artifact, secondary=True, 
+                                       maxST=self.stats.ST)
+                    if ('Bow' in primary.style) != ('Bow' in secondary.style):
+                        break
+                    attempt.reject()
             self.stats.altdamage = [secondary.DCl]
 
         # 33% chance of armor
@@ -167,45 +170,45 @@ class Character (Creature):
 
     def _addability(self, remaining, name=None, IIQ=None, mental=False,
                                                           physical=False):
+        if remaining <= 0: return remaining   # e.g. a changling's second style
         if IIQ is None: IIQ = bonus5()
         if IIQ > remaining: IIQ = remaining
         if self.stats.IQ < 8: physical = True
         if name == 'Ax/Mace/Hammer': name = 'Ax/Club/Mace'
-        if mental:
-            ability = MentalAbility(name, IIQ)
-        elif physical:
-            ability = PhysicalAbility(name, IIQ)
-        else:
-            ability = PhysicalOrMentalAbility(name, IIQ)
-
-        # Duplicate check
-        for a in self.abilities:
-            if a.duplicate(ability):
-                if a.worsethan(ability):
-                    self.abilities.remove(a)
-                    remaining += a.IIQ
-                    if '[+' in str(a):
-                        remaining += 1
+
+        # Record ability, replacing any worse duplicate; if an equal or better
+        # duplicate is known, keep it (and draw again, if random, at most 250
+        # times)
+        rejects = 0
+        with tally('Character._addability') as attempt:
+            while True:
+                if mental:
+                    ability = MentalAbility(name, IIQ)
+                elif physical:
+                    ability = PhysicalAbility(name, IIQ)
+                else:
+                    ability = PhysicalOrMentalAbility(name, IIQ)
+                change = self.abilities.offer(ability)
+                if change is not None:
+                    break
                 elif name is not None:
                     return remaining
-                else:
-                    return self._addability(remaining, name, IIQ, 
-                                            mental, physical)
+                rejects += 1
+                if rejects > 250:
+                    raise AbilityError('Cannot add new ability to %s (%s)'
+                                       % (self.name,
+                                          list(map(str, self.abilities))))
+                attempt.reject()
 
         # Save DCl for Etheral Bow abilities
         if ability.name in MentalAbility.EtherealBow:
             perpoint = EtherealBowDmg(self.stats.IQ)
             total = perpoint * ability.IIQ
-            if ((not self.stats.altdamage) or 
-                (total > sum(self.stats.altdamage))):
+            current = sum(map(self.stats._translate, self.stats.altdamage))
+            if (not self.stats.altdamage) or (total > current):
                 self.stats.altdamage = [total]
 
-        # Record ability
-        self.abilities.append(ability)
-        remaining -= ability.IIQ
-        if '[+' in str(ability):
-            remaining -= 1
-        return remaining
+        return remaining - change
 
     def _randomizeabilities(self):
 
@@ -0,0 +1,125 @@
+import copy
+import random
+
+from elvenfire.abilities.charabilities import AbilitySet
+from elvenfire.creatures.character import PlayerCharacter
+
+
+"""A reusable pool of generated characters, for parties of many characters.
+
+Building a PlayerCharacter is by far the most expensive part of a room: its
+stats, weapons, armor, abilities, and pets are all drawn from scratch.  A
+CharacterPool keeps a few finished characters (templates) for each race and
+band of character levels, and hands out cheap clones of them:
+
+  pool = CharacterPool()
+  fighter = pool.character(charlevel=42)      # of level 40 to 49
+  party = PCParty(5, maxCP, pool=pool)        # characters cloned from pool
+
+Each template is a fresh PlayerCharacter, of a level drawn evenly from its
+band, and each character handed out is a clone of a template chosen at
+random.  PCParty draws character levels evenly from a band of 10 (see
+PCParty), the default bandwidth, so a pooled character in a party has
+exactly the distribution of an unpooled one.  The characters are not
+independent, though: two may come from the same template.  Every draw
+replaces its template with a new one with probability renew, so that the
+pool keeps changing; a lower renew is faster, a higher one repeats less
+often.
+
+A clone has copies of its template's stats, items, and abilities, so it may
+be changed freely, and is perturbed by a name of its own and pets rolled
+again.
+
+"""
+
+
+class CharacterPool:
+
+    """Templates of PlayerCharacters, by race and charlevel band, for cloning.
+
+    Attributes:
+      size      -- templates kept for each (race, band)
+      renew     -- chance that a template is replaced after being drawn
+      bandwidth -- character levels in each band: band n holds levels
+                   n * bandwidth up to (not including) (n + 1) * bandwidth
+      charclass -- Character class to generate (default PlayerCharacter)
+      generated -- count of new PlayerCharacters built
+      cloned    -- count of characters handed out
+
+    race None (any race) is a key of its own, so that the pool can serve
+    PCParty, which chooses the race at random, as one template set.
+
+    """
+
+    def __init__(self, size=8, renew=0.25, bandwidth=10,
+                 charclass=PlayerCharacter):
+        self.size = size
+        self.renew = renew
+        self.bandwidth = bandwidth
+        self.charclass = charclass
+        self.generated = 0
+        self.cloned = 0
+        self._templates = {}   # {(race, band) : [characters]}
+
+    def band(self, charlevel):
+        """Return the band index for charlevel."""
+        return charlevel // self.bandwidth
+
+    def character(self, charlevel=0, race=None):
+        """Return a character in the band of charlevel (and of race, if given).
+
+        The character's own level is that of its template: any in the band.
+
+        """
+        band = self.band(charlevel)
+        templates = self._templates.setdefault((race, band), [])
+        if len(templates) < self.size:
+            template = self._new(race, band)
+            templates.append(template)
+        else:
+            i = random.randrange(len(templates))
+            if random.random() < self.renew:
+                templates[i] = self._new(race, band)
+            template = templates[i]
+        self.cloned += 1
+        return clone(template, '%s %d' % (template.race, self.cloned))
+
+    def fill(self, charlevels, race=None):
+        """Generate every missing template for the given character levels."""
+        for band in sorted(set(map(self.band, charlevels))):
+            templates = self._templates.setdefault((race, band), [])
+            while len(templates) < self.size:
+                templates.append(self._new(race, band))
+
+    def clear(self):
+        """Discard every template."""
+        self._templates = {}
+
+    def __len__(self):
+        return sum(len(t) for t in self._templates.values())
+
+    def _new(self, race, band):
+        self.generated += 1
+        charlevel = band * self.bandwidth + random.randrange(self.bandwidth)
+        return self.charclass(race=race, charlevel=charlevel)
+
+
+def clone(character, name=None):
+    """Return a copy of character, named name (if given), with new pets.
+
+    The clone's stats, items, and abilities are its own copies; items keep
+    their identity between inventory and equipped.
+
+    """
+    twin = copy.copy(character)
+    if name is not None:
+        twin.name = name
+    twin.stats = copy.copy(character.stats)
+    twin.stats.damage = list(character.stats.damage)
+    twin.stats.altdamage = list(character.stats.altdamage)
+    twin.abilities = AbilitySet(copy.copy(a) for a in character.abilities)
+    (twin.inventory, twin.equipped) = copy.deepcopy((character.inventory,
+                                                     character.equipped))
+    twin.pets = []
+    twin._setpets()
+    return twin
@@ -0,0 +1,7 @@
+"""Large data tables, kept out of the modules whose classes use them.
+
+Each class loads its table through elvenfire.tables.load(), which reads the
+binary cache when it is current, and imports these modules only when it is
+not.
+
+"""
@@ -0,0 +1,320 @@
+import csv
+import heapq
+import json
+import os
+import tempfile
+import zipfile
+
+from elvenfire import ELFError
+# as needed: import numpy
+# as needed: import pyarrow, pyarrow.ipc
+
+
+"""Columnar export of generated artifacts, creatures, and rooms.
+
+Each kind of record is flattened into typed columns (see columns()), so that
+analysts can load it directly, without parsing str() output:
+
+  from elvenfire import streams, export
+  export.export(streams.iter_artifacts(count=10**6), 'artifacts',
+                'artifacts.csv')
+
+  import pandas
+  frame = pandas.read_csv('artifacts.csv')
+
+The format follows the file extension: .csv or .jsonl (always available),
+.npz (requires numpy) or .arrow (an Arrow IPC file; requires pyarrow).
+Records are consumed from any iterable and written in chunks of chunksize
+rows, so memory use depends on the chunk size, not on the number of
+records: a feed from streams.py may be exported without ever holding the
+population.
+
+Columns are 'int', 'float', or 'str'.  Values that do not apply to a record
+(a second MA, a fifth ability) are 0 or ''.
+
+"""
+
+
+class ExportError (ELFError):
+    pass
+
+
+## Flattening ##
+
+def _abilitycolumns(slots):
+    cols = []
+    for i in range(1, slots + 1):
+        cols += [('ability%s' % i, 'str'), ('ability%s_iiq' % i, 'int'),
+                 ('ability%s_ac' % i, 'float')]
+    return cols
+
+
+def _abilitycells(item, slots):
+    """Return the count of item's abilities, and cells for the highest ACs.
+
+    Abilities are taken highest AC first, however item holds them.
+
+    """
+    if hasattr(item, 'abilities'):
+        abilities = item.abilities
+    elif getattr(item, 'ability', None) is not None:   # gems, rods, potions
+        abilities = [item.ability]
+    else:
+        abilities = []
+    cells = []
+    for ability in heapq.nlargest(slots, abilities, key=lambda a: a.AC):
+        IIQ = getattr(ability, 'IIQ', None) or getattr(ability, 'size', 0)
+        cells += [str(ability), IIQ or 0, ability.AC]
+    cells += ['', 0, 0.0] * (slots - min(slots, len(abilities)))
+    return len(abilities), cells
+
+
+def artifactrow(item, slots=5):
+    """Return the cells of one artifact, matching columns('artifacts')."""
+    count, cells = _abilitycells(item, slots)
+    return [getattr(type(item), 'itemtype', type(item).__name__),
+            getattr(item, 'itemtype', ''), item.name, item.value, count,
+            getattr(item, 'language', '')] + cells
+
+
+def creaturerow(creature):
+    """Return the cells of one creature, matching columns('creatures')."""
+    stats = creature.stats
+    power = stats.power()   # also turns 'StD+n' damage into numbers
+    MA = str(stats.MA).split('/') + ['0']   # '8/16' is ground/other MA
+    return [type(creature).__name__, creature.name,
+            getattr(creature, 'race', ''), stats.ST, stats.DX, stats.IQ,
+            int(MA[0]), int(MA[1]), stats.hits, float(sum(stats.damage)),
+            stats.poison, float(sum(stats.altdamage)), power, stats.level()]
+
+
+def roomrow(room):
+    """Return the cells of one room, matching columns('rooms')."""
+    from elvenfire.labyrinth.containers import ContainerSet
+    from elvenfire.labyrinth.special import SpecialArtifact
+    parties = [c for c in room.contents if hasattr(c, 'creatures')]
+    sets = [c for c in room.contents if isinstance(c, ContainerSet)]
+    containers = [c for s in sets for c in s.containers]
+    traps = [c.trap for c in containers if c.trap is not None]
+    locks = [c.lock for c in containers if c.lock is not None]
+    return [type(room).__name__, room.name, room.level, len(room.contents),
+            len(parties), sum(len(p.creatures) for p in parties),
+            float(sum(p.totalCP for p in parties)), len(sets),
+            len(containers),
+            sum(c.num_treasures or 0 for c in containers),
+            len([c for c in room.contents if isinstance(c, str)]),
+            len([c for c in room.contents if isinstance(c, SpecialArtifact)]),
+            len(traps), sum(t.numdice or 0 for t in traps),
+            max([t.detect for t in traps], default=0),
+            max([t.remove for t in traps], default=0),
+            max([t.avoid for t in traps], default=0),
+            len(locks), max([l.strength for l in locks], default=0)]
+
+
+#        kind          columns (name, type)                                 row
+_kinds = {'artifacts' : ([('kind', 'str'), ('itemtype', 'str'),
+                          ('name', 'str'), ('value', 'int'),
+                          ('abilities', 'int'), ('language', 'str')],      artifactrow),
+          'creatures' : ([('subtype', 'str'), ('name', 'str'),
+                          ('race', 'str'), ('ST', 'int'), ('DX', 'int'),
+                          ('IQ', 'int'), ('MA', 'int'), ('altMA', 'int'),
+                          ('hits', 'int'), ('damage', 'float'),
+                          ('poison', 'float'), ('missile', 'float'),
+                          ('power', 'float'), ('level', 'int')],           creaturerow),
+          'rooms'     : ([('roomtype', 'str'), ('name', 'str'),
+                          ('level', 'int'), ('contents', 'int'),
+                          ('parties', 'int'), ('creatures', 'int'),
+                          ('partyCP', 'float'), ('containersets', 'int'),
+                          ('containers', 'int'), ('treasures', 'int'),
+                          ('unguarded', 'int'), ('specials', 'int'),
+                          ('traps', 'int'), ('trapdice', 'int'),
+                          ('maxdetect', 'int'), ('maxremove', 'int'),
+                          ('maxavoid', 'int'), ('locks', 'int'),
+                          ('maxlock', 'int')],                             roomrow)}
+
+
+def columns(kind, slots=5):
+    """Return [(name, type)] for a kind of record (see _kinds).
+
+    Artifacts have columns for their first slots abilities (highest AC
+    first), after a count of all their abilities.
+
+    """
+    if kind not in _kinds:
+        raise ExportError("Unknown kind of record '%s'" % kind)
+    cols = list(_kinds[kind][0])
+    if kind == 'artifacts':
+        cols += _abilitycolumns(slots)
+    return cols
+
+
+def rows(records, kind, slots=5):
+    """Yield the cells of each record, as lists matching columns(kind)."""
+    row = _kinds[kind][1]
+    if kind == 'artifacts':
+        for record in records:
+            yield row(record, slots)
+    else:
+        for record in records:
+            yield row(record)
+
+
+## Writers ##
+
+class CSVWriter:
+
+    """Writes chunks of rows to a CSV file, with a header line."""
+
+    def __init__(self, path, cols):
+        self._file = open(path, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([name for name, type in cols])
+
+    def write(self, chunk):
+        self._writer.writerows(chunk)
+
+    def close(self):
+        self._file.close()
+
+
+class JSONLWriter:
+
+    """Writes chunks of rows to a JSON Lines file, one object per row."""
+
+    def __init__(self, path, cols):
+        self._file = open(path, 'w')
+        self._names = [name for name, type in cols]
+
+    def write(self, chunk):
+        names = self._names
+        self._file.writelines(json.dumps(dict(zip(names, row))) + '\n'
+                              for row in chunk)
+
+    def close(self):
+        self._file.close()
+
+
+class NPZWriter:
+
+    """Writes chunks of rows to a NumPy .npz file, one array per column.
+
+    An .npz member needs its length (and, for strings, its width) in its
+    header, so each column is spooled to a temporary file until close(),
+    which then copies the columns into the archive one at a time.
+
+    """
+
+    _dtypes = {'int' : '<i8', 'float' : '<f8'}
+
+    def __init__(self, path, cols):
+        try:
+            import numpy
+        except ImportError:
+            raise ExportError(".npz export requires numpy")
+        self._numpy = numpy
+        self._path = path
+        self._cols = cols
+        self._rows = 0
+        self._widths = [1] * len(cols)
+        self._spools = [tempfile.TemporaryFile() for col in cols]
+
+    def write(self, chunk):
+        numpy = self._numpy
+        for i, (name, type) in enumerate(self._cols):
+            cells = [row[i] for row in chunk]
+            if type == 'str':
+                self._widths[i] = max([self._widths[i]] +
+                                      [len(c) for c in cells])
+                for cell in cells:
+                    self._spools[i].write(json.dumps(cell).encode() + b'\n')
+            else:
+                numpy.asarray(cells, self._dtypes[type]).tofile(self._spools[i])
+        self._rows += len(chunk)
+
+    def close(self, chunksize=10000):
+        numpy = self._numpy
+        fmt = numpy.lib.format
+        with zipfile.ZipFile(self._path, 'w', zipfile.ZIP_STORED,
+                             allowZip64=True) as archive:
+            for i, (name, type) in enumerate(self._cols):
+                spool = self._spools[i]
+                spool.seek(0)
+                dtype = numpy.dtype(self._dtypes.get(type,
+                                                     '<U%d' % self._widths[i]))
+                header = {'descr' : fmt.dtype_to_descr(dtype),
+                          'fortran_order' : False, 'shape' : (self._rows,)}
+                with archive.open(name + '.npy', 'w', force_zip64=True) as f:
+                    fmt.write_array_header_2_0(f, header)
+                    if type == 'str':
+                        while True:
+                            lines = spool.readlines(chunksize * 16)
+                            if not lines:
+                                break
+                            cells = [json.loads(l) for l in lines]
+                            f.write(numpy.asarray(cells, dtype).tobytes())
+                    else:
+                        while True:
+                            data = spool.read(1 << 20)
+                            if not data:
+                                break
+                            f.write(data)
+                spool.close()
+
+
+class ArrowWriter:
+
+    """Writes chunks of rows to an Arrow IPC file, one batch per chunk."""
+
+    def __init__(self, path, cols):
+        try:
+            import pyarrow, pyarrow.ipc
+        except ImportError:
+            raise ExportError(".arrow export requires pyarrow")
+        self._pyarrow = pyarrow
+        types = {'int' : pyarrow.int64(), 'float' : pyarrow.float64(),
+                 'str' : pyarrow.string()}
+        self._schema = pyarrow.schema([(name, types[type])
+                                       for name, type in cols])
+        self._writer = pyarrow.ipc.new_file(path, self._schema)
+
+    def write(self, chunk):
+        arrays = [self._pyarrow.array([row[i] for row in chunk], field.type)
+                  for i, field in enumerate(self._schema)]
+        self._writer.write_batch(
+            self._pyarrow.record_batch(arrays, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+writers = {'.csv' : CSVWriter, '.jsonl' : JSONLWriter, '.npz' : NPZWriter,
+           '.arrow' : ArrowWriter, '.feather' : ArrowWriter}
+
+
+def export(records, kind, path, format=None, chunksize=10000, slots=5):
+    """Write records of a kind ('artifacts', 'creatures' or 'rooms') to path.
+
+    format is a key of writers (e.g. '.csv'), or None to use path's
+    extension.
+    Returns the number of records written.
+
+    """
+    format = format or os.path.splitext(path)[1].lower()
+    if format not in writers:
+        raise ExportError("Unknown export format '%s'" % format)
+    writer = writers[format](path, columns(kind, slots))
+    count = 0
+    try:
+        chunk = []
+        for row in rows(records, kind, slots):
+            chunk.append(row)
+            if len(chunk) >= chunksize:
+                writer.write(chunk)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            writer.write(chunk)
+            count += len(chunk)
+    finally:
+        writer.close()
+    return count
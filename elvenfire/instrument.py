@@ -0,0 +1,422 @@
+import random
+import time
+
+from elvenfire import ELFError
+
+
+"""Optional instrumentation of the generation pipeline.
+
+Nothing in this module touches the generators until enable() is called: the
+stages listed below are then wrapped in place, and the public functions of
+the random module are wrapped to count draws.  disable() puts every original
+back, so an uninstrumented process pays nothing at all.
+
+  profile = enable()
+  with profile.label('level 3'):
+      rooms = [Room(3, i) for i in range(1, 21)]
+  disable()
+  print(profile.report())
+
+or simply print(levelprofile(range(1, 11))).
+
+For each stage (per label) the profile records calls, inclusive time (the
+whole call), own time (less time spent in nested stages), and random draws
+made while that stage was the innermost one running.  Recursive calls of a
+stage are counted but not timed twice.  Instrumentation is not thread-safe;
+profile one thread (or one worker process) at a time.
+
+Generators that loop until a random condition holds report their retries
+through tally(), which costs one call when instrumentation is off:
+
+  with tally('TrainableAnimal._getinfo') as attempt:
+      while not available:
+          ...
+          if not available:
+              attempt.reject()
+
+Each call site then records calls, rejected candidates, the random draws
+spent on rejected candidates, and a histogram of rejections per call.  A
+site reached again recursively while its tally is open (as __newability
+does) is counted as part of the same call.
+
+"""
+
+
+class InstrumentError (ELFError):
+    pass
+
+
+#         stage                           module                            class                   method
+stages = [('Room.setcontents',            'elvenfire.labyrinth.rooms',      'Room',                 'setcontents'),
+          ('Room.add_creatures',          'elvenfire.labyrinth.rooms',      'Room',                 'add_creatures'),
+          ('_Party._populate',            'elvenfire.labyrinth.parties',    '_Party',               '_populate'),
+          ('Character._randomizeequipment', 'elvenfire.creatures.character', 'Character',           '_randomizeequipment'),
+          ('Character._randomizeabilities', 'elvenfire.creatures.character', 'Character',           '_randomizeabilities'),
+          ('NonTrainableCreature.__init__', 'elvenfire.creatures.nontrainable', 'NonTrainableCreature', '__init__'),
+          ('ContainerSet.__init__',       'elvenfire.labyrinth.containers', 'ContainerSet',         '__init__'),
+          ('Trap.newtrap',                'elvenfire.labyrinth.traps',      'Trap',                 'newtrap'),
+          ('Trap.newtraps',               'elvenfire.labyrinth.traps',      'Trap',                 'newtraps'),
+          ('Lock.__init__',               'elvenfire.labyrinth.locks',      'Lock',                 '__init__'),
+          ('Lock.newlocks',               'elvenfire.labyrinth.locks',      'Lock',                 'newlocks'),
+          ('SpecialArtifact.__init__',    'elvenfire.labyrinth.special',    'SpecialArtifact',      '__init__'),
+          ('_Artifact.__init__',          'elvenfire.artifacts',            '_Artifact',            '__init__'),
+          ('_MultiAbilityArtifact.__newability', 'elvenfire.artifacts',     '_MultiAbilityArtifact', '_MultiAbilityArtifact__newability'),
+          ('Weapon._handlespecials',      'elvenfire.artifacts.combat',     'Weapon',               '_handlespecials')]
+
+# Public functions of the random module that count as one draw each
+drawfunctions = ['random', 'uniform', 'randint', 'randrange', 'choice',
+                 'choices', 'sample', 'shuffle', 'gauss', 'normalvariate',
+                 'triangular', 'getrandbits']
+
+
+class StageStats:
+
+    """Totals for one stage under one label.
+
+    Attributes:
+      calls -- number of calls (including recursive calls)
+      total -- inclusive seconds
+      own   -- seconds not spent in other instrumented stages
+      draws -- random draws made while this was the innermost stage
+
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.own = 0.0
+        self.draws = 0
+
+    def asdict(self):
+        return {'calls' : self.calls, 'total' : self.total, 'own' : self.own,
+                'draws' : self.draws}
+
+
+class SiteStats:
+
+    """Retry totals for one call site under one label.
+
+    Attributes:
+      calls     -- number of (outermost) calls
+      rejects   -- number of rejected candidates
+      wasted    -- random draws made for rejected candidates
+      draws     -- all random draws made at this site
+      histogram -- {rejects in one call : number of calls}
+
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.rejects = 0
+        self.wasted = 0
+        self.draws = 0
+        self.histogram = {}
+
+    def asdict(self):
+        return {'calls' : self.calls, 'rejects' : self.rejects,
+                'wasted' : self.wasted, 'draws' : self.draws,
+                'histogram' : dict(sorted(self.histogram.items()))}
+
+    def buckets(self):
+        """Return the histogram in power-of-two buckets, as printable text."""
+        counts = {}
+        for rejects, calls in self.histogram.items():
+            low = 0 if rejects == 0 else 2**(rejects.bit_length() - 1)
+            counts[low] = counts.get(low, 0) + calls
+        val = []
+        for low in sorted(counts):
+            high = max(low, 2 * low - 1)
+            name = str(low) if low == high else '%s-%s' % (low, high)
+            val.append('%s:%s' % (name, counts[low]))
+        return ' '.join(val)
+
+
+class Tally:
+
+    """Rejections counted during one call of a retrying call site.
+
+    Use as a context manager (see tally()); call reject() after drawing a
+    candidate that is thrown away, and accept() after one that is kept, so
+    that the draws in between are attributed correctly.
+
+    """
+
+    def __init__(self, profile, site):
+        self.profile = profile
+        self.site = site
+        self.rejects = 0
+        self.wasted = 0
+        self.depth = 0
+        self.start = self.mark = profile.drawcount
+
+    def reject(self):
+        self.rejects += 1
+        self.wasted += self.profile.drawcount - self.mark
+        self.mark = self.profile.drawcount
+
+    def accept(self):
+        self.mark = self.profile.drawcount
+
+    def __enter__(self):
+        self.depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self.depth -= 1
+        if self.depth == 0:
+            self.profile._close(self)
+        return False
+
+
+class _NoTally:
+
+    """Stands in for a Tally while instrumentation is off."""
+
+    def reject(self):
+        pass
+
+    def accept(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_notally = _NoTally()
+
+
+class Profile:
+
+    """Instrumentation results, grouped by label.
+
+    Attributes:
+      stats  -- {label : {stage : StageStats}}
+      sites  -- {label : {call site : SiteStats}}
+      draws  -- {label : total random draws, inside stages or not}
+      wall   -- {label : seconds spent inside label()}
+      current -- label that new results are recorded under
+      drawcount -- random draws made since instrumentation began
+
+    """
+
+    def __init__(self, label='all'):
+        self.stats = {}
+        self.sites = {}
+        self.draws = {}
+        self.drawcount = 0
+        self.wall = {}
+        self.current = label
+        self._stack = []      # [stage, seconds in nested stages]
+        self._depth = {}      # stage : active calls, to spot recursion
+        self._tallies = {}    # call site : open Tally
+
+    def label(self, name):
+        """Return a context manager recording results under name."""
+        return _Label(self, name)
+
+    def _stat(self, stage):
+        stats = self.stats.setdefault(self.current, {})
+        if stage not in stats:
+            stats[stage] = StageStats()
+        return stats[stage]
+
+    def _tally(self, site):
+        if site not in self._tallies:
+            self._tallies[site] = Tally(self, site)
+        return self._tallies[site]
+
+    def _close(self, tally):
+        del self._tallies[tally.site]
+        sites = self.sites.setdefault(self.current, {})
+        if tally.site not in sites:
+            sites[tally.site] = SiteStats()
+        stats = sites[tally.site]
+        stats.calls += 1
+        stats.rejects += tally.rejects
+        stats.wasted += tally.wasted
+        stats.draws += self.drawcount - tally.start
+        stats.histogram[tally.rejects] = stats.histogram.get(tally.rejects,
+                                                             0) + 1
+
+    def _draw(self):
+        self.drawcount += 1
+        self.draws[self.current] = self.draws.get(self.current, 0) + 1
+        if self._stack:
+            self._stat(self._stack[-1][0]).draws += 1
+
+    def labels(self):
+        """Return all labels with results, in the order first recorded."""
+        return list(dict.fromkeys(list(self.stats) + list(self.sites)))
+
+    def asdict(self):
+        """Return results as plain dicts and numbers (e.g. for JSON)."""
+        return dict((label, {'wall' : self.wall.get(label),
+                             'draws' : self.draws.get(label, 0),
+                             'stages' : dict((stage, s.asdict()) for stage, s
+                                             in self.stats.get(label,
+                                                               {}).items()),
+                             'sites' : dict((site, s.asdict()) for site, s
+                                            in self.sites.get(label,
+                                                              {}).items())})
+                    for label in self.labels())
+
+    def report(self):
+        """Return a printable table of results for each label."""
+        val = ''
+        for label in self.labels():
+            stats = self.stats.get(label, {})
+            val += "%s" % label
+            if label in self.wall:
+                val += " (%.3fs)" % self.wall[label]
+            val += ": %s random draws\n" % self.draws.get(label, 0)
+            val += "  %-36s %8s %10s %10s %9s\n" % ('Stage', 'calls',
+                                                   'total ms', 'own ms',
+                                                   'draws')
+            ordered = sorted(stats.items(), key=lambda i: -i[1].own)
+            for stage, s in ordered:
+                val += "  %-36s %8d %10.2f %10.2f %9d\n" % (stage, s.calls,
+                       s.total * 1000, s.own * 1000, s.draws)
+            sites = self.sites.get(label, {})
+            if sites:
+                val += "  %-36s %8s %10s %10s  %s\n" % ('Retry site', 'calls',
+                                                      'rejects', 'wasted',
+                                                      'rejects/call')
+            for site, s in sorted(sites.items(), key=lambda i: -i[1].wasted):
+                val += "  %-36s %8d %10d %10d  %s\n" % (site, s.calls,
+                       s.rejects, s.wasted, s.buckets())
+            val += '\n'
+        return val
+
+    def __str__(self):
+        return self.report()
+
+
+class _Label:
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.previous = self.profile.current
+        self.profile.current = self.name
+        self.start = time.perf_counter()
+        return self.profile
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        self.profile.wall[self.name] = self.profile.wall.get(self.name,
+                                                             0) + elapsed
+        self.profile.current = self.previous
+        return False
+
+
+_active = None
+_originals = []   # (owner, attribute, original value)
+
+
+def _timed(stage, func):
+    """Return func wrapped to record calls and time under stage."""
+    def wrapper(*args, **kwargs):
+        profile = _active
+        stat = profile._stat(stage)
+        stat.calls += 1
+        if profile._depth.get(stage):   # recursive call: timed by the outer
+            return func(*args, **kwargs)
+        profile._depth[stage] = 1
+        frame = [stage, 0.0]
+        profile._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            profile._stack.pop()
+            profile._depth[stage] = 0
+            stat = profile._stat(stage)   # label may have changed inside
+            stat.total += elapsed
+            stat.own += elapsed - frame[1]
+            if profile._stack:
+                profile._stack[-1][1] += elapsed
+    wrapper.__name__ = getattr(func, '__name__', stage)
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def _counted(func):
+    """Return a random module function wrapped to count draws."""
+    def wrapper(*args, **kwargs):
+        _active._draw()
+        return func(*args, **kwargs)
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def _replace(owner, attribute, value):
+    _originals.append((owner, attribute, owner.__dict__[attribute]))
+    setattr(owner, attribute, value)
+
+
+def enable(profile=None):
+    """Install instrumentation, recording into profile; return the Profile."""
+    import importlib
+    global _active
+    if _active is not None:
+        raise InstrumentError("Instrumentation is already enabled")
+    _active = profile if profile is not None else Profile()
+    try:
+        for stage, module, classname, method in stages:
+            owner = getattr(importlib.import_module(module), classname)
+            _replace(owner, method, _timed(stage, owner.__dict__[method]))
+        for name in drawfunctions:
+            _replace(random, name, _counted(random.__dict__[name]))
+    except Exception:
+        disable()
+        raise
+    return _active
+
+
+def disable():
+    """Remove all instrumentation; return the Profile it recorded into."""
+    global _active
+    while _originals:
+        (owner, attribute, original) = _originals.pop()
+        setattr(owner, attribute, original)
+    profile, _active = _active, None
+    return profile
+
+
+def enabled():
+    return _active is not None
+
+
+def tally(site):
+    """Return the Tally for one call of a retrying site (a no-op if off)."""
+    if _active is None:
+        return _notally
+    return _active._tally(site)
+
+
+def levelprofile(levels=range(1, 11), rooms=20, difficulty=2, roomclass=None):
+    """Generate rooms for each level under instrumentation; return Profile.
+
+    Results for each level are labelled 'level N'.
+
+    """
+    if roomclass is None:
+        from elvenfire.labyrinth.rooms import Room as roomclass
+    profile = enable()
+    try:
+        for level in levels:
+            with profile.label('level %s' % level):
+                for num in range(1, rooms + 1):
+                    roomclass(level, num, difficulty)
+    finally:
+        disable()
+    return profile
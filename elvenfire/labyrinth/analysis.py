@@ -0,0 +1,291 @@
+import math
+import random
+
+from elvenfire import bonus5odds
+from elvenfire.labyrinth.rooms import Room
+from elvenfire.labyrinth.containers import (containerrolls, treasurerange,
+                                            Pot, UnguardedTreasure)
+from elvenfire.labyrinth.traps import Trap
+from elvenfire.labyrinth.locks import picklevels
+from elvenfire.labyrinth.parties import PCParty, partyclasses
+from elvenfire.creatures.character import PlayerCharacter
+
+
+"""Expected values and risk for randomly generated rooms.
+
+Anything that can be derived directly from the generation tables (number of
+contents, container counts, treasures, lock pick levels) is computed exactly;
+trap damage and creature power depend on long chains of rolls, and are
+estimated by sampling the real generators.
+
+RoomAnalysis  -- all expected values for one room type at one level
+levelreport() -- printable summary for a range of levels
+
+"""
+
+
+# Content groups per room: int(uniform(0, 11)/10 + 1)
+numcontentsodds = {1 : 10 / 11, 2 : 1 / 11}
+
+# Containers per set before doubling: int(4 - sqrt(uniform(0, 16))) + 1
+numcontainersodds = {1 : 7 / 16, 2 : 5 / 16, 3 : 3 / 16, 4 : 1 / 16}
+
+# Each d100 roll of 100 doubles the count and rerolls the type
+doublingfactor = 0.99 / 0.98
+
+# Pots have a lid 30% of the time (d10 > 7)
+potpercentage = 0.3 * Pot.trappercentage[True] + 0.7 * Pot.trappercentage[False]
+
+
+def expected(odds):
+    """Return the expected value of a {result : probability} mapping."""
+    return sum(value * chance for value, chance in odds.items())
+
+
+def rollodds(table, sides=100):
+    """Return {result : probability} for a ((maxroll, result), ...) table."""
+    odds = {}
+    previous = 0
+    for maxroll, result in table:
+        odds[result] = odds.get(result, 0) + (maxroll - previous) / sides
+        previous = maxroll
+    return odds
+
+
+## Containers ##
+
+def meantreasures(cls, options, level):
+    """Return expected treasures in one container, as drawn in containers.py."""
+    (low, high) = treasurerange(cls, level, options.get('type'))
+    return (low + high) / 2
+
+
+def containerset(level, num=None):
+    """Return expected (containers, treasures, locks, armed traps) per set.
+
+    If num is given, the set starts with that many containers (as with the
+    container found by a SpecialArtifact); otherwise the number is random.
+
+    """
+    basenum = num if num is not None else expected(numcontainersodds)
+    containers = treasures = locks = armed = 0
+    previous = 0
+    for maxroll, noun, desc, percentage, cls, options in containerrolls:
+        chance = (maxroll - previous) / 99
+        previous = maxroll
+        if cls is UnguardedTreasure and num is None:
+            count = expected(bonus5odds(level))  # unguarded: never doubled
+        else:
+            count = basenum * doublingfactor
+        if cls is Pot:
+            (percentage, options) = (potpercentage, {})
+        containers += chance * count
+        treasures += chance * count * meantreasures(cls, options, level)
+        armed += chance * count * percentage / 100
+        if options.get('locked'):
+            locks += chance * count
+    return (containers, treasures, locks, armed)
+
+
+## Locks ##
+
+def lockpickodds(level):
+    """Return exact odds of each Lock.picklevel (1 + Bonus5 + Bonus5)."""
+    return dict(picklevels(level).odds)
+
+
+def lockstrength(level, fraction):
+    """Return the Lock.strength found at the given fraction (0..1) of locks.
+
+    Lock strength is int(6 + (level+1)**(1 + 3u)) for a uniform u, so this is
+    an exact inverse of its distribution: lockstrength(level, 0.5) is the
+    median strength.
+
+    """
+    return int(6.0 + (level + 1)**(1.0 + 3.0 * fraction))
+
+
+def expectedlockstrength(level):
+    """Return the exact expected Lock.strength at the given level."""
+    base = level + 1
+    top = base**4
+    # E[int(Z)] = sum over k >= 1 of P(Z >= k), where Z = base**(1 + 3u)
+    total = base
+    for k in range(base + 1, top + 1):
+        total += 1 - (math.log(k) / math.log(base) - 1) / 3
+    return 6 + total
+
+
+## Traps ##
+
+def trapstats(level, samples=1000):
+    """Return sampled averages for traps at the given level.
+
+    The return value is a dictionary with keys detect, remove, avoid and
+    damage, where damage is numdice * diesize (0 for traps with no dice).
+
+    """
+    totals = dict.fromkeys(('detect', 'remove', 'avoid', 'damage'), 0)
+    for i in range(samples):
+        trap = Trap.newtrap(level)
+        totals['detect'] += trap.detect
+        totals['remove'] += trap.remove
+        totals['avoid'] += trap.avoid
+        if trap.numdice is not None:
+            totals['damage'] += trap.numdice * trap.diesize
+    return dict((key, value / samples) for key, value in totals.items())
+
+
+## Creatures ##
+
+def expectedmaxCP(level, difficulty=2):
+    """Return the exact expected value of Room.maxCP()."""
+    return math.sqrt(level) * 30 * 1.3 * (difficulty / 4)
+
+
+def _characterpowers(level, samples):
+    """Return powers of sampled characters as PCParty would create them."""
+    powers = []
+    for i in range(samples):
+        charlevel = 10 * (level - 1) + random.randint(0, 9)
+        powers.append(PlayerCharacter(charlevel=charlevel).stats.power())
+    return powers
+
+
+def _populate(powers, maxCP, attempts=1000):
+    """Imitate _Party._populate() by drawing powers from a sampled list."""
+    total = 0
+    while total < maxCP / 2 and attempts > 0:
+        power = random.choice(powers)
+        if total + power < maxCP:
+            total += power
+        attempts -= 1
+    return total
+
+
+def partypower(level, creaturetype, difficulty=2, roomclass=Room,
+                                                 samples=100):
+    """Return the sampled average total CP of a party of the given type.
+
+    Characters are expensive to generate, so PC parties are assembled from a
+    smaller sample of character powers; other parties are generated in full.
+
+    """
+    room = roomclass.__new__(roomclass)  # only needed for room.maxCP()
+    total = 0
+    if partyclasses[creaturetype] is PCParty:
+        powers = _characterpowers(level, max(10, samples // 4))
+        for i in range(samples):
+            total += _populate(powers, room.maxCP(level, difficulty))
+    else:
+        for i in range(samples):
+            maxCP = room.maxCP(level, difficulty)
+            total += partyclasses[creaturetype](level, maxCP).totalCP
+    return total / samples
+
+
+## Rooms ##
+
+class RoomAnalysis:
+
+    """Expected contents of one type of room at one level.
+
+    Attributes:
+      level, difficulty, roomclass -- the rooms being analyzed
+      contentodds     -- {content type : probability} for each content group
+      creatureodds    -- {creature type : probability} for each party
+      groups          -- expected number of content groups per room
+      containers      -- expected number of containers per room
+      treasures       -- expected number of treasures per room (containers,
+                         unguarded treasures, and special containers)
+      locks           -- expected number of locks per room
+      traps           -- expected number of (potential) traps per room
+      armedtraps      -- expected number of traps that are actually armed,
+                         using the listed trap percentages
+      trap            -- sampled per-trap averages (see trapstats())
+      trapdamage      -- expected numdice * diesize over all traps in a room
+      lockpickodds    -- exact {picklevel : probability} for each lock
+      lockstrength    -- exact expected strength of each lock
+      maxCP           -- exact expected Room.maxCP()
+      partyCP         -- {creature type : sampled average party CP}
+      creatureCP      -- expected total creature power per room
+
+    """
+
+    def __init__(self, level, difficulty=2, roomclass=Room, samples=100):
+        self.level = level
+        self.difficulty = difficulty
+        self.roomclass = roomclass
+        self.contentodds = rollodds(roomclass.contentrolls)
+        self.creatureodds = rollodds(roomclass.creaturerolls)
+        self.groups = expected(numcontentsodds)
+
+        self._analyzecontainers(level)
+        self._analyzetraps(level, samples)
+        self._analyzecreatures(level, difficulty, samples)
+
+    def _pergroup(self, content):
+        """Return the expected number of groups of this content per room."""
+        return self.groups * self.contentodds.get(content, 0)
+
+    def _analyzecontainers(self, level):
+        (containers, treasures, locks, armed) = containerset(level)
+        self.containers = self._pergroup('Containers') * containers
+        self.locks = self._pergroup('Containers') * locks
+        self.armedtraps = self._pergroup('Containers') * armed
+        self.treasures = self._pergroup('Containers') * treasures
+        self.treasures += (self._pergroup('Treasure') *
+                           expected(bonus5odds(level)))
+
+        # 8% of special artifacts are containers, with a set of their own
+        (containers, treasures, locks, armed) = containerset(level, 1)
+        self.containers += self._pergroup('Special') * 0.08 * containers
+        self.locks += self._pergroup('Special') * 0.08 * locks
+        self.armedtraps += self._pergroup('Special') * 0.08 * armed
+        self.treasures += self._pergroup('Special') * 0.08 * treasures
+
+        self.traps = self.containers  # every container has a potential trap
+        self.lockpickodds = lockpickodds(level)
+        self.lockstrength = expectedlockstrength(level)
+
+    def _analyzetraps(self, level, samples):
+        self.trap = trapstats(level, samples * 10)
+        self.trapdamage = self.traps * self.trap['damage']
+
+    def _analyzecreatures(self, level, difficulty, samples):
+        self.maxCP = expectedmaxCP(level, difficulty)
+        self.partyCP = {}
+        self.creatureCP = 0
+        for creaturetype, chance in self.creatureodds.items():
+            power = partypower(level, creaturetype, difficulty,
+                               self.roomclass, samples)
+            self.partyCP[creaturetype] = power
+            self.creatureCP += self._pergroup('Creatures') * chance * power
+
+    def __str__(self):
+        val = "%s analysis, level %s (difficulty %s)\n" % (
+              self.roomclass.__name__, self.level, self.difficulty)
+        val += "  Treasures:  %6.2f\n" % self.treasures
+        val += "  Containers: %6.2f  (%.2f locked)\n" % (self.containers,
+                                                        self.locks)
+        val += "  Traps:      %6.2f  (%.2f armed)\n" % (self.traps,
+                                                       self.armedtraps)
+        val += "  Per trap:   %.1fvIQ detect, %.1fvDx remove," % (
+               self.trap['detect'], self.trap['remove'])
+        val += " %.1fvDx avoid, %.1f dmg\n" % (self.trap['avoid'],
+                                               self.trap['damage'])
+        val += "  Trap damage per room: %.1f\n" % self.trapdamage
+        val += "  Lock pick level: %.2f; strength: %.1f\n" % (
+               expected(self.lockpickodds), self.lockstrength)
+        val += "  Creature power: %.1f (max CP %.1f; " % (self.creatureCP,
+                                                           self.maxCP)
+        val += ", ".join("%s %.1f" % (t, cp) for t, cp in self.partyCP.items())
+        val += ")\n"
+        return val
+
+
+def levelreport(levels=range(1, 11), difficulty=2, roomclass=Room,
+                samples=100):
+    """Return a printable RoomAnalysis summary for each level."""
+    return "\n".join(str(RoomAnalysis(level, difficulty, roomclass, samples))
+                     for level in levels)
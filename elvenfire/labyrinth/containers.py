@@ -9,7 +9,12 @@ from elvenfire.labyrinth.locks import Lock
 
 class ContainerSet:
 
-    """A set of one or more container(s) of a single type."""
+    """A set of one or more container(s) of a single type.
+
+    The type is rolled on containerrolls (see the end of this module).  The
+    traps (and any locks) for all the containers in a set are drawn together.
+
+    """
 
     def __init__(self, level, num=None):
         """Determine number and type of container(s)."""
@@ -23,73 +28,27 @@ class ContainerSet:
             self.num *= 2
             type = random.randint(1, 100)
 
-        if type <= 4:
-            self.desc = "%s on the floor" % s(self.num, 'bag')
-            self.percentage = 15
-            self.containers = [Bag(i, level) for i in range(self.num)]
-        elif type <= 10:
-            self.desc = "%s hanging on the wall" % s(self.num, 'bag')
-            self.percentage = 25
-            self.containers = [Bag(i, level) for i in range(self.num)]
-        elif type <= 13:
-            self.desc = s(self.num, 'unlocked coffer')
-            self.percentage = 60
-            self.containers = [Coffer(i, level, 
-                                      locked=False) for i in range(self.num)]
-        elif type <= 20:
-            self.desc = s(self.num, 'locked coffer')
-            self.percentage = 60
-            self.containers = [Coffer(i, level, 
-                                      locked=True) for i in range(self.num)]
-        elif type <= 23:
-            self.desc = s(self.num, 'open wooden chest')
-            self.percentage = 80
-            self.containers = [Chest(i, level, type="wooden", 
-                                     locked=False) for i in range(self.num)]
-        elif type <= 27:
-            self.desc = s(self.num, 'unlocked wooden chest')
-            self.percentage = 75
-            self.containers = [Chest(i, level, type="wooden", 
-                                     locked=False) for i in range(self.num)]
-        elif type <= 35:
-            self.desc = s(self.num, 'locked wooden chest')
-            self.percentage = 75
-            self.containers = [Chest(i, level, type="wooden", 
-                                     locked=True) for i in range(self.num)]
-        elif type <= 38:
-            self.desc = s(self.num, 'open iron chest')
-            self.percentage = 90
-            self.containers = [Chest(i, level, type="iron", 
-                                     locked=False) for i in range(self.num)]
-        elif type <= 41:
-            self.desc = s(self.num, 'unlocked iron chest')
-            self.percentage = 85
-            self.containers = [Chest(i, level, type="iron", 
-                                     locked=False) for i in range(self.num)]
-        elif type <= 60:
-            self.desc = s(self.num, 'locked iron chest')
-            self.percentage = 80
-            self.containers = [Chest(i, level, type="iron", 
-                                     locked=True) for i in range(self.num)]
-        elif type <= 92:
+        (maxroll, noun, desc, percentage, cls, options) = _containerrows[type]
+        if cls is Pot:
             haslid = random.randint(1, 10) > 7
-            if haslid:
-                lidtext = "lid"
-            else:
-                lidtext = "no lid"
-            style = random.choice(('ceramic pot', 'metal urn', 'stone jar'))
-            self.desc = "%s with %s" % (s(self.num, style), lidtext)
-            self.percentage = 50 if haslid else 60
-            self.containers = [Pot(i, level, type=style, 
-                                   lid=haslid) for i in range(self.num)]
-        else:
-            if num is None:
-                self.num = bonus5(level)  # few unguarded treasures...
-            self.desc = "%s lying invitingly on the floor" % \
-                        s(self.num, 'treasure')
-            self.percentage = 20
-            self.containers = [UnguardedTreasure(i, level, locked=False)
-                               for i in range(self.num)]
+            noun = random.choice(Pot.styles)
+            desc %= ('%s', "lid" if haslid else "no lid")
+            percentage = Pot.trappercentage[haslid]
+            options = {'type' : noun, 'lid' : haslid}
+        elif cls is UnguardedTreasure and num is None:
+            self.num = bonus5(level)  # few unguarded treasures...
+        self.desc = desc % s(self.num, noun)
+        self.percentage = percentage
+        self.containers = self._newcontainers(level, cls, options)
+
+    def _newcontainers(self, level, cls, options):
+        """Return self.num new containers, drawing traps and locks in bulk."""
+        traps = Trap.newtraps(level, self.num)
+        locks = [None] * self.num
+        if options.get('locked'):
+            locks = Lock.newlocks(level, self.num)
+        return [cls(i, level, trap=traps[i], lock=locks[i], **options)
+                for i in range(self.num)]
 
     def __str__(self):
         """Return a description suitable for explanation to the players."""
@@ -115,15 +74,17 @@ class Container:
 
     """Abstract class for single containers."""
 
-    def __init__(self, num, level, getlock=False, gettrap=True):
+    def __init__(self, num, level, getlock=False, gettrap=True, trap=None,
+                 lock=None):
+        """Set up the container; trap and lock may be given, if drawn."""
         self.num = num
         self.name = "Container"
-        self.trap = None
+        self.trap = trap
         self.is_trapped = None  # None indicates nondeterminate (must roll)
-        if gettrap:
+        if gettrap and self.trap is None:
             self.trap = Trap.newtrap(level)
-        self.lock = None
-        if getlock:
+        self.lock = lock
+        if getlock and self.lock is None:
             self.lock = Lock(level)
         self.strength = None
         self.num_treasures = None
@@ -151,40 +112,44 @@ class Container:
 
 class Bag (Container):
 
-    def __init__(self, num, level):
-        Container.__init__(self, num, level)
+    def __init__(self, num, level, trap=None, lock=None):
+        Container.__init__(self, num, level, trap=trap)
         self.name = "Bag"
         self.num_treasures = 1
 
 
 class Coffer (Container):
 
-    def __init__(self, num, level, locked):
-        Container.__init__(self, num, level, getlock=locked)
+    def __init__(self, num, level, locked, trap=None, lock=None):
+        Container.__init__(self, num, level, getlock=locked, trap=trap,
+                           lock=lock)
         self.name = "Coffer"
         self.strength = (40 * level) + random.randint(1, 20 * level)
-        self.num_treasures = random.randint(level, level + 1)
+        self.num_treasures = random.randint(*treasurerange(Coffer, level))
 
 
 class Chest (Container):
 
-    def __init__(self, num, level, type, locked):
-        Container.__init__(self, num, level, getlock=locked)
+    def __init__(self, num, level, type, locked, trap=None, lock=None):
+        Container.__init__(self, num, level, getlock=locked, trap=trap,
+                           lock=lock)
         self.name = "Chest"
         if type == 'wooden':
             self.strength = (20 * level) + random.randint(1, 5 * level)
-            self.num_treasures = random.randint(level, level + 3)
         elif type == 'iron':
             self.strength = (60 * level) + random.randint(1, 30 * level)
-            self.num_treasures = random.randint(level, level + 5)
         else:
             raise '%s chest not implemented!' % type
+        self.num_treasures = random.randint(*treasurerange(Chest, level, type))
 
 
 class Pot (Container):
 
-    def __init__(self, num, level, type, lid):
-        Container.__init__(self, num, level)
+    styles = ('ceramic pot', 'metal urn', 'stone jar')
+    trappercentage = {True : 50, False : 60}  # {has lid : trap chance}
+
+    def __init__(self, num, level, type, lid, trap=None, lock=None):
+        Container.__init__(self, num, level, trap=trap)
         self.name = type.rsplit(' ')[0].capitalize()  # last word only
         if type == 'ceramic pot':
             self.strength = random.randint(1, 4 * level)
@@ -194,13 +159,14 @@ class Pot (Container):
             self.strength = 20 + random.randint(1, 12 * level)
         else:
             raise "'%s' type of Pot not implemented!" % type
-        self.num_treasures = random.randint(1, 2);
+        self.num_treasures = random.randint(*treasurerange(Pot, level))
 
 
 class UnguardedTreasure (Container):
 
-    def __init__(self, num, level, locked):
-        Container.__init__(self, num, level, getlock=locked)
+    def __init__(self, num, level, locked, trap=None, lock=None):
+        Container.__init__(self, num, level, getlock=locked, trap=trap,
+                           lock=lock)
         self.name = "Unguarded Treasure"
         self.num_treasures = 1
 
@@ -214,3 +180,48 @@ class UnguardedTreasure (Container):
         val += "\n" + str(self.trap)
         return val
 
+
+# ((max d100 roll, noun, description, trap %, class, options), ...) used by
+# ContainerSet; pots choose their own noun, trap % and options
+containerrolls = (
+    ( 4, 'bag', "%s on the floor", 15, Bag, {}),
+    (10, 'bag', "%s hanging on the wall", 25, Bag, {}),
+    (13, 'unlocked coffer', "%s", 60, Coffer, {'locked' : False}),
+    (20, 'locked coffer', "%s", 60, Coffer, {'locked' : True}),
+    (23, 'open wooden chest', "%s", 80, Chest,
+         {'type' : 'wooden', 'locked' : False}),
+    (27, 'unlocked wooden chest', "%s", 75, Chest,
+         {'type' : 'wooden', 'locked' : False}),
+    (35, 'locked wooden chest', "%s", 75, Chest,
+         {'type' : 'wooden', 'locked' : True}),
+    (38, 'open iron chest', "%s", 90, Chest,
+         {'type' : 'iron', 'locked' : False}),
+    (41, 'unlocked iron chest', "%s", 85, Chest,
+         {'type' : 'iron', 'locked' : False}),
+    (60, 'locked iron chest', "%s", 80, Chest,
+         {'type' : 'iron', 'locked' : True}),
+    (92, None, "%s with %s", None, Pot, None),
+    (99, 'treasure', "%s lying invitingly on the floor", 20,
+         UnguardedTreasure, {'locked' : False}))
+_containerrows = [None] + [next(row for row in containerrolls  # by d100 roll
+                                if roll <= row[0]) for roll in range(1, 100)]
+
+
+# {class (or (Chest, type)) : (fewest, most treasures, plus level?)}, used by
+# the containers and by labyrinth.analysis; bags and unguarded treasures
+# always hold one, without a roll
+treasureranges = {Bag : (1, 1, False),
+                  Coffer : (0, 1, True),
+                  (Chest, 'wooden') : (0, 3, True),
+                  (Chest, 'iron') : (0, 5, True),
+                  Pot : (1, 2, False),
+                  UnguardedTreasure : (1, 1, False)}
+
+
+def treasurerange(cls, level, type=None):
+    """Return (fewest, most) treasures in a container of cls at level."""
+    (low, high, levelled) = treasureranges[(cls, type) if cls is Chest
+                                           else cls]
+    if levelled:
+        return (level + low, level + high)
+    return (low, high)
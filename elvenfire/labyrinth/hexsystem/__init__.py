@@ -8,6 +8,15 @@ DOWN = 4
 DOWNLEFT = 8
 UPLEFT = 16
 
+# UP is 0, so cannot be seen in a bitmask of sides (e.g. doors); UPSIDE
+# stands for it there, making the six sides, clockwise from UP, the bits
+# 32, 1, 2, 4, 8, 16
+UPSIDE = 32
+
+# Clockwise steps from UP to each direction
+steps = {UP : 0, UPRIGHT : 1, DOWNRIGHT : 2, DOWN : 3, DOWNLEFT : 4,
+         UPLEFT : 5}
+
 
 class HexLoc:
 
@@ -36,7 +45,7 @@ class HexLoc:
 
     def __hash__(self):
         (a, b, c) = self._normalize()
-        return hash(a * 1000) & hash(b * 100) & hash(c * 10)
+        return hash((a, b, c))
 
     def __repr__(self):
         return "HexLoc(%s, %s, %s)" % (self.a, self.b, self.c)
@@ -71,13 +80,12 @@ class HexLoc:
         if a is None: a = self.a
         if b is None: b = self.b
         if c is None: c = self.c
-        a_sign = 0 if a == 0 else math.copysign(1, a)  # cmp(a, 0)
-        c_sign = 0 if c == 0 else math.copysign(1, c)  # cmp(c, 0)
-        if (a_sign == c_sign and a_sign != 0):  # both positive/both negative
-            diff = min(a, c)  # By taking the minimum, we get the most
-            a -= diff         #   negative or the least positive, thus
-            c -= diff         #   guaranteeing that we will end up with
-            b += diff         #   0 for either a or c.
+        # One step up & left and one up & right is one step up, so taking
+        # diff from a and c and adding it to b leaves the same location
+        diff = min(a, c)  # By taking the minimum, we get the most
+        a -= diff         #   negative or the least positive, thus
+        c -= diff         #   guaranteeing that we will end up with
+        b += diff         #   0 for either a or c.
         return (a, b, c)
 
     def normalize(self):
@@ -107,27 +115,25 @@ class HexLoc:
                 self.__class__(self.a, self.b, self.c - 1, True),  # down & left
                 self.__class__(self.a + 1, self.b, self.c, True))  # up & left
 
+    def distance(self):
+        """Return the number of hexes between self and (0, 0, 0)."""
+        (a, b, c) = self._normalize()
+        return max(abs(c - a), abs(a + b), abs(c + b))
+
     def within(self, size):
         """Return boolean indicating if self is within geomorph of given size.
 
         Geomorph is assumed to be centered at (0, 0, 0).
 
         """
-        (a, b, c) = self._normalize()
-        if not (-size <= a <= size and
-                -size <= b <= size and
-                -size <= b <= size):
-            return False
-        return sum([a, b, c]) <= size
+        return self.distance() <= size
 
     def rotate(self, direction, normalize=True):
-        """Rotate self around (0, 0, 0)."""
-        if direction & (UPRIGHT | DOWNLEFT):
-            (self.a, self.b, self.c) = (self.c, self.a, self.b)
-        elif direction & (UPLEFT | DOWNRIGHT):
-            (self.a, self.b, self.c) = (self.b, self.c, self.a)
-        if direction & (DOWN | DOWNLEFT | DOWNRIGHT):
-            (self.a, self.b, self.c) = (-self.a, -self.b, -self.c)
+        """Rotate self around (0, 0, 0), such that UP becomes direction."""
+        for i in range(steps[direction]):
+            # Clockwise, up & left turns up, up turns up & right, and up &
+            # right turns down & right (the reverse of up & left)
+            (self.a, self.b, self.c) = (-self.c, self.a, self.b)
         if normalize:
             self.normalize()
 
@@ -1,7 +1,4 @@
-
-import math
-
-from elvenfire.labyrinth.hexsystem import HexLoc, UPLEFT
+from elvenfire.labyrinth.hexsystem import HexLoc, steps
 
 
 # Hex contents (typically indicated by color)
@@ -22,6 +19,8 @@ class GeomorphHex:
         doors  -- None or bitmask made up of directions containing doors
         secret -- None or bitmask made up of directions containing secret doors
 
+    In doors and secret, the UP side is UPSIDE (see hexsystem).
+
     """
 
     def __init__(self, loc, type=EMPTY, doors=None, secretdoors=None):
@@ -48,7 +47,7 @@ class GeomorphHex:
         if self in geomorph.seen: return []  # already counted self!
         hexes = [self]
         geomorph.seen.append(self)
-        for n in self.neighbors():
+        for n in self.neighbors(geomorph):
             if n not in geomorph.seen and n.type == self.type:
                 hexes += n.getroom(geomorph)
         return hexes
@@ -56,9 +55,10 @@ class GeomorphHex:
     def _rotatedoors(self, doors, direction):
         """Return doors rotated to specified direction."""
         if doors is not None:
-            doors = doors << math.log(direction, 2)
-            while doors > UPLEFT:
-                doors = doors >> math.log(UPLEFT, 2)
+            # Sides run clockwise from bit 5 (UPSIDE) round to bit 4
+            # (UPLEFT), so a clockwise step is a 6-bit rotation left
+            n = steps[direction]
+            doors = ((doors << n) | (doors >> (6 - n))) & 0x3F
         return doors
 
     def rotate(self, direction, includeloc=True):
@@ -0,0 +1,470 @@
+import marshal
+import mmap
+import os
+import struct
+import sys
+
+from elvenfire import ELFError
+from elvenfire.labyrinth.hexsystem import (HexLoc, UPSIDE, UPRIGHT, DOWNRIGHT,
+                                           DOWN, DOWNLEFT, UPLEFT)
+from elvenfire.labyrinth.hexsystem.geomorphs import (Geomorph, GeomorphHex,
+                                                     EMPTY, HALLWAY, SECRET,
+                                                     ROOM_A, ROOM_B)
+
+
+"""Libraries of designed geomorphs, in text and compact binary files.
+
+Geomorphs are designed as text, listing only the hexes that differ from a
+new Geomorph (EMPTY, with a HALLWAY at the center of each edge):
+
+  geomorph 5 Guard Room
+  0 0 0 ROOM_A doors UP DOWN
+  0 1 0 ROOM_A secret UPLEFT
+  end
+
+Each hex line is its (a, b, c) location, its type, and the sides holding
+doors or secret doors, if any.  Lines starting with # are comments.
+
+compile() turns a text library into a binary one, in which every geomorph
+of a library (all of one size) takes a fixed number of bytes: hex types
+packed 4 bits per hex, and doors and secret doors 6 bits per hex (one bit
+per side, as in GeomorphHex.doors).  A size 5 geomorph takes 184 bytes.
+GeomorphLibrary maps such a file into memory and builds each geomorph only
+when it is asked for, so opening a library of thousands is immediate:
+
+  python -m elvenfire.labyrinth.hexsystem.library compile designs.txt designs.geo
+  python -m elvenfire.labyrinth.hexsystem.library check designs.geo
+
+  with GeomorphLibrary('designs.geo') as library:
+      geomorph = library[library.find('Guard Room')]
+      library.validate()        # [(index, problem)] for the whole library
+
+validate() checks the rules that make geomorphs interchangeable (see
+Geomorph) across every geomorph at once, on the packed hex types.
+
+"""
+
+
+class LibraryError (ELFError):
+    pass
+
+
+types = {'EMPTY' : EMPTY, 'HALLWAY' : HALLWAY, 'SECRET' : SECRET,
+         'ROOM_A' : ROOM_A, 'ROOM_B' : ROOM_B}
+
+sides = {'UP' : UPSIDE, 'UPRIGHT' : UPRIGHT, 'DOWNRIGHT' : DOWNRIGHT,
+         'DOWN' : DOWN, 'DOWNLEFT' : DOWNLEFT, 'UPLEFT' : UPLEFT}
+
+_magic = b'ELFGEO1\n'
+_header = struct.Struct('<8sI')   # magic, length of marshalled index
+
+
+## Layout ##
+
+_layouts = {}   # {size : _Layout}
+
+
+class _Layout:
+
+    """Where each hex of a geomorph of one size is found in a packed record.
+
+    Attributes:
+      size    -- geomorph size
+      locs    -- every (a, b, c) location, normalized, in packed order
+      typelen -- bytes of packed hex types
+      doorlen -- bytes of packed doors (and of packed secret doors)
+      border  -- packed types with 0xE at each border hex, 0 elsewhere
+      edges   -- packed types with 0xF at each edge center, 0 elsewhere
+      hallway -- packed types with HALLWAY at each edge center
+
+    A hex is EMPTY or HALLWAY if its type has no bit of 0xE set.
+
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.locs = []
+        for b in range(-size, size + 1):   # the order of Geomorph.hexes
+            self.locs.append((0, b, 0))
+            for x in range(1, (size - b if b >= 0 else size) + 1):
+                self.locs.append((x, b, 0))
+                self.locs.append((0, b, x))
+        self.position = {loc : i for i, loc in enumerate(self.locs)}
+        count = len(self.locs)
+        self.typelen = (count + 1) // 2
+        self.doorlen = (count * 6 + 7) // 8
+        borders = [i for i, loc in enumerate(self.locs)
+                   if HexLoc(*loc).distance() == size]
+        edges = [self.position[(h.loc.a, h.loc.b, h.loc.c)]
+                 for h in Geomorph(size).edgehexes()]
+        self.border = self.packtypes(0xE if i in borders else 0
+                                     for i in range(count))
+        self.edges = self.packtypes(0xF if i in edges else 0
+                                    for i in range(count))
+        self.hallway = self.packtypes(HALLWAY if i in edges else 0
+                                      for i in range(count))
+
+    def packtypes(self, values):
+        """Return hex types packed two to a byte (first hex in the low bits)."""
+        value = 0
+        for i, type in enumerate(values):
+            value |= type << (4 * i)
+        return value.to_bytes(self.typelen, 'little')
+
+    def packdoors(self, values):
+        """Return side bitmasks packed 6 bits to a hex."""
+        value = 0
+        for i, mask in enumerate(values):
+            value |= (mask or 0) << (6 * i)
+        return value.to_bytes(self.doorlen, 'little')
+
+    def unpack(self, data, bits):
+        """Return the list of values packed bits to a hex in data."""
+        value = int.from_bytes(data, 'little')
+        mask = (1 << bits) - 1
+        return [(value >> (bits * i)) & mask for i in range(len(self.locs))]
+
+
+def _layout(size):
+    if size not in _layouts:
+        if not (isinstance(size, int) and size >= 1):
+            raise LibraryError("Invalid geomorph size: %s" % size)
+        _layouts[size] = _Layout(size)
+    return _layouts[size]
+
+
+def pack(geomorph):
+    """Return (types, doors, secret) packed bytes for geomorph."""
+    layout = _layout(geomorph.size)
+    hexes = {(h.loc.a, h.loc.b, h.loc.c) : h
+             for h in geomorph.hexes.values()}
+    try:
+        ordered = [hexes[loc] for loc in layout.locs]
+    except KeyError as e:
+        raise LibraryError("Geomorph has no hex at %s" % (e.args[0],))
+    return (layout.packtypes(h.type for h in ordered),
+            layout.packdoors(h.doors for h in ordered),
+            layout.packdoors(h.secret for h in ordered))
+
+
+def unpack(size, typedata, doordata, secretdata):
+    """Return a new Geomorph built from packed bytes (see pack())."""
+    layout = _layout(size)
+    geomorph = Geomorph.__new__(Geomorph)
+    geomorph.size = size
+    geomorph.seen = []
+    geomorph.hexes = {}
+    for (a, b, c), type, doors, secret in zip(layout.locs,
+                                              layout.unpack(typedata, 4),
+                                              layout.unpack(doordata, 6),
+                                              layout.unpack(secretdata, 6)):
+        loc = HexLoc(a, b, c)
+        geomorph.hexes[loc] = GeomorphHex(loc, type, doors or None,
+                                          secret or None)
+    return geomorph
+
+
+## Validation ##
+
+def _problems(layout, typedata):
+    """Return the interchangeability problems of one geomorph's packed types."""
+    problems = []
+    values = layout.unpack(typedata, 4)
+    for i, loc in enumerate(layout.locs):
+        if values[i] not in types.values():
+            problems.append("Invalid hex type %s at %s" % (values[i], loc))
+    hallway = layout.unpack(layout.hallway, 4)
+    border = layout.unpack(layout.border, 4)
+    for i, loc in enumerate(layout.locs):
+        if hallway[i] and values[i] != HALLWAY:
+            problems.append("No HALLWAY at edge center %s" % (loc,))
+        elif border[i] and values[i] & border[i]:
+            problems.append("%s hex on border at %s" %
+                            (_typename(values[i]), loc))
+    return problems
+
+
+def _typename(type):
+    for name, value in types.items():
+        if value == type:
+            return name
+    return str(type)
+
+
+def check(geomorph):
+    """Return a list of reasons geomorph is not interchangeable (if any)."""
+    return _problems(_layout(geomorph.size), pack(geomorph)[0])
+
+
+# Bytes whose two nibbles are both valid hex types map to 0, others to 1
+_badtypes = bytes(0 if (b & 0xF) in types.values() and
+                       (b >> 4) in types.values() else 1
+                  for b in range(256))
+_nonzero = bytes([0] + [1] * 255)
+
+
+## Files ##
+
+def readtext(file):
+    """Yield (name, Geomorph) for each geomorph in a text library."""
+    geomorph = None
+    for number, line in enumerate(file, 1):
+        words = line.split()
+        if not words or words[0].startswith('#'):
+            continue
+        try:
+            if words[0] == 'geomorph':
+                if geomorph is not None:
+                    raise LibraryError("missing 'end'")
+                name = ' '.join(words[2:])
+                geomorph = Geomorph(int(words[1]))
+            elif words[0] == 'end':
+                if geomorph is None:
+                    raise LibraryError("'end' without 'geomorph'")
+                yield (name, geomorph)
+                geomorph = None
+            elif geomorph is None:
+                raise LibraryError("hex outside a geomorph")
+            else:
+                _readhex(geomorph, words)
+        except (ValueError, IndexError, KeyError):
+            raise LibraryError("Line %d: cannot read %r" % (number, line))
+        except LibraryError as e:
+            raise LibraryError("Line %d: %s" % (number, e))
+    if geomorph is not None:
+        raise LibraryError("Missing 'end' after geomorph '%s'" % name)
+
+
+def _readhex(geomorph, words):
+    loc = HexLoc(int(words[0]), int(words[1]), int(words[2]), normalize=True)
+    if loc not in geomorph.hexes:
+        raise LibraryError("%s is not within a size %d geomorph" %
+                           (loc, geomorph.size))
+    hex = geomorph.hexes[loc]
+    hex.type = types[words[3]]
+    hex.doors = hex.secret = None
+    field = None
+    for word in words[4:]:
+        if word in ('doors', 'secret'):
+            field = word
+        elif field == 'doors':
+            hex.doors = (hex.doors or 0) | sides[word]
+        elif field == 'secret':
+            hex.secret = (hex.secret or 0) | sides[word]
+        else:
+            raise LibraryError("unexpected '%s'" % word)
+
+
+def writetext(items, file):
+    """Write (name, Geomorph) pairs to file as a text library."""
+    for name, geomorph in items:
+        plain = Geomorph(geomorph.size).hexes
+        file.write('geomorph %d %s\n' % (geomorph.size, name))
+        layout = _layout(geomorph.size)
+        hexes = {(h.loc.a, h.loc.b, h.loc.c) : h
+                 for h in geomorph.hexes.values()}
+        for loc in layout.locs:
+            hex = hexes[loc]
+            if (hex.type == plain[HexLoc(*loc)].type and not hex.doors and
+                not hex.secret):
+                continue
+            line = '%d %d %d %s' % (loc + (_typename(hex.type),))
+            for field, mask in (('doors', hex.doors), ('secret', hex.secret)):
+                if mask:
+                    line += ' ' + ' '.join([field] + [s for s, bit in
+                                                      sides.items()
+                                                      if mask & bit])
+            file.write(line + '\n')
+        file.write('end\n\n')
+
+
+def write(items, path):
+    """Write (name, Geomorph) pairs to a binary library; return the count.
+
+    Every geomorph in a library must be of the same size.
+
+    """
+    names = []
+    typedata = bytearray()
+    doordata = bytearray()
+    secretdata = bytearray()
+    size = None
+    for name, geomorph in items:
+        if size is None:
+            size = geomorph.size
+        elif geomorph.size != size:
+            raise LibraryError("'%s' is size %d, not %d like the rest" %
+                               (name, geomorph.size, size))
+        (t, d, s) = pack(geomorph)
+        names.append(name)
+        typedata += t
+        doordata += d
+        secretdata += s
+    if size is None:
+        raise LibraryError("No geomorphs to write")
+
+    # Regions of types, doors, and secret doors follow the index
+    index = marshal.dumps({'size' : size, 'count' : len(names),
+                           'names' : names})
+    temp = path + '.tmp'
+    with open(temp, 'wb') as f:
+        f.write(_header.pack(_magic, len(index)))
+        f.write(index)
+        f.write(typedata)
+        f.write(doordata)
+        f.write(secretdata)
+    os.replace(temp, path)   # never leave a half-written library in place
+    return len(names)
+
+
+def compile(source, path):
+    """Compile a text library into a binary one; return the count."""
+    with open(source) as f:
+        return write(readtext(f), path)
+
+
+class GeomorphLibrary:
+
+    """A binary geomorph library, mapped into memory.
+
+    Attributes:
+      path  -- location of the library file
+      size  -- size of every geomorph in the library
+      names -- name of each geomorph, in library order
+
+    Geomorphs are built from the file on each lookup, so each one returned
+    is new, and may be rotated or changed freely.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            raise LibraryError("Cannot open geomorph library %s" % path)
+        magic, length = _header.unpack_from(self._map)
+        if magic != _magic:
+            self._map.close()
+            raise LibraryError("%s is not a geomorph library" % path)
+        start = _header.size
+        index = marshal.loads(self._map[start:start + length])
+        self.size = index['size']
+        self.names = index['names']
+        self._count = index['count']
+        self._layout = _layout(self.size)
+        self._data = memoryview(self._map)[start + length:]
+        self._types = self._data[:self._count * self._layout.typelen]
+        doors = self._count * self._layout.doorlen
+        self._doors = self._data[len(self._types):len(self._types) + doors]
+        self._secret = self._data[len(self._types) + doors:
+                                  len(self._types) + 2 * doors]
+        if len(self._secret) != doors:
+            self.close()
+            raise LibraryError("%s is truncated" % path)
+        self._byname = None
+
+    def __len__(self):
+        return self._count
+
+    def _record(self, index):
+        if not -self._count <= index < self._count:
+            raise IndexError("geomorph index out of range")
+        if index < 0:
+            index += self._count
+        t = self._layout.typelen
+        d = self._layout.doorlen
+        return (self._types[index * t:(index + 1) * t],
+                self._doors[index * d:(index + 1) * d],
+                self._secret[index * d:(index + 1) * d])
+
+    def __getitem__(self, index):
+        """Return a new Geomorph built from geomorph # index."""
+        return unpack(self.size, *self._record(index))
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def find(self, name):
+        """Return the index of the (first) geomorph called name."""
+        if self._byname is None:
+            self._byname = {}
+            for i, n in enumerate(self.names):
+                self._byname.setdefault(n, i)
+        try:
+            return self._byname[name]
+        except KeyError:
+            raise LibraryError("No geomorph '%s' in %s" % (name, self.path))
+
+    def validate(self):
+        """Return [(index, problem)] for every non-interchangeable geomorph.
+
+        The whole library is checked at once: the packed types are tested
+        against the border and edge masks (see _Layout) as one integer, and
+        for invalid types with one bytes.translate(); only geomorphs that
+        fail are then unpacked, to describe their problems.
+
+        """
+        layout = self._layout
+        types = bytes(self._types)
+        value = int.from_bytes(types, 'little')
+        border = int.from_bytes(layout.border * self._count, 'little')
+        edges = int.from_bytes(layout.edges * self._count, 'little')
+        hallway = int.from_bytes(layout.hallway * self._count, 'little')
+        failed = (value & border & ~edges) | ((value & edges) ^ hallway)
+        failed |= int.from_bytes(types.translate(_badtypes), 'little')
+
+        # Each nonzero byte of failed belongs to a geomorph with a problem
+        flags = failed.to_bytes(len(types), 'little').translate(_nonzero)
+        bad = []
+        position = flags.find(1)
+        while position != -1:
+            bad.append(position // layout.typelen)
+            position = flags.find(1, (bad[-1] + 1) * layout.typelen)
+        return [(i, problem) for i in bad
+                for problem in _problems(layout, self._record(i)[0])]
+
+    def close(self):
+        """Release the memory map (after which the library cannot be used)."""
+        if self._map is None:
+            return
+        for view in ('_types', '_doors', '_secret', '_data'):
+            if hasattr(self, view):
+                getattr(self, view).release()
+        self._map.close()
+        self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(args=None):
+    args = list(sys.argv[1:] if args is None else args)
+    if len(args) == 3 and args[0] == 'compile':
+        print("Wrote %d geomorphs to %s" % (compile(args[1], args[2]),
+                                             args[2]))
+        return 0
+    if len(args) == 2 and args[0] in ('check', 'dump'):
+        with GeomorphLibrary(args[1]) as library:
+            if args[0] == 'dump':
+                writetext(zip(library.names, library), sys.stdout)
+                return 0
+            problems = library.validate()
+            for index, problem in problems:
+                print("%s (#%d): %s" % (library.names[index], index, problem))
+            print("%d geomorphs, %d invalid" %
+                  (len(library), len({i for i, p in problems})))
+            return 1 if problems else 0
+    print("usage: python -m elvenfire.labyrinth.hexsystem.library "
+          "compile source.txt library.geo | check library.geo | "
+          "dump library.geo")
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
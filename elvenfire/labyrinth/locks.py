@@ -1,6 +1,6 @@
 import random
 
-from elvenfire import bonus5
+from elvenfire import bonus5odds, convolve, OddsTable
 from elvenfire.labyrinth import s
 
 
@@ -8,12 +8,19 @@ class Lock:
 
     """A lock, with all necessary die rolls for interaction."""
 
-    def __init__(self, level):
+    def __init__(self, level, picklevel=None):
         """Determine picklevel, strength, and whether the key is present."""
-        self.picklevel = 1 + bonus5(level) + bonus5(level)
+        self.picklevel = picklevel
+        if self.picklevel is None:
+            self.picklevel = picklevels(level).sample()
         exponent = 1.0 + 3.0 * random.random()
         self.strength = int(6.0 + (level + 1)**exponent)
-        self.keyhere = (random.randint(1,50) == 1)
+        self.keyhere = (random.random() < 1 / 50)
+
+    def newlocks(level, count):
+        """Class method: return a list of count new Locks."""
+        return [Lock(level, picklevel)
+                for picklevel in picklevels(level).samples(count)]
 
     def __str__(self):
         """Return a description suitable for explanation to the players."""
@@ -22,3 +29,14 @@ class Lock:
         if self.keyhere:
             val += "\n    Surprisingly, the key is on the floor next to it."
         return val
+
+
+_picklevels = {}   # {level : OddsTable}
+
+def picklevels(level):
+    """Return an OddsTable of Lock.picklevel (1 + Bonus5 + Bonus5)."""
+    if level not in _picklevels:
+        odds = bonus5odds(level)
+        total = convolve({1 : 1.0}, odds, odds)
+        _picklevels[level] = OddsTable(sorted(total.items()))
+    return _picklevels[level]
@@ -1,9 +1,7 @@
 import random
 
-from elvenfire.creatures.character import PlayerCharacter
-from elvenfire.creatures.trainable import TrainableAnimal
-from elvenfire.creatures.nontrainable import NonTrainableCreature
-from elvenfire.creatures.special import SpecialCreature
+from elvenfire.instrument import tally
+
 
 class _Party:
 
@@ -29,11 +27,15 @@ class _Party:
     def _populate(self, level, maxCP):
         """Randomly generate a party with CP between 1/2 maxCP and maxCP."""
         minCP = maxCP / 2
-        while self.totalCP < minCP:
-            creature = self._newcreature(level)
-            power = creature.stats.power()
-            if self.totalCP + power < maxCP:
-                self.addcreature(creature)
+        with tally('_Party._populate') as attempt:
+            while self.totalCP < minCP:
+                creature = self._newcreature(level)
+                power = creature.stats.power()
+                if self.totalCP + power < maxCP:
+                    self.addcreature(creature)
+                    attempt.accept()
+                else:
+                    attempt.reject()
 
     def addcreature(self, creature):
         """Add creature to this party."""
@@ -53,13 +55,26 @@ class _Party:
 
 class PCParty (_Party):
 
-    """A group of player characters - fellow adventurers in the labyrinth!"""
+    """A group of player characters - fellow adventurers in the labyrinth!
+
+    Attributes:
+      pool -- CharacterPool to clone characters from (None to build each
+              one; see elvenfire.creatures.pool)
+
+    """
 
     creaturetype = 'Character'
 
+    def __init__(self, level, maxCP, pool=None):
+        self.pool = pool
+        _Party.__init__(self, level, maxCP)
+
     def _newcreature(self, level):
         """Return a random character of the appropriate level."""
         charlevel = 10 * (level - 1) + random.randint(0, 9)
+        if self.pool is not None:
+            return self.pool.character(charlevel)
+        from elvenfire.creatures.character import PlayerCharacter
         return PlayerCharacter(charlevel=charlevel)
 
 
@@ -75,6 +90,7 @@ class TrainableParty (_Party):
         Multiple calls on the same Party will yield the same creature class.
 
         """
+        from elvenfire.creatures.trainable import TrainableAnimal
         class_ = type = None
         if self.creatures:
             class_ = self.creatures[0].subtype
@@ -95,6 +111,7 @@ class NonTrainableParty (_Party):
         Multiple calls on the same Party will yield the same creature class.
 
         """
+        from elvenfire.creatures.nontrainable import NonTrainableCreature
         class_ = type = None
         if self.creatures:
             class_ = self.creatures[0].subtype
@@ -114,8 +131,16 @@ class SpecialParty (_Party):
         Multiple calls on the same Party will yield the same creature class.
 
         """
+        from elvenfire.creatures.special import SpecialCreature
         class_ = type = None
         if self.creatures:
             class_ = self.creatures[0].subtype
             if class_ is None: type = self.creatures[0].name
-        return SpecialCreature(class_, type)
\ No newline at end of file
+        return SpecialCreature(class_, type)
+
+
+# Party class for each creature type of Room.randomcreaturetype()
+partyclasses = {'PC' : PCParty, 'NPC' : PCParty,
+                'Trainable' : TrainableParty,
+                'Nontrainable' : NonTrainableParty,
+                'Rare' : SpecialParty}
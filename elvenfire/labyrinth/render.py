@@ -0,0 +1,191 @@
+import collections
+import html
+import itertools
+
+from elvenfire import ELFError
+from elvenfire.shards import shardseed
+from elvenfire.streams import iter_rooms
+
+
+"""Write labyrinth levels to files, one room at a time.
+
+A level written as ''.join(str(room) for room in rooms) is held in memory
+whole, and a deep level full of characters runs to tens of megabytes.  The
+functions here write each room as soon as it is made, and flush it, so the
+text in memory at once is a room (or a few chunks of rooms, in parallel):
+
+  with open('level3.html', 'w') as f:
+      renderlevel(f, 3, 500, format='html', workers=4)
+
+  render(streams.iter_rooms(3, count=500), sys.stdout, 'markdown')
+
+Formats (see formats) are plain text, exactly as str(room), Markdown, and
+HTML.  renderlevel() may render rooms in worker processes; each chunk of
+rooms draws from a random stream of its own, seeded from the seed and the
+chunk's number, and chunks are written in order as they finish.  The same
+seed and chunksize give the same file, whatever the number of workers.
+
+"""
+
+
+class RenderError (ELFError):
+    pass
+
+
+class TextFormat:
+
+    """Plain text: each room as str(room), after an optional title."""
+
+    extension = '.txt'
+
+    def header(self, title):
+        if title is None:
+            return ''
+        return '%s\n%s\n\n' % (title, '=' * len(title))
+
+    def room(self, room):
+        return str(room)
+
+    def footer(self):
+        return ''
+
+
+class MarkdownFormat (TextFormat):
+
+    """Markdown: a section for each room; its contents as preformatted text."""
+
+    extension = '.md'
+
+    def header(self, title):
+        if title is None:
+            return ''
+        return '# %s\n\n' % title
+
+    def room(self, room):
+        val = '## %s\n\n' % room.name
+        if room.features is not None:
+            val += 'Features (distribute artistically):\n\n'
+            val += ''.join('- %s\n' % f for f in room.features) + '\n'
+        if room.contents:
+            for content in room.contents:
+                val += '```\n%s\n```\n\n' % str(content).strip('\n')
+        else:
+            val += ('*Nothing is in this room.  Perhaps this would be a good'
+                    ' resting place?*\n\n')
+        return val
+
+
+class HTMLFormat (TextFormat):
+
+    """HTML: a page, with a section for each room."""
+
+    extension = '.html'
+
+    def header(self, title):
+        title = html.escape(title or 'Labyrinth')
+        return ('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+                '<title>%s</title>\n</head>\n<body>\n<h1>%s</h1>\n'
+                % (title, title))
+
+    def room(self, room):
+        val = '<section class="room">\n<h2>%s</h2>\n' % html.escape(room.name)
+        if room.features is not None:
+            val += '<ul class="features">\n'
+            val += ''.join('<li>%s</li>\n' % html.escape(str(f))
+                           for f in room.features)
+            val += '</ul>\n'
+        if room.contents:
+            for content in room.contents:
+                val += '<pre>%s</pre>\n' % html.escape(
+                    str(content).strip('\n'))
+        else:
+            val += ('<p class="empty">Nothing is in this room.  Perhaps this'
+                    ' would be a good resting place?</p>\n')
+        return val + '</section>\n'
+
+    def footer(self):
+        return '</body>\n</html>\n'
+
+
+formats = {'text' : TextFormat, 'markdown' : MarkdownFormat,
+           'html' : HTMLFormat}
+
+
+def _format(format):
+    if format not in formats:
+        raise RenderError("Unknown format '%s'" % format)
+    return formats[format]()
+
+
+def render(rooms, file, format='text', title=None):
+    """Write rooms (any iterable) to file, flushing after each; return count.
+
+    file may be anything with write(); it is flushed if it has flush().
+
+    """
+    template = _format(format)
+    flush = getattr(file, 'flush', None)
+    file.write(template.header(title))
+    count = 0
+    for room in rooms:
+        file.write(template.room(room))
+        count += 1
+        if flush is not None:
+            flush()
+    file.write(template.footer())
+    if flush is not None:
+        flush()
+    return count
+
+
+def _renderchunk(job):
+    """Return the text of one chunk of rooms (run in a worker process)."""
+    (level, difficulty, seed, chunk, start, count, format, roomclass) = job
+    template = _format(format)
+    rooms = iter_rooms(level, difficulty, shardseed(seed, 'level%d' % level,
+                                                    chunk),
+                       count, roomclass, start + 1)
+    return ''.join(template.room(room) for room in rooms)
+
+
+def renderlevel(file, level, count, difficulty=2, seed=None, format='text',
+                workers=1, chunksize=10, roomclass=None, title=None):
+    """Generate count rooms of a level and write them to file; return count.
+
+    Rooms are made chunksize at a time, in workers processes if workers is
+    more than 1, with at most two chunks per worker waiting to be written.
+    title defaults to "Level <level>".
+
+    """
+    template = _format(format)
+    if title is None:
+        title = 'Level %s' % level
+    jobs = ((level, difficulty, seed, chunk, start,
+             min(chunksize, count - start), format, roomclass)
+            for chunk, start in enumerate(range(0, count, chunksize)))
+    flush = getattr(file, 'flush', None)
+    file.write(template.header(title))
+
+    if workers <= 1:
+        for job in jobs:
+            file.write(_renderchunk(job))
+            if flush is not None:
+                flush()
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(workers) as executor:
+            pending = collections.deque(
+                executor.submit(_renderchunk, job)
+                for job in itertools.islice(jobs, 2 * workers))
+            while pending:
+                text = pending.popleft().result()   # in order
+                for job in itertools.islice(jobs, 1):
+                    pending.append(executor.submit(_renderchunk, job))
+                file.write(text)
+                if flush is not None:
+                    flush()
+
+    file.write(template.footer())
+    if flush is not None:
+        flush()
+    return count
@@ -7,9 +7,36 @@ from elvenfire.labyrinth.special import SpecialArtifact
 from elvenfire.labyrinth.containers import ContainerSet
 from elvenfire.labyrinth.parties import *
 
+def _lookuproll(table, roll):
+    """Return the result listed for roll in a ((maxroll, result), ...) table."""
+    for maxroll, result in table:
+        if roll <= maxroll:
+            return result
+    raise ValueError('Roll %s is off the table' % roll)
+
+
 class Room:
 
-    """A labyrinth room, and all of its contents."""
+    """A labyrinth room, and all of its contents.
+
+    Class Attributes:
+      contentrolls  -- ((max d100 roll, content type), ...) used by
+                       randomcontent()
+      creaturerolls -- ((max d100 roll, creature type), ...) used by
+                       randomcreaturetype()
+
+    """
+
+    contentrolls = ((70, 'Creatures'),
+                    (85, 'Containers'),
+                    (90, 'Empty'),
+                    (98, 'Treasure'),
+                    (100, 'Special'))
+
+    creaturerolls = ((18, 'PC'),
+                     (33, 'Trainable'),
+                     (90, 'Nontrainable'),
+                     (100, 'Rare'))
 
     def __init__(self, level, num, difficulty=2):
         """Determine the features and contents of the room."""
@@ -109,20 +136,11 @@ class Room:
 
         Return values: Creatures, Containers, Empty, Treasure, Special
 
-        Override this method to change the odds of finding each type.
+        Override this method (or contentrolls) to change the odds of finding
+        each type.
 
         """
-        roll = random.randint(1, 100)
-        if roll <= 70:
-            return 'Creatures'
-        elif roll <= 85:
-            return 'Containers'
-        elif roll <= 90:
-            return 'Empty'
-        elif roll <= 98:
-            return 'Treasure'
-        else:
-            return 'Special'
+        return _lookuproll(self.contentrolls, random.randint(1, 100))
 
     ## (Creatures) ##
 
@@ -164,22 +182,22 @@ class Room:
 
         Return values: PC, Trainable, Nontrainable, Rare
 
-        Override this method to change the odds of finding each type.
+        Override this method (or creaturerolls) to change the odds of finding
+        each type.
 
         """
-        roll = random.randint(1, 100)
-        if roll <= 18:
-            return 'PC'
-        elif roll <= 33:
-            return 'Trainable'
-        elif roll <= 90:
-            return 'Nontrainable'
-        else:
-            return 'Rare'
+        return _lookuproll(self.creaturerolls, random.randint(1, 100))
 
 
 class SecretRoom (Room):
     """A SecretRoom is a Room that was hidden; containers are most likely."""
+
+    contentrolls = ((12, 'Creatures'),
+                    (70, 'Containers'),
+                    (73, 'Empty'),
+                    (90, 'Treasure'),
+                    (100, 'Special'))
+
     def __init__(self, level, num, difficulty=2):
         Room.__init__(self, level, num, difficulty)
         self.name = "Secret Room %s" % num
@@ -204,22 +222,3 @@ class SecretRoom (Room):
         num += 1 if level < 3 else 2
         if roll <= num: return 8
         return 9
-
-    def randomcontent(self, level):
-        """Determine the type of contents based on a random roll.
-
-        Return values: Creatures, Containers, Empty, Treasure, Special
-
-        """
-        roll = random.randint(1, 100)
-        if roll <= 12:
-            return 'Creatures'
-        elif roll <= 70:
-            return 'Containers'
-        elif roll <= 73:
-            return 'Empty'
-        elif roll <= 90:
-            return 'Treasure'
-        else:
-            return 'Special'
-
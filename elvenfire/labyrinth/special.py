@@ -1,6 +1,6 @@
 import random
 
-from elvenfire.artifacts.written import randomlanguage
+from elvenfire import randomlanguage
 from elvenfire.labyrinth import s
 from elvenfire.labyrinth.containers import ContainerSet
 
@@ -1,12 +1,25 @@
+import bisect
 import random
 import math
 
-from elvenfire import bonus5
+from elvenfire import bonus5, OddsTable
 from elvenfire.labyrinth import s
 
 class Trap:
 
-    """Abstract class used to define common code for all potential Traps."""
+    """Abstract class used to define common code for all potential Traps.
+
+    Class Attributes (for subclasses):
+      sizedie    -- sides of the die rolled for the trap's size, if any
+      difficulty -- ((attribute, x level, plus, spread, + size), ...), where
+                    each attribute (detect, remove, avoid) is set to
+                    int(level * x level + plus - sqrt(uniform(*spread))),
+                    plus size if flagged; see _setdifficulty()
+
+    """
+
+    sizedie = None
+    difficulty = ()
 
     def __init__(self):
         """Initialize all common values to None."""
@@ -18,23 +31,42 @@ class Trap:
 
     def newtrap(level):
         """Class method: generate and return a new Trap of random type."""
-        type = random.randint(1, 100)
-        if type <= 11:
-            return ExplosiveTrap(level)
-        elif type <= 30:
-            return MissileTrap(level)
-        elif type <= 45:
-            return GasTrap(level)
-        elif type <= 55:
-            return LiquidTrap(level)
-        elif type <= 65:
-            return EtherealTrap(level)
-        elif type <= 80:
-            return PitTrap(level)
-        elif type <= 97:
-            return OtherTrap(level)
-        else:
-            return SpecialTrap(level)
+        roll = random.randint(1, 100)
+        for maxroll, trapclass in traprolls:
+            if roll <= maxroll:
+                return trapclass(level)
+
+    def newtraps(level, count):
+        """Class method: return a list of count new Traps of random types.
+
+        Types have the same odds as in newtrap(), but are looked up directly
+        from a uniform draw instead of rolling d100 on traprolls, so this is
+        cheaper than calling newtrap() count times.
+
+        """
+        uniform = random.random
+        return [_trapsbyroll[int(uniform() * 100)](level)
+                for i in range(count)]
+
+    def _setdifficulty(self, level, size=0):
+        """Set the attributes listed in self.difficulty for this level.
+
+        Each square root is read from a precomputed table (see roottable())
+        with one random() draw, in place of sqrt(uniform()); the results are
+        the same, draw for draw.
+
+        """
+        key = (type(self), level, size)
+        if key not in _difficulties:
+            rows = []
+            for attribute, perlevel, plus, spread, sized in self.difficulty:
+                base = level * perlevel + plus + (size if sized else 0)
+                rows.append((attribute, base, roottable(*spread)))
+            _difficulties[key] = rows
+        (find, draw) = (bisect.bisect_right, random.random)
+        for attribute, base, table in _difficulties[key]:
+            setattr(self, attribute,
+                    base - table.results[find(table.bounds, draw())])
 
     def __str__(self):
         """Return a description suitable for explanation to the players."""
@@ -55,13 +87,17 @@ class ExplosiveTrap (Trap):
 
     """Potential trap featuring some type of explosive."""
 
+    sizedie = 3
+    #              attribute x level  plus spread   + size
+    difficulty = (('detect', 2,       4,    (0, 9),  False),
+                  ('remove', 3,       6,    (0, 9),  True),
+                  ('avoid',  1,       4,    (0, 9),  True))
+
     def __init__(self, level):
         """Determine required die rolls and damage."""
         Trap.__init__(self)  # set all variables to None
-        size = random.randint(1,3)
-        self.detect = int(level * 2 + (4 - math.sqrt(random.uniform(0, 9))))
-        self.remove = int(size + level * 3 + (6 - math.sqrt(random.uniform(0, 9))))
-        self.avoid = int(size + level + (4 - math.sqrt(random.uniform(0, 9))))
+        size = random.randint(1, self.sizedie)
+        self._setdifficulty(level, size)
         self.numdice = int(size + level - 1)
         self.diesize = 6
         if size == 3:
@@ -79,13 +115,17 @@ class MissileTrap (Trap):
 
     """Potential trap featuring some form of physical missile weapon."""
 
+    sizedie = 8
+    #              attribute x level  plus spread   + size
+    difficulty = (('detect', 2,       5,    (0, 16), False),
+                  ('remove', 3,       5,    (0, 16), True),
+                  ('avoid',  1,       3,    (1, 4),  True))
+
     def __init__(self, level):
         """Determine required die rolls and damage."""
         Trap.__init__(self)  # set all variables to None
-        size = random.randint(1,8)
-        self.detect = int(level * 2 + (5 - math.sqrt(random.uniform(0, 16))))
-        self.remove = int(size + level * 3 + (5 - math.sqrt(random.uniform(0, 16))))
-        self.avoid = int(size + level + (3 - math.sqrt(random.uniform(1, 4))))
+        size = random.randint(1, self.sizedie)
+        self._setdifficulty(level, size)
         if (size < 3):
             self.numdice = level
             self.diesize = 6
@@ -123,13 +163,17 @@ class GasTrap (Trap):
 
     """Potential trap featuring some type of poison gas."""
 
+    sizedie = 10
+    #              attribute x level  plus spread   + size
+    difficulty = (('detect', 1,       5,    (0, 9),  False),
+                  ('remove', 2,       4,    (0, 9),  False),
+                  ('avoid',  1,       4,    (0, 9),  False))
+
     def __init__(self, level):
         """Determine required die rolls and damage."""
         Trap.__init__(self)  # set all variables to None
-        size = random.randint(1, 10)
-        self.detect = int(1 + level + 4 - math.sqrt(random.uniform(0, 9)))
-        self.remove = int(level * 2 + (4 - math.sqrt(random.uniform(0, 9))))
-        self.avoid = int(level + (4 - math.sqrt(random.uniform(0, 9))))
+        size = random.randint(1, self.sizedie)
+        self._setdifficulty(level, size)
         saving = 3 + level
         self.explanation = "%svSt if triggered to avoid effects" % saving
         self.numdice = self.diesize = None
@@ -180,13 +224,17 @@ class LiquidTrap (Trap):
 
     """Potential trap featuring some type of damaging liquid."""
 
+    sizedie = 10
+    #              attribute x level  plus spread   + size
+    difficulty = (('detect', 2,       4,    (0, 9),  False),
+                  ('remove', 3,       6,    (0, 25), True),
+                  ('avoid',  1,       4,    (0, 9),  True))
+
     def __init__(self, level):
         """Determine required die rolls and damage."""
         Trap.__init__(self)  # set all variables to None
-        size = random.randint(1, 10)
-        self.detect = int(level * 2 + (4 - math.sqrt(random.uniform(0, 9))))
-        self.remove = int(size + level * 3 + (6 - math.sqrt(random.uniform(0, 25))))
-        self.avoid = int(size + level + (4 - math.sqrt(random.uniform(0, 9))))
+        size = random.randint(1, self.sizedie)
+        self._setdifficulty(level, size)
         self.explanation = "armor doesn't protect"
         if size < 6:
             self.name = 'flaming oil'
@@ -210,13 +258,17 @@ class EtherealTrap (Trap):
 
     """Potential trap featuring some type of mental ability."""
 
+    sizedie = 10
+    #              attribute x level  plus spread   + size
+    difficulty = (('detect', 2,       4,    (0, 9),  False),
+                  ('remove', 3,       6,    (0, 25), True),
+                  ('avoid',  1,       4,    (0, 9),  True))
+
     def __init__(self, level):
         """Determine required die rolls and damage."""
         Trap.__init__(self)  # set all variables to None
-        size = random.randint(1, 10)
-        self.detect = int(level * 2 + (4 - math.sqrt(random.uniform(0, 9))))
-        self.remove = int(size + level * 3 + (6 - math.sqrt(random.uniform(0, 25))))
-        self.avoid = int(size + level + (4 - math.sqrt(random.uniform(0, 9))))
+        size = random.randint(1, self.sizedie)
+        self._setdifficulty(level, size)
         if size < 6:
             type = random.choice(('Lightning Bolt', 'Ether Arrow', 'Iceball',
                                   'Fireball', 'Boulder'))
@@ -246,13 +298,17 @@ class PitTrap (Trap):
 
     """Potential trap featuring some type of trapdoor or pit."""
 
+    sizedie = 10
+    #              attribute x level  plus spread   + size
+    difficulty = (('detect', 2,       5,    (0, 16), False),
+                  ('remove', 3,       6,    (0, 25), False),
+                  ('avoid',  2,       3,    (0, 4),  False))
+
     def __init__(self, level):
         """Determine required die rolls and damage."""
         Trap.__init__(self)  # set all variables to None
-        size = random.randint(1, 10)
-        self.detect = int(level * 2 + (5 - math.sqrt(random.uniform(0, 16))))
-        self.remove = int(level * 3 + (6 - math.sqrt(random.uniform(0, 25))))
-        self.avoid = int(level * 2 + (3 - math.sqrt(random.uniform(0, 4))))
+        size = random.randint(1, self.sizedie)
+        self._setdifficulty(level, size)
         depth = 5 * random.randint(1, 2 * level)
         if size < 3:
             self.name = '%s-meter deep empty pit' % depth
@@ -287,13 +343,17 @@ class OtherTrap (Trap):
 
     """Miscellaneous potential trap types."""
 
+    sizedie = 15
+    #              attribute x level  plus spread   + size
+    difficulty = (('detect', 2,       4,    (0, 9),  False),
+                  ('remove', 3,       6,    (0, 25), False),
+                  ('avoid',  1,       4,    (0, 9),  False))
+
     def __init__(self, level):
         """Determine required die rolls and damage."""
         Trap.__init__(self)  # set all variables to None
-        size = random.randint(1, 15)
-        self.detect = int(level * 2 + (4 - math.sqrt(random.uniform(0, 9))))
-        self.remove = int(level * 3 + (6 - math.sqrt(random.uniform(0, 25))))
-        self.avoid = int(level + (4 - math.sqrt(random.uniform(0, 9))))
+        size = random.randint(1, self.sizedie)
+        self._setdifficulty(level, size)
         if size < 8:
             self.name = 'scorpion'
             self.explanation = '50% chance of sting/round trying to pick lock'
@@ -332,12 +392,16 @@ class SpecialTrap (Trap):
 
     """Potential trap featuring some type of special effect."""
 
+    sizedie = None
+    #              attribute x level  plus spread   + size
+    difficulty = (('detect',  4,       4,    (0, 9),  False),
+                  ('remove',  1,       5,    (0, 9),  False),
+                  ('avoid',   1,       5,    (0, 9),  False))
+
     def __init__(self, level):
         """Determine required die rolls and damage."""
         Trap.__init__(self)  # set all variables to None
-        self.detect = int(level * 4 + (4 - math.sqrt(random.uniform(0, 9))))
-        self.remove = int(1 + level + 4 - math.sqrt(random.uniform(0, 9)))
-        self.avoid  = int(1 + level + 4 - math.sqrt(random.uniform(0, 9)))
+        self._setdifficulty(level)
         type = random.randint(1, 10)
         if type <= 4:
             self.name = 'minor disease'
@@ -355,4 +419,53 @@ class SpecialTrap (Trap):
         else:
             self.name = 'lose 1 attribute point'
             self.remove += 1
-            self.avoid += random.randint(1, 2)
\ No newline at end of file
+            self.avoid += random.randint(1, 2)
+
+
+# ((max d100 roll, Trap subclass), ...) used by Trap.newtrap()
+traprolls = (( 11, ExplosiveTrap),
+             ( 30, MissileTrap),
+             ( 45, GasTrap),
+             ( 55, LiquidTrap),
+             ( 65, EtherealTrap),
+             ( 80, PitTrap),
+             ( 97, OtherTrap),
+             (100, SpecialTrap))
+_trapsbyroll = [next(trapclass for maxroll, trapclass in traprolls  # d100-1
+                     if roll <= maxroll) for roll in range(1, 101)]
+
+
+## Difficulty tables ##
+
+_roottables = {}   # {(low, high) : OddsTable}
+_difficulties = {}  # {(class, level, size) : [(attribute, base, table), ...]}
+
+def roottable(low, high):
+    """Return an OddsTable of ceil(sqrt(uniform(low, high))).
+
+    For a whole number n, int(n - sqrt(x)) is n - ceil(sqrt(x)), so this is
+    the random part of every trap difficulty, at any level.  Results are in
+    order of x, so each random() draw gives the result uniform() would.
+
+    """
+    if (low, high) not in _roottables:
+        pairs = []
+        for root in range(math.ceil(math.sqrt(low)),
+                          math.ceil(math.sqrt(high)) + 1):
+            start = max(low, (root - 1) ** 2)
+            end = min(high, root ** 2)
+            pairs.append((root, (end - start) / (high - low)))
+        _roottables[(low, high)] = OddsTable(pairs)
+    return _roottables[(low, high)]
+
+
+def difficulties(level, count):
+    """Return detect, remove, and avoid lists for count new random traps.
+
+    The return value is {'detect' : [...], 'remove' : [...], 'avoid' :
+    [...]}, with one entry per trap, drawn as by Trap.newtraps().
+
+    """
+    traps = Trap.newtraps(level, count)
+    return dict((attribute, [getattr(trap, attribute) for trap in traps])
+                for attribute in ('detect', 'remove', 'avoid'))
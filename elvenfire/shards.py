@@ -0,0 +1,87 @@
+import random
+
+from elvenfire.streams import (StreamError, iter_artifacts, iter_creatures,
+                               iter_rooms)
+
+
+"""The layout of a sharded run: which records each shard generates.
+
+A run of count records of a target (see targets) is divided into shards, and
+each shard is generated on its own, from a seed of its own, so that the same
+seed and shard count give the same records however many processes run them:
+
+shardcount()    -- return the number of shards of a run
+shardspans()    -- divide count records among shards, as [(start, count)]
+shardseed()     -- return the seed of one shard of a run
+targetrecords() -- return the records of one shard, from the feeds of
+                   streams.py
+targetkind()    -- return the export kind of a target's records
+
+cli.py writes each shard to a file of its own; shared.py passes each back
+in shared memory.
+
+"""
+
+
+# Targets of a sharded run, as for cli.generate() and shared.generate()
+targets = ['treasure', 'creatures', 'rooms', 'level']
+
+# Shards of a run unless told otherwise; fixed, rather than one per worker,
+# so that a seeded run gives the same records on any machine
+defaultshards = 8
+
+
+def shardseed(seed, target, shard):
+    """Return the seed for one shard of a run (None if seed is None)."""
+    if seed is None:
+        return None
+    return random.Random('%s/%s/%d' % (seed, target, shard)).getrandbits(64)
+
+
+def shardcount(count, shards=None):
+    """Return shards, or if None the default for a run of count records."""
+    if shards is None:
+        return max(1, min(defaultshards, count))
+    return shards
+
+
+def shardspans(count, shards):
+    """Return [(start, count)] dividing count records among shards."""
+    base, extra = divmod(count, shards)
+    spans = []
+    start = 0
+    for i in range(shards):
+        size = base + (1 if i < extra else 0)
+        spans.append((start, size))
+        start += size
+    return spans
+
+
+def targetrecords(target, seed, start, count, options):
+    """Return an iterable of the records of one shard of target.
+
+    options holds 'kind', 'level' and 'difficulty'.  The shard's records
+    begin at record start of the run (rooms are numbered from start + 1).
+
+    """
+    if target == 'treasure':
+        return iter_artifacts(options['kind'], seed, count)
+    if target == 'creatures':
+        return iter_creatures(options['kind'], seed, count, options['level'])
+    if target == 'rooms':
+        return iter_rooms(options['level'], options['difficulty'], seed,
+                          count, start=start + 1)
+    if target != 'level':
+        raise StreamError("Unknown target '%s'" % target)
+    feeds = []   # level: every level, each from a stream of its own
+    for level in range(1, options['level'] + 1):
+        levelseed = None if seed is None else seed + level
+        feeds.append(iter_rooms(level, options['difficulty'], levelseed,
+                                count, start=start + 1))
+    return (room for feed in feeds for room in feed)
+
+
+def targetkind(target):
+    """Return the export kind of record (see export.py) for target."""
+    return {'treasure' : 'artifacts', 'creatures' : 'creatures'}.get(target,
+                                                                     'rooms')
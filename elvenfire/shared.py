@@ -0,0 +1,323 @@
+import array
+import marshal
+import pickle
+import struct
+from multiprocessing import shared_memory
+
+from elvenfire import ELFError
+from elvenfire import export
+from elvenfire.shards import (targets, shardcount, shardseed, shardspans,
+                              targetrecords, targetkind)
+
+
+"""Generated records passed between processes in shared memory.
+
+Returning Rooms or Characters from a worker process pickles every object in
+them, and unpickles them all again in the parent, which can cost more than
+generating them.  A worker can instead pack its records, in the columns of
+export.py, into a block of shared memory and return only the block's name:
+
+  # in the worker
+  block = pack(rooms, 'rooms')
+  return block.handoff()
+
+  # in the parent
+  with SharedRecords(name) as rooms:
+      CP = rooms.column('partyCP')          # zero-copy view of doubles
+      rooms.row(0)                          # {'roomtype' : 'Room', ...}
+
+Numeric columns are stored whole, so column() returns a memoryview cast to
+int64 or float64 without copying; string columns are decoded one cell at a
+time, only as they are read.  With pack(..., objects=True) each record is
+also pickled into the block, and SharedRecords.object(i) unpickles just
+that record, when (and if) the parent needs the whole object.
+
+generate() runs export's sharded generation (see cli.py) this way.
+
+"""
+
+
+class SharedError (ELFError):
+    pass
+
+
+_magic = b'ELFSHM1\n'
+_header = struct.Struct('<8sI')   # magic, length of marshalled index
+_typecodes = {'int' : 'q', 'float' : 'd'}
+
+
+def pack(records, kind, objects=False, slots=5):
+    """Pack records into a new shared memory block; return the SharedRecords.
+
+    kind is as for export.columns().  If objects is True, each record is
+    pickled as well, for SharedRecords.object().
+
+    """
+    records = list(records)
+    cols = export.columns(kind, slots)
+    rows = list(export.rows(records, kind, slots))
+    blocks = []
+    layout = []
+    for i, (name, type) in enumerate(cols):
+        cells = [row[i] for row in rows]
+        if type == 'str':
+            data = [cell.encode() for cell in cells]
+            blocks.append(_offsets(data).tobytes())
+            blocks.append(b''.join(data))
+        else:
+            blocks.append(array.array(_typecodes[type], cells).tobytes())
+        layout.append((name, type))
+    if objects:
+        data = [pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+                for record in records]
+        blocks.append(_offsets(data).tobytes())
+        blocks.append(b''.join(data))
+
+    # Index: offset of each block, relative to the end of the index
+    starts = []
+    size = 0
+    for block in blocks:
+        starts.append(size)
+        size += len(block)
+    index = marshal.dumps({'kind' : kind, 'count' : len(rows),
+                           'columns' : layout, 'starts' : starts,
+                           'objects' : objects})
+    head = _header.size + len(index)
+    memory = shared_memory.SharedMemory(create=True, size=max(1, head + size))
+    _header.pack_into(memory.buf, 0, _magic, len(index))
+    memory.buf[_header.size:head] = index
+    for start, block in zip(starts, blocks):
+        memory.buf[head + start:head + start + len(block)] = block
+    return SharedRecords(memory=memory)
+
+
+def _offsets(data):
+    """Return array of len(data) + 1 offsets for the concatenated data."""
+    offsets = array.array('Q', [0])
+    total = 0
+    for item in data:
+        total += len(item)
+        offsets.append(total)
+    return offsets
+
+
+class _StringColumn:
+
+    """A read-only sequence of strings, decoded from a block as read."""
+
+    def __init__(self, offsets, heap):
+        self._offsets = offsets
+        self._heap = heap
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return bytes(self._heap[start:end]).decode()
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class SharedRecords:
+
+    """Records packed by pack(), viewed in place in shared memory.
+
+    Attributes:
+      name    -- name of the shared memory block
+      kind    -- kind of record, as for export.columns()
+      columns -- [(name, type)] of the records
+      objects -- boolean indicating if whole objects were packed
+
+    Close (or leave the with block) once finished, after letting go of any
+    views from column(); the parent's close() also frees the block.
+
+    """
+
+    def __init__(self, name=None, memory=None):
+        if memory is None:
+            try:
+                memory = shared_memory.SharedMemory(name)
+            except FileNotFoundError:
+                raise SharedError("No shared records named '%s'" % name)
+        self._memory = memory
+        self.name = memory.name
+        buf = memory.buf
+        magic, length = _header.unpack_from(buf)
+        if magic != _magic:
+            raise SharedError("%s does not hold shared records" % self.name)
+        index = marshal.loads(bytes(buf[_header.size:_header.size + length]))
+        self.kind = index['kind']
+        self.columns = [tuple(col) for col in index['columns']]
+        self.objects = index['objects']
+        self._count = index['count']
+        self._exports = []   # every view of the block, released by close()
+        self._data = self._export(buf[_header.size + length:])
+        self._views = {}
+        self._starts = index['starts']
+        self._pickles = None
+        block = 0
+        for name, type in self.columns:
+            if type == 'str':
+                offsets = self._block(block, 'Q', self._count + 1)
+                heap = self._export(self._data[self._starts[block + 1]:])
+                self._views[name] = _StringColumn(offsets, heap)
+                block += 2
+            else:
+                self._views[name] = self._block(block, _typecodes[type],
+                                                self._count)
+                block += 1
+        if self.objects:
+            self._pickles = (self._block(block, 'Q', self._count + 1),
+                             self._export(self._data[self._starts[block + 1]:]))
+
+    def _export(self, view):
+        self._exports.append(view)
+        return view
+
+    def _block(self, block, typecode, count):
+        start = self._starts[block]
+        width = struct.calcsize(typecode)
+        raw = self._data[start:start + count * width]
+        view = raw.cast(typecode)
+        raw.release()
+        return self._export(view)
+
+    def handoff(self):
+        """Return the block's name, leaving it for another process to free.
+
+        Call this in the worker that packed the records, as it returns.
+
+        """
+        from multiprocessing import resource_tracker
+        name = self.name
+        self._release()
+        # The parent frees the block; stop this process's tracker doing so
+        resource_tracker.unregister(self._memory._name, 'shared_memory')
+        self._memory.close()
+        return name
+
+    def __len__(self):
+        return self._count
+
+    def column(self, name):
+        """Return a column: a memoryview for numbers, or of strings."""
+        try:
+            return self._views[name]
+        except KeyError:
+            raise SharedError("No column '%s' in %s records" %
+                              (name, self.kind))
+
+    def row(self, index):
+        """Return record index as {column : value}."""
+        if not -self._count <= index < self._count:
+            raise IndexError("record index out of range")
+        return {name : self._views[name][index] for name, type in self.columns}
+
+    def __getitem__(self, index):
+        return self.row(index)
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self.row(i)
+
+    def object(self, index):
+        """Return record index as the object packed (see pack())."""
+        if not self.objects:
+            raise SharedError("Objects were not packed with these records")
+        offsets, heap = self._pickles
+        if index < 0:
+            index += self._count
+        return pickle.loads(heap[offsets[index]:offsets[index + 1]])
+
+    def _release(self):
+        for view in reversed(self._exports):
+            view.release()
+        self._exports = []
+        self._views = {}
+        self._pickles = None
+
+    def close(self, unlink=True):
+        """Release the block (and free it, unless unlink is False)."""
+        if self._memory is None:
+            return
+        self._release()
+        self._memory.close()
+        if unlink:
+            self._memory.unlink()
+        self._memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+## Sharded generation ##
+
+def _generateshard(job):
+    """Generate one shard into shared memory; return the block's name."""
+    (target, shard, seed, start, count, objects, options) = job
+    records = targetrecords(target, shardseed(seed, target, shard), start,
+                            count, options)
+    return pack(records, targetkind(target), objects).handoff()
+
+
+def generate(target, count, seed=None, level=1, workers=1, shards=None,
+             objects=False, kind=None, difficulty=2):
+    """Generate records as cli.generate() does; return [SharedRecords].
+
+    Each shard is generated in a worker process and passed back in shared
+    memory; the same seed and shard count give the same records.  If any
+    shard fails, or any block cannot be opened, the blocks of the others are
+    freed and its error raised.
+
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    if target not in targets:
+        raise SharedError("Unknown target '%s'" % target)
+    options = {'level' : level, 'kind' : kind, 'difficulty' : difficulty}
+    spans = shardspans(count, shardcount(count, shards))
+    jobs = [(target, shard, seed, start, size, objects, options)
+            for shard, (start, size) in enumerate(spans)]
+    names = []
+    error = None
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(_generateshard, job) for job in jobs]
+        for future in futures:
+            try:
+                names.append(future.result())
+            except Exception as e:
+                error = error or e
+    if error is not None:
+        for name in names:
+            _unlink(name)
+        raise error
+    blocks = []
+    try:
+        for name in names:
+            blocks.append(SharedRecords(name))
+    except BaseException:
+        for records in blocks:
+            records.close()
+        for name in names[len(blocks):]:
+            _unlink(name)
+        raise
+    return blocks
+
+
+def _unlink(name):
+    """Free a handed-off block that will not be opened."""
+    try:
+        memory = shared_memory.SharedMemory(name)
+    except FileNotFoundError:
+        return
+    memory.close()
+    memory.unlink()
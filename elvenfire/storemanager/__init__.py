@@ -0,0 +1,23 @@
+from elvenfire.mundane import ItemError
+
+__all__ = ['stockitems', 'store']
+
+
+"""Shops: items offered for sale, and indexed store inventories.
+
+stockitems -- _StockItem, and the kind, price, abilities, and ST of items
+store      -- Store, an inventory indexed for price queries
+
+"""
+
+
+class StoreError (ItemError):
+    pass
+
+
+def __getattr__(name):
+    """Import storemanager submodules (see __all__) on first use."""
+    if name in __all__:
+        import importlib
+        return importlib.import_module('%s.%s' % (__name__, name))
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -0,0 +1,100 @@
+from elvenfire.mundane.weapons import MundaneWeapon
+from elvenfire.mundane.armor import MundaneArmor
+from elvenfire.artifacts.combat import Weapon, Armor
+from elvenfire.abilities.itemabilities import WeaponAbility
+from elvenfire.storemanager import StoreError
+
+
+"""Items offered for sale.
+
+A store may hold any artifact, mundane weapon, or armor; the functions
+below give the four things a Store indexes for each item:
+
+  itemkind()      -- 'Weapon', 'Armor', 'Ring', ... (one per class)
+  itemprice()     -- its value, or the cost of mundane armor
+  itemabilities() -- names of its abilities (e.g. 'DX+2', 'Speed 3')
+  requiredST()    -- ST needed to use it (0 for most items)
+
+_StockItem offers them as methods, for classes made to be stocked.
+
+"""
+
+
+def itemkind(item):
+    """Return the kind of item, e.g. 'Weapon' for any weapon."""
+    if isinstance(item, MundaneWeapon):
+        return 'Weapon'   # artifact weapons set itemtype to their type
+    if isinstance(item, MundaneArmor):
+        return 'Armor'
+    return getattr(type(item), 'itemtype', type(item).__name__)
+
+
+def itemprice(item):
+    """Return the fair market value of item."""
+    if hasattr(item, 'value'):
+        return item.value
+    if hasattr(item, 'cost'):   # mundane armor
+        return item.cost
+    raise StoreError("%s has no value; give it a price"
+                     % type(item).__name__)
+
+
+def itemabilities(item):
+    """Return a tuple of the names of item's abilities."""
+    if hasattr(item, 'abilities'):
+        return tuple(str(a) for a in item.abilities)
+    if hasattr(item, 'ability'):   # gems, rods, some potions
+        return (str(item.ability),)
+    return ()
+
+
+def requiredST(item):
+    """Return the ST needed to use item."""
+    return getattr(item, 'reqST', 0) or 0
+
+
+class _StockItem:
+
+    """Abstract class: an item made to be offered for sale.
+
+    Mixed in after an artifact or mundane class, which provides:
+      self.name     -- name (or brief description) of item
+      self.desc     -- long-hand description of item
+      self.value    -- fair market value of item
+      self.itemtype -- class name (sans packages and 'StockItem')
+
+    """
+
+    def kind(self):
+        return itemkind(self)
+
+    def price(self):
+        return itemprice(self)
+
+    def abilitynames(self):
+        return itemabilities(self)
+
+    def requiredST(self):
+        return requiredST(self)
+
+    def special(self):
+        """Return boolean indicating if item has a special weapon ability."""
+        return any(isinstance(a, WeaponAbility)
+                   for a in getattr(self, 'abilities', ()))
+
+    def short(self):
+        """Return a one-line listing: name, (Special), and price."""
+        val = self.name
+        if self.special():
+            val += ' (Special)'
+        return "%s  $%s" % (val, itemprice(self))
+
+
+class WeaponStockItem (Weapon, _StockItem):
+
+    """A Weapon for sale; artifact=False gives a mundane weapon."""
+
+
+class ArmorStockItem (Armor, _StockItem):
+
+    """Armor or a shield for sale; artifact=False gives mundane armor."""
@@ -0,0 +1,201 @@
+import bisect
+import heapq
+import itertools
+
+from elvenfire.storemanager import StoreError
+from elvenfire.storemanager.stockitems import (itemkind, itemprice,
+                                               itemabilities, requiredST)
+
+
+"""Store inventories, indexed for price queries.
+
+A market town may stock tens of thousands of items.  A Store keeps, for
+each (kind, ability, required ST), a list of (price, stock number) sorted
+by price, so that
+
+  store = Store()
+  store.restock(Weapon() for i in range(20000))
+  store.cheapest('Weapon', maxST=11, ability='DX+2')
+  store.find('Ring', low=1000, high=5000)
+
+look only at the head (or a bisected slice) of one list per ST level: a
+few dozen lists at most, however many items are in stock.  Each item is
+listed under its kind and under None (any kind), and under each of its
+abilities and None (any ability).
+
+Adding or selling one item costs a bisect and a list insertion per
+listing; restock() adds many items at once, sorting each list once.
+
+"""
+
+
+class Store:
+
+    """An inventory of items for sale.
+
+    Attributes:
+      name -- name of the store (optional)
+
+    Items are identified by stock number, returned by add() and found in
+    every query result as (number, price, item).
+
+    """
+
+    def __init__(self, name=None, items=()):
+        self.name = name
+        self._stock = {}     # {number : (price, item, listings)}
+        self._lists = {}     # {(kind, ability, reqST) : [(price, number)]}
+        self._levels = {}    # {(kind, ability) : sorted reqSTs listed}
+        self._numbers = itertools.count(1)
+        if items:
+            self.restock(items)
+
+    def __len__(self):
+        return len(self._stock)
+
+    def __contains__(self, number):
+        return number in self._stock
+
+    def __iter__(self):
+        """Yield (number, price, item) for every item, in stock order."""
+        for number, (price, item, listings) in self._stock.items():
+            yield (number, price, item)
+
+    def __getitem__(self, number):
+        try:
+            return self._stock[number][1]
+        except KeyError:
+            raise StoreError("No item #%s in stock" % number)
+
+    def _listings(self, item):
+        """Return every (kind, ability, reqST) key item is listed under."""
+        kind = itemkind(item)
+        ST = requiredST(item)
+        abilities = (None,) + tuple(set(itemabilities(item)))
+        return [(k, a, ST) for k in (kind, None) for a in abilities]
+
+    def _list(self, key):
+        entries = self._lists.get(key)
+        if entries is None:
+            entries = self._lists[key] = []
+            levels = self._levels.setdefault(key[:2], [])
+            bisect.insort(levels, key[2])
+        return entries
+
+    def add(self, item, price=None):
+        """Stock item (at its value, unless price is given); return its #."""
+        if price is None:
+            price = itemprice(item)
+        number = next(self._numbers)
+        listings = self._listings(item)
+        self._stock[number] = (price, item, listings)
+        for key in listings:
+            bisect.insort(self._list(key), (price, number))
+        return number
+
+    def restock(self, items, prices=None):
+        """Stock many items at once; return their stock numbers.
+
+        prices, if given, is a sequence of prices matching items.
+
+        """
+        if prices is None:
+            pairs = [(item, itemprice(item)) for item in items]
+        else:
+            pairs = list(zip(items, prices))
+        numbers = []
+        touched = set()
+        for item, price in pairs:
+            number = next(self._numbers)
+            listings = self._listings(item)
+            self._stock[number] = (price, item, listings)
+            for key in listings:
+                self._list(key).append((price, number))
+            touched.update(listings)
+            numbers.append(number)
+        for key in touched:
+            self._lists[key].sort()
+        return numbers
+
+    def remove(self, number):
+        """Take item # out of stock and return it (e.g. when sold)."""
+        try:
+            price, item, listings = self._stock.pop(number)
+        except KeyError:
+            raise StoreError("No item #%s in stock" % number)
+        entry = (price, number)
+        for key in listings:
+            entries = self._lists[key]
+            del entries[bisect.bisect_left(entries, entry)]
+        return item
+
+    def price(self, number):
+        """Return the price of item #."""
+        try:
+            return self._stock[number][0]
+        except KeyError:
+            raise StoreError("No item #%s in stock" % number)
+
+    def _candidates(self, kind, ability, maxST):
+        """Return the price lists that may hold matching items."""
+        if isinstance(ability, str) or ability is None:
+            ability = (ability,)
+        lists = []
+        for a in ability:
+            levels = self._levels.get((kind, a), ())
+            if maxST is not None:
+                levels = levels[:bisect.bisect_right(levels, maxST)]
+            lists.extend(self._lists[kind, a, ST] for ST in levels)
+        return [entries for entries in lists if entries]
+
+    def _slices(self, kind, maxST, ability, low, high):
+        """Return (entries, start, end) for each price list to search."""
+        slices = []
+        for entries in self._candidates(kind, ability, maxST):
+            start = bisect.bisect_left(entries, (low,))
+            end = len(entries) if high is None else \
+                  bisect.bisect_left(entries, (high,))
+            if start < end:
+                slices.append((entries, start, end))
+        return slices
+
+    def find(self, kind=None, maxST=None, ability=None, low=0, high=None):
+        """Yield (number, price, item) for matching items, cheapest first.
+
+        kind     -- as given by itemkind() (e.g. 'Weapon'); None for any
+        maxST    -- only items usable at this ST (None for any)
+        ability  -- an ability name (e.g. 'DX+2'), or a tuple of names any
+                    of which will do (e.g. ('DX+2', 'DX+3')); None for any
+        low/high -- only prices with low <= price < high (None for no limit)
+
+        An item with more than one matching ability is yielded once.
+
+        """
+        slices = [map(entries.__getitem__, range(start, end))
+                  for entries, start, end in self._slices(kind, maxST,
+                                                          ability, low, high)]
+        seen = set()
+        for price, number in heapq.merge(*slices):
+            if number not in seen:
+                seen.add(number)
+                yield (number, price, self._stock[number][1])
+
+    def cheapest(self, kind=None, maxST=None, ability=None, low=0, high=None):
+        """Return (number, price, item) for the cheapest match, or None."""
+        for match in self.find(kind, maxST, ability, low, high):
+            return match
+        return None
+
+    def count(self, kind=None, maxST=None, ability=None, low=0, high=None):
+        """Return the number of items find() would yield."""
+        slices = self._slices(kind, maxST, ability, low, high)
+        if isinstance(ability, str) or ability is None:
+            # One list per ST level, and each item is listed at one level
+            return sum(end - start for entries, start, end in slices)
+        return len({number for entries, start, end in slices
+                    for price, number in entries[start:end]})
+
+    def kinds(self):
+        """Return the kinds of item in stock."""
+        return sorted({k for (k, a, ST), entries in self._lists.items()
+                       if k is not None and a is None and entries})
@@ -0,0 +1,130 @@
+import itertools
+import random
+
+from elvenfire import ELFError
+from elvenfire.utilities import RandomStream
+
+
+"""Lazy, unbounded feeds of generated rooms, artifacts, and creatures.
+
+iter_rooms()     -- yield Rooms for a labyrinth level, numbered from 1
+iter_artifacts() -- yield artifacts of one kind (or a random mix)
+iter_creatures() -- yield creatures of one kind (or a random mix)
+newartifact()    -- return one artifact of a given kind
+newcreature()    -- return one creature of a given kind
+
+Each feed generates one object at a time, only when the consumer asks for
+it, so memory use does not grow with the number of objects consumed, and
+itertools.islice() (or simply breaking out of a loop) stops generation.
+
+Each feed draws from its own RandomStream: a given seed always produces the
+same sequence, no matter how feeds are interleaved or what the consumer does
+with the random module between items.  With seed=None, the stream is seeded
+from the system as usual.  That holds within one thread: a RandomStream
+swaps the random module's shared state, so a seeded feed is not reproducible
+while another thread generates at the same time (see RandomStream).
+
+"""
+
+
+class StreamError (ELFError):
+    pass
+
+
+artifactkinds = ['Weapon', 'Armor', 'Ring', 'Rod', 'Amulet', 'Gem', 'Potion',
+                 'Scroll', 'Book', 'SpecialArtifact', 'STBattery']
+
+creaturekinds = ['PC', 'Trainable', 'Nontrainable', 'Rare']
+
+
+def newartifact(kind):
+    """Return a single new artifact of the given kind (see artifactkinds)."""
+    return _artifactkind(kind)()
+
+
+def _artifactkind(kind):
+    """Return the registered class for kind, if kind is in artifactkinds."""
+    from elvenfire.artifacts import artifactclass
+    if kind not in artifactkinds:
+        raise StreamError("Unknown artifact kind '%s'" % kind)
+    return artifactclass(kind)
+
+
+def newcreature(kind, level):
+    """Return a single new creature of the given kind."""
+    if kind == 'PC' or kind == 'NPC':
+        from elvenfire.creatures.character import PlayerCharacter
+        charlevel = 10 * (level - 1) + random.randint(0, 9)  # as in PCParty
+        return PlayerCharacter(charlevel=charlevel)
+    elif kind == 'Trainable':
+        from elvenfire.creatures.trainable import TrainableAnimal
+        return TrainableAnimal()
+    elif kind == 'Nontrainable':
+        from elvenfire.creatures.nontrainable import NonTrainableCreature
+        return NonTrainableCreature()
+    elif kind == 'Rare':
+        from elvenfire.creatures.special import SpecialCreature
+        return SpecialCreature()
+    raise StreamError("Unknown creature kind '%s'" % kind)
+
+
+def _feed(make, seed, count):
+    """Yield make() up to count times (forever if None) from a seeded stream.
+
+    The stream is in use only while make() runs; any other thread drawing
+    from random then shares its draws (see RandomStream).
+
+    """
+    stream = RandomStream(seed)
+    produced = 0
+    while count is None or produced < count:
+        with stream:
+            item = make()
+        produced += 1
+        yield item  # outside the stream; the consumer's random is its own
+
+
+def iter_rooms(level, difficulty=2, seed=None, count=None, roomclass=None,
+               start=1):
+    """Yield rooms for the given labyrinth level, one at a time.
+
+    Rooms are numbered consecutively from start.  roomclass defaults to Room;
+    SecretRoom (or any Room subclass) may be given instead.
+
+    """
+    if roomclass is None:
+        from elvenfire.labyrinth.rooms import Room as roomclass
+    numbers = itertools.count(start)
+    return _feed(lambda: roomclass(level, next(numbers), difficulty),
+                 seed, count)
+
+
+def iter_artifacts(kind=None, seed=None, count=None):
+    """Yield artifacts of the given kind (see artifactkinds), one at a time.
+
+    If kind is None, each artifact is of a kind chosen at random.
+
+    """
+    if kind is not None:
+        return _feed(_artifactkind(kind), seed, count)
+    classes = [_artifactkind(k) for k in artifactkinds]
+    return _feed(lambda: random.choice(classes)(), seed, count)
+
+
+def iter_creatures(kind=None, seed=None, count=None, level=1):
+    """Yield creatures of the given kind (see creaturekinds), one at a time.
+
+    Kinds match Room.randomcreaturetype(); level only affects the character
+    level of PCs.  If kind is None, each kind is chosen with the same odds
+    as in a Room.
+
+    """
+    if kind is not None:
+        if kind not in creaturekinds and kind != 'NPC':
+            raise StreamError("Unknown creature kind '%s'" % kind)
+        return _feed(lambda: newcreature(kind, level), seed, count)
+    from elvenfire.labyrinth.rooms import Room
+    room = Room.__new__(Room)  # only needed for randomcreaturetype()
+    return _feed(lambda: newcreature(room.randomcreaturetype(level), level),
+                 seed, count)
+
@@ -0,0 +1,300 @@
+import marshal
+import mmap
+import os
+import struct
+import sys
+
+from elvenfire import ELFError
+
+
+"""Precompiled binary cache of the large data tables.
+
+The creature, weapon, and ability description tables are written as Python
+literals in elvenfire.data, and those literals remain the only source of
+truth.  build() compiles them into a single binary file:
+
+  python -m elvenfire.tables build           # once, after editing a table
+  python -m elvenfire.tables check           # report any stale tables
+
+Each class loads its table with load() as it is defined.  If the cache file
+(cachepath) exists and the table is current there, the class gets a
+read-only view of the file, and the literal's module is never imported;
+otherwise the module is imported and the class gets the literal, so a
+missing or stale cache is never wrong, only slow.
+
+The file is opened with mmap, so every process using the same cache shares
+one copy of the pages.  Rows are unmarshalled only when first used, and then
+kept, so a worker's private memory only holds the rows it has actually
+drawn.
+
+"""
+
+
+class TableError (ELFError):
+    pass
+
+
+#         name                          module                          attribute          loaded by
+sources = [('nontrainable.animals',     'elvenfire.data.nontrainable',  'animals'),        # NonTrainableCreature.animals
+           ('trainable.animals',        'elvenfire.data.trainable',     'animals'),        # TrainableAnimal.animals
+           ('special.creatures',        'elvenfire.data.special',       'creatures'),      # SpecialCreature.creatures
+           ('weapons.weaponlistings',   'elvenfire.data.weapons',       'weaponlistings'), # MundaneWeapon.weaponlistings
+           ('physical.abilitydescs',    'elvenfire.data.charabilities', 'physicaldescs'),  # PhysicalAbility.abilitydescs
+           ('mental.abilitydescs',      'elvenfire.data.charabilities', 'mentaldescs')]    # MentalAbility.abilitydescs
+
+defaultpath = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           'tables.bin')
+
+# The cache file load() reads; None to always use the literals.  Set it
+# before importing the classes whose tables should come from another file.
+cachepath = defaultpath
+
+_magic = b'ELFTBL1\n'
+_header = struct.Struct('<8sI')   # magic, length of marshalled index
+
+
+class CachedTable:
+
+    """A read-only list of rows, unmarshalled from a mapped file on demand.
+
+    Supports len(), indexing, iteration, and comparison with a list, which is
+    all the generators ask of their tables (random.choice() and list
+    comprehensions included).
+
+    """
+
+    def __init__(self, buffer, offsets):
+        self._buffer = buffer
+        self._offsets = offsets
+        self._rows = [None] * (len(offsets) - 1)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        row = self._rows[index]
+        if row is None:
+            if index < 0:
+                index += len(self._rows)
+            start, end = self._offsets[index], self._offsets[index + 1]
+            row = marshal.loads(self._buffer[start:end])
+            self._rows[index] = row
+        return row
+
+    def __iter__(self):
+        for i in range(len(self._rows)):
+            yield self[i]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, CachedTable)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+
+class CachedMapping:
+
+    """A dict of values unmarshalled from a mapped file on every lookup.
+
+    Used for long descriptions, which are read rarely.  Entries may be added
+    (MentalAbilityWithOpposites adds descriptions for its pairs); they are
+    kept in an ordinary dict in front of the cached ones.
+
+    """
+
+    def __init__(self, buffer, index):
+        self._buffer = buffer
+        self._index = index        # {key : (start, end)}
+        self._added = {}
+
+    def __len__(self):
+        return len(self._index) + len([k for k in self._added
+                                       if k not in self._index])
+
+    def __contains__(self, key):
+        return key in self._added or key in self._index
+
+    def __getitem__(self, key):
+        if key in self._added:
+            return self._added[key]
+        start, end = self._index[key]
+        return marshal.loads(self._buffer[start:end])
+
+    def __setitem__(self, key, value):
+        self._added[key] = value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def keys(self):
+        return list(self._index) + [k for k in self._added
+                                    if k not in self._index]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def __eq__(self, other):
+        if isinstance(other, (dict, CachedMapping)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+
+def _source(module):
+    """Return the path of a module's source file, without importing it."""
+    import importlib.util
+    return importlib.util.find_spec(module).origin
+
+
+def _stamp(module):
+    """Return (mtime_ns, size) identifying the current source of a module."""
+    info = os.stat(_source(module))
+    return (info.st_mtime_ns, info.st_size)
+
+
+def _table(name):
+    for source in sources:
+        if source[0] == name:
+            return source
+    raise TableError("Unknown table '%s'" % name)
+
+
+def _literal(name):
+    """Return the named table's literal, importing its module."""
+    import importlib
+    (name, module, attribute) = _table(name)
+    return getattr(importlib.import_module(module), attribute)
+
+
+def build(path=None):
+    """Compile every table in sources into a cache file; return its path."""
+    path = path or defaultpath
+    index = {}
+    chunks = []
+    size = 0
+    for name, module, attribute in sources:
+        value = _literal(name)
+        if isinstance(value, dict):
+            entries = {}
+            for key, item in value.items():
+                data = marshal.dumps(item)
+                entries[key] = (size, size + len(data))
+                chunks.append(data)
+                size += len(data)
+            index[name] = ('mapping', entries, _stamp(module))
+        else:
+            offsets = [size]
+            for row in value:
+                data = marshal.dumps(row)
+                chunks.append(data)
+                size += len(data)
+                offsets.append(size)
+            index[name] = ('table', tuple(offsets), _stamp(module))
+
+    # Offsets are relative to the end of the index, which comes first
+    header = marshal.dumps(index)
+    temp = path + '.tmp'
+    with open(temp, 'wb') as f:
+        f.write(_header.pack(_magic, len(header)))
+        f.write(header)
+        for data in chunks:
+            f.write(data)
+    os.replace(temp, path)   # never leave a half-written cache in place
+    return path
+
+
+class TableCache:
+
+    """An open, memory-mapped cache file.
+
+    Attributes:
+      path  -- location of the cache file
+      index -- {name : (kind, offsets, stamp)} as written by build()
+
+    """
+
+    def __init__(self, path=None):
+        self.path = path or defaultpath
+        try:
+            with open(self.path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            raise TableError("Cannot open table cache %s" % self.path)
+        magic, length = _header.unpack_from(self._map)
+        if magic != _magic:
+            raise TableError("%s is not a table cache" % self.path)
+        start = _header.size
+        self.index = marshal.loads(self._map[start:start + length])
+        self._data = memoryview(self._map)[start + length:]
+
+    def stale(self, name):
+        """Return boolean indicating if the named table's source changed."""
+        module = _table(name)[1]
+        return tuple(self.index[name][2]) != _stamp(module)
+
+    def get(self, name):
+        """Return a CachedTable or CachedMapping view of the named table."""
+        if name not in self.index:
+            raise TableError("Table '%s' is not in %s" % (name, self.path))
+        kind, offsets, stamp = self.index[name]
+        if kind == 'mapping':
+            return CachedMapping(self._data, offsets)
+        return CachedTable(self._data, offsets)
+
+
+_caches = {}   # {path : TableCache, or None if it could not be opened}
+
+
+def _cache(path):
+    if path not in _caches:
+        try:
+            _caches[path] = TableCache(path)
+        except TableError:
+            _caches[path] = None
+    return _caches[path]
+
+
+def load(name):
+    """Return the named table, from the cache file if it is current there.
+
+    Otherwise (no cache file, or the table's source has changed since it
+    was built) the literal is imported from elvenfire.data.
+
+    """
+    cache = _cache(cachepath) if cachepath is not None else None
+    if cache is not None and name in cache.index and not cache.stale(name):
+        return cache.get(name)
+    return _literal(name)
+
+
+def main(args=None):
+    args = list(sys.argv[1:] if args is None else args)
+    if not args or args[0] not in ('build', 'check'):
+        print("usage: python -m elvenfire.tables build|check [path]")
+        return 2
+    path = args[1] if len(args) > 1 else None
+    if args[0] == 'build':
+        print("Wrote %s" % build(path))
+        return 0
+    cache = TableCache(path)
+    stale = [name for name, module, attribute in sources
+             if name not in cache.index or cache.stale(name)]
+    for name in stale:
+        print("stale: %s" % name)
+    return 1 if stale else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,6 @@
+import random
+import threading
+
 
 def wrapped(text, length=76, indent=0):
 
@@ -17,4 +20,136 @@ def wrapped(text, length=76, indent=0):
         wrapped.append(line)
 
     return '\n'.join(wrapped)
-        
\ No newline at end of file
+        
+
+class RandomStream:
+
+    """A private, reproducible stream of random numbers.
+
+    Every generator in this package draws from the global random module.  A
+    RandomStream keeps its own state, and swaps that state into the random
+    module only while it is in use:
+
+      stream = RandomStream(seed)
+      with stream:
+          room = Room(1, 1)
+
+    Separate streams may be interleaved freely without affecting each other,
+    or the caller's own use of random.  A stream must not be entered from two
+    threads at once.
+
+    The state swapped in is the random module's own, shared by every thread:
+    while a stream is in use, any other thread drawing from random (aio's
+    executor, or an ItemPool refilling) draws from the stream too.  A seed is
+    only reproducible while no other thread is generating; to generate in
+    parallel reproducibly, use processes (see cli.generate()).
+
+    """
+
+    def __init__(self, seed=None):
+        self.state = random.Random(seed).getstate()
+        self._saved = None
+
+    def __enter__(self):
+        self._saved = random.getstate()
+        random.setstate(self.state)
+        return self
+
+    def __exit__(self, *exc):
+        self.state = random.getstate()
+        random.setstate(self._saved)
+        self._saved = None
+        return False
+
+
+class _ScriptedDraws:
+
+    """Draws for the random module's generator that follow a path.
+
+    path lists the index taken at each draw; draws beyond it take index 0,
+    extending the path.  widths records the number of choices at each draw.
+    A random() draw chooses among steps equally likely values, the
+    midpoints of steps equal parts of [0, 1).  Draws from any thread but
+    the one that made the script are passed to the generator as usual.
+
+    """
+
+    def __init__(self, generator, path, steps=100):
+        self.path = path
+        self.steps = steps
+        self.widths = []
+        self.thread = threading.get_ident()
+        cls = type(generator)
+        self._randbelow = cls._randbelow.__get__(generator)
+        self._random = cls.random.__get__(generator)
+
+    def _pick(self, width):
+        depth = len(self.widths)
+        if depth == len(self.path):
+            self.path.append(0)
+        self.widths.append(width)
+        return self.path[depth]
+
+    def randbelow(self, n):
+        if threading.get_ident() != self.thread:
+            return self._randbelow(n)
+        return self._pick(n)
+
+    def random(self):
+        if threading.get_ident() != self.thread:
+            return self._random()
+        return (self._pick(self.steps) + 0.5) / self.steps
+
+
+_scripting = threading.Lock()   # one enumeration at a time
+
+
+def outcomes(func, key=str, steps=100):
+    """Return [(result, probability)] for every result func() can return.
+
+    func is run once for each path its draws can take; results with the
+    same key() are merged (the first is kept).  func must make only a modest
+    number of paths.
+
+    While func runs, the generator behind the random module's functions
+    draws from a script on this thread instead of from its state, much as a
+    RandomStream swaps its own state in; the module's functions themselves
+    are untouched, and other threads draw from the generator as usual.
+    Every draw made through the generator's methods is scripted: choice(),
+    randint() and randrange() take each index in turn, and draws from
+    random() (in uniform(), for instance) take one of steps evenly spaced
+    values, so results that turn on a fine threshold are approximate.
+    random.random() itself is bound directly to the generator's own draw,
+    and is not scripted; func must not call it.
+
+    """
+    generator = random._inst   # behind random.choice(), random.randint(), ...
+    merged = {}
+    path = []
+    with _scripting:
+        try:
+            while True:
+                script = _ScriptedDraws(generator, path, steps)
+                generator._randbelow = script.randbelow
+                generator.random = script.random
+                result = func()
+                chance = 1.0
+                for width in script.widths:
+                    chance /= width
+                k = key(result)
+                if k in merged:
+                    merged[k][1] += chance
+                else:
+                    merged[k] = [result, chance]
+
+                # Advance to the next path, like an odometer
+                path = path[:len(script.widths)]
+                while path and path[-1] + 1 == script.widths[len(path) - 1]:
+                    path.pop()
+                if not path:
+                    break
+                path[-1] += 1
+        finally:
+            generator.__dict__.pop('_randbelow', None)
+            generator.__dict__.pop('random', None)
+    return [tuple(pair) for pair in merged.values()]
@@ -0,0 +1,15 @@
+import sys
+
+from benchmarks.runner import main
+
+
+"""Run the benchmark suite (see benchmarks/runner.py for options).
+
+  python run_all_benchmarks.py --json before.json
+  python run_all_benchmarks.py --compare before.json
+
+"""
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,67 @@
+import asyncio
+import subprocess
+import sys
+import time
+import unittest
+from elvenfire.aio import *
+from elvenfire.aio import _runbatch
+from elvenfire.labyrinth.parties import *
+from elvenfire.streams import StreamError
+
+
+class TestRunBatch(unittest.TestCase):
+
+    def testresults(self):
+        """Run a batch, returning results and errors in order."""
+        results = _runbatch([('artifact', ('Gem',), None),
+                             ('artifact', ('Wand',), None),
+                             ('creature', ('Trainable', 1), None)])
+        self.assertEqual([ok for ok, result in results], [True, False, True])
+        self.assertEqual(type(results[0][1]).__name__, 'Gem')
+        self.assertTrue(isinstance(results[1][1], StreamError))
+
+    def testdeadline(self):
+        """Skip work whose deadline has passed."""
+        [(ok, result)] = _runbatch([('room', (1, 1, 2, None),
+                                     time.time() - 1)])
+        self.assertFalse(ok)
+        self.assertTrue(isinstance(result, GenerationTimeout))
+
+
+class TestGenerator(unittest.TestCase):
+
+    def _run(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def testtreasure(self):
+        """Generate several artifacts in batches, to verify none are lost."""
+        gen = Generator(batchsize=3)
+        items = self._run(gen.treasure(7, 'Ring'))
+        self.assertEqual(len(items), 7)
+        for item in items:
+            self.assertEqual(type(item).__name__, 'Ring')
+
+    def testparty(self):
+        """Generate a party of each creature type, within its maximum CP."""
+        gen = Generator()
+        for creaturetype, cls in partyclasses.items():
+            if cls is PCParty:
+                continue   # characters are slow; covered by the mapping
+            party = self._run(gen.party(creaturetype, 2, 60))
+            self.assertTrue(isinstance(party, cls))
+            self.assertTrue(30 <= party.totalCP < 60)
+
+    def testerror(self):
+        """Request an unknown kind, which raises in the caller."""
+        gen = Generator()
+        self.assertRaises(StreamError, self._run, gen.artifact('Wand'))
+
+    def testpartyimports(self):
+        """Generate a party without importing the analysis module."""
+        code = ("import asyncio, sys\n"
+                "from elvenfire import aio\n"
+                "asyncio.run(aio.party('Trainable', 1, 30))\n"
+                "print('elvenfire.labyrinth.analysis' in sys.modules)\n")
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                capture_output=True, text=True).stdout
+        self.assertEqual(output.strip(), 'False')
@@ -0,0 +1,91 @@
+import random
+import unittest
+from elvenfire.labyrinth.analysis import *
+from elvenfire.labyrinth.containers import ContainerSet
+from elvenfire.labyrinth.locks import Lock
+
+
+class TestOdds(unittest.TestCase):
+
+    def testexpected(self):
+        """Verify the expected value of a few simple distributions."""
+        self.assertEqual(expected({1 : 0.5, 3 : 0.5}), 2)
+        self.assertAlmostEqual(expected(numcontainersodds), 1.875)
+
+    def testrollodds(self):
+        """Convert a d100 roll table to odds that total 1."""
+        odds = rollodds(((10, 'a'), (50, 'b'), (90, 'a'), (100, 'c')))
+        self.assertAlmostEqual(odds['a'], 0.5)
+        self.assertAlmostEqual(odds['b'], 0.4)
+        self.assertAlmostEqual(odds['c'], 0.1)
+        for table in (Room.contentrolls, Room.creaturerolls):
+            self.assertAlmostEqual(sum(rollodds(table).values()), 1)
+
+
+class TestSimulation(unittest.TestCase):
+
+    """Compare computed expectations with the generators they describe."""
+
+    def setUp(self):
+        random.seed(26)
+
+    def assertClose(self, actual, expected, tolerance):
+        self.assertTrue(abs(actual - expected) <= tolerance * expected,
+                        "%s is not within %s of %s" %
+                        (actual, tolerance, expected))
+
+    def testcontainerset(self):
+        """Verify expected containers, treasures and locks per set."""
+        for level in (1, 3, 6):
+            sets = [ContainerSet(level) for i in range(3000)]
+            (containers, treasures, locks, armed) = containerset(level)
+            self.assertClose(sum(len(s.containers) for s in sets) / 3000,
+                             containers, 0.05)
+            self.assertClose(sum(c.num_treasures or 0 for s in sets
+                                 for c in s.containers) / 3000,
+                             treasures, 0.05)
+            self.assertClose(sum(c.lock is not None for s in sets
+                                 for c in s.containers) / 3000, locks, 0.1)
+            self.assertClose(sum(s.percentage * len(s.containers) / 100
+                                 for s in sets) / 3000, armed, 0.05)
+
+    def testtreasures(self):
+        """Draw each container's treasures evenly from its table's range."""
+        for level in (1, 4):
+            for (cls, options) in [row[4:] for row in containerrolls]:
+                if cls is Pot:
+                    options = {'type' : 'metal urn', 'lid' : False}
+                counts = [cls(0, level, **options).num_treasures
+                          for i in range(400)]
+                self.assertEqual((min(counts), max(counts)),
+                                 treasurerange(cls, level,
+                                               options.get('type')))
+                self.assertClose(sum(counts) / 400,
+                                 meantreasures(cls, options, level), 0.1)
+
+    def testlocks(self):
+        """Verify exact lock odds against generated locks."""
+        for level in (1, 4, 8):
+            odds = lockpickodds(level)
+            self.assertAlmostEqual(sum(odds.values()), 1)
+            locks = [Lock(level) for i in range(10000)]
+            self.assertClose(sum(l.picklevel for l in locks) / 10000,
+                             expected(odds), 0.03)
+            self.assertClose(sum(l.strength for l in locks) / 10000,
+                             expectedlockstrength(level), 0.05)
+            strengths = sorted(l.strength for l in locks)
+            self.assertClose(strengths[5000], lockstrength(level, 0.5), 0.1)
+
+    def testmaxCP(self):
+        """Verify the expected maximum CP against Room.maxCP()."""
+        room = Room.__new__(Room)
+        for level in (1, 5):
+            mean = sum(room.maxCP(level, 2) for i in range(5000)) / 5000
+            self.assertClose(mean, expectedmaxCP(level), 0.05)
+
+    def testroomanalysis(self):
+        """Analyze a room type, to ensure no errors occur."""
+        analysis = RoomAnalysis(2, samples=5)
+        self.assertTrue(analysis.traps >= analysis.armedtraps > 0)
+        self.assertAlmostEqual(sum(analysis.lockpickodds.values()), 1)
+        self.assertTrue('level 2' in str(analysis))
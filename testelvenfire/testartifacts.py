@@ -0,0 +1,193 @@
+import random
+import threading
+import time
+import unittest
+from elvenfire.artifacts import ArtifactError, registry, artifactclass
+from elvenfire.artifacts.pool import *
+from elvenfire.artifacts.values import *
+
+
+class TestArtifactClass(unittest.TestCase):
+
+    def testregistry(self):
+        """Look up each artifact class by its item type."""
+        from elvenfire.artifacts.greater import Ring
+        from elvenfire.artifacts.combat import Weapon
+        from elvenfire.artifacts.potion import HealingPotion
+        self.assertTrue(artifactclass('Ring') is Ring)
+        self.assertTrue(artifactclass('Weapon') is Weapon)
+        self.assertTrue(artifactclass('HealingPotion') is HealingPotion)
+        for itemtype, cls in registry.items():
+            self.assertEqual(cls.itemtype, itemtype)
+            self.assertFalse(cls.__name__.startswith('_'))
+
+    def teststockitems(self):
+        """Register the artifact, not its stock item, for an item type."""
+        from elvenfire.artifacts.combat import Weapon
+        from elvenfire.storemanager.stockitems import WeaponStockItem
+        self.assertEqual(WeaponStockItem.itemtype, 'Weapon')
+        self.assertTrue(artifactclass('Weapon') is Weapon)
+
+    def testcreate(self):
+        """Create an artifact of each registered type."""
+        for itemtype in list(registry):
+            cls = artifactclass(itemtype)
+            self.assertTrue(isinstance(cls(), cls))
+
+    def testinvalid(self):
+        """Ask for an unknown item type, to generate an error."""
+        self.assertRaises(ArtifactError, artifactclass, 'Wand')
+        self.assertRaises(ArtifactError, artifactclass, '_Artifact')
+
+
+class TestItemPool(unittest.TestCase):
+
+    def _wait(self, condition, timeout=5):
+        end = time.time() + timeout
+        while not condition() and time.time() < end:
+            time.sleep(0.01)
+        return condition()
+
+    def testhitsandmisses(self):
+        """Serve from a filled queue, then generate once it is empty."""
+        pool = ItemPool(kinds=['Ring'], size=3)
+        pool.fill()
+        self.assertEqual(len(pool._queues['Ring', None]), 3)
+        for i in range(5):
+            self.assertEqual(type(pool.get('Ring')).__name__, 'Ring')
+        stats = pool.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (3, 2))
+        self.assertEqual(stats['bytype'], {'Ring' : (3, 2)})
+        pool.clearstats()
+        self.assertEqual(pool.stats()['hitrate'], None)
+
+    def testbands(self):
+        """Return items in the band asked for, keeping others queued."""
+        pool = ItemPool(kinds=['Amulet'], size=4, bands=(1000, 5000))
+        for band in (0, 1, 2, None):
+            for i in range(5):
+                item = pool.get('Amulet', band=band)
+                if band is not None:
+                    self.assertEqual(pool.band(item.value), band)
+        self.assertRaises(ArtifactError, pool.get, 'Amulet', band=3)
+        self.assertRaises(ArtifactError, pool.get, 'Ring')
+        self.assertRaises(ArtifactError, ItemPool, ['Wand'])
+
+    def testthread(self):
+        """Refill in the background after requests empty a queue."""
+        with ItemPool(kinds=['Potion'], size=4, idle=0.01) as pool:
+            self.assertTrue(self._wait(lambda: len(pool) >= 4))
+            for i in range(4):
+                pool.get('Potion')
+            self.assertTrue(self._wait(
+                lambda: len(pool._queues['Potion', None]) == 4))
+            self.assertTrue(self._wait(lambda: pool.stats()['refills'] >= 1))
+        self.assertTrue(pool._thread is None)
+
+    def testerrors(self):
+        """Count a refill that raises, and keep the thread running."""
+        class Failing (ItemPool):
+            failures = 2
+            def refill(self):
+                if self.failures:
+                    self.failures -= 1
+                    raise ValueError('refill %s' % self.failures)
+                return ItemPool.refill(self)
+        with Failing(kinds=['Gem'], size=2, idle=0.01) as pool:
+            self.assertTrue(self._wait(lambda: len(pool) >= 2))
+            stats = pool.stats()
+            self.assertEqual(stats['errors'], 2)
+            self.assertEqual(str(stats['lasterror']), 'refill 0')
+
+    def testconcurrent(self):
+        """Take items from several threads while the pool refills."""
+        pool = ItemPool(kinds=['Ring', 'Gem'], size=4, idle=0.001)
+        taken = []
+        def take():
+            for i in range(30):
+                taken.append(pool.get('Gem' if i % 2 else 'Ring'))
+        with pool:
+            threads = [threading.Thread(target=take) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        stats = pool.stats()
+        self.assertEqual(len(taken), 120)
+        self.assertEqual(len(set(map(id, taken))), 120)
+        self.assertEqual(stats['hits'] + stats['misses'], 120)
+        self.assertEqual(stats['errors'], 0)
+        self.assertTrue(stats['generated'] >= stats['misses'] + len(pool))
+
+
+class TestValueIndex(unittest.TestCase):
+
+    def testtables(self):
+        """Table every ability of each tabled type, with odds summing to 1."""
+        for itemtype in tabled:
+            table = abilitytable(itemtype)
+            self.assertAlmostEqual(sum(table.odds.values()), 1.0)
+        self.assertRaises(ArtifactError, abilitytable, 'Weapon')
+
+    def testrange(self):
+        """Draw artifacts within each range, agreeing with the odds."""
+        for itemtype in ('Ring', 'Weapon'):
+            index = ValueIndex(itemtype, size=2000)
+            self.assertEqual(index.odds(), 1.0)
+            for (low, high) in ((0, 1000), (1000, 20000), (20000, None)):
+                odds = index.odds(low, high)
+                share = len([value for value in index._values
+                             if value >= low and
+                                (high is None or value < high)]) / 2000
+                self.assertEqual(odds, share)
+                for i in range(5 if odds else 0):
+                    item = index.artifact(low, high)
+                    self.assertTrue(isinstance(item, index.cls))
+                    self.assertTrue(low <= item.value)
+                    self.assertTrue(high is None or item.value < high)
+            self.assertTrue(index.attempts >= index.found >= 10)
+
+    def testfresh(self):
+        """Generate each artifact anew, with abilities of its own."""
+        random.seed(11)
+        index = ValueIndex('Ring', size=2000)
+        rings = [index.artifact(50000) for i in range(20)]
+        self.assertEqual(len(set(map(str, rings))), 20)
+        abilities = [id(a) for ring in rings for a in ring.abilities]
+        self.assertEqual(len(set(abilities)), len(abilities))
+        shared = set(map(id, index.table.results))
+        self.assertFalse(shared & set(abilities))
+
+    def testmaxtries(self):
+        """Give up after maxtries attempts, or on an empty range."""
+        index = ValueIndex('Amulet')
+        self.assertRaises(ArtifactError, index.artifact, 10 ** 12,
+                          maxtries=50)
+        self.assertEqual((index.attempts, index.found), (50, 0))
+        self.assertEqual(index.odds(10 ** 12), 0.0)
+        self.assertEqual(index.odds(100, 100), 0.0)
+        self.assertRaises(ArtifactError, index.artifact, 100, 100)
+        self.assertEqual(index.attempts, 50)
+
+    def testseed(self):
+        """Reproduce a sample and its draws from the same seed."""
+        drawn = []
+        for i in range(2):
+            random.seed(8)
+            index = ValueIndex('Book', size=300)
+            drawn.append([str(index.artifact(500)) for j in range(3)] +
+                         [index.odds(500)])
+        self.assertEqual(drawn[0], drawn[1])
+
+    def testthread(self):
+        """Build an index while an ItemPool thread generates alongside."""
+        with ItemPool(kinds=['Ring'], size=8, idle=0.001) as pool:
+            index = ValueIndex('Scroll', size=500)
+            item = index.artifact(0, 5000)
+            self.assertTrue(item.value < 5000)
+            pool.get('Ring')
+        self.assertEqual(pool.stats()['errors'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -415,6 +415,58 @@ class TestMentalAbilityWithOpposites(unittest.TestCase):
 
 
 
+class TestAbilitySet(unittest.TestCase):
+
+    def setUp(self):
+        (self.primary, self.opposite) = sorted(
+            MentalAbilityWithOpposites.pairs.items())[0]
+        self.pairname = '%s [+ %s]' % (self.primary, self.opposite)
+
+    def testoffer(self):
+        """Offer abilities, keeping only the best of each duplicate."""
+        abilities = AbilitySet()
+        self.assertEqual(abilities.offer(MentalAbility(self.primary, 2)), 2)
+        self.assertEqual(abilities.offer(MentalAbility(self.primary, 2)), None)
+        self.assertEqual(abilities.offer(MentalAbility(self.primary, 1)), None)
+        self.assertEqual(abilities.offer(MentalAbility(self.primary, 4)), 2)
+        self.assertEqual(list(map(str, abilities)),
+                         ['%s 4' % self.primary])
+        self.assertEqual(abilities.IIQ, 4)
+
+    def testpairs(self):
+        """Offer singles against a known pair, which includes either one."""
+        pair = MentalAbilityWithOpposites(self.pairname, 3)
+        abilities = AbilitySet([PhysicalAbility('Thrown Weapons', 1), pair])
+        self.assertEqual(abilities.IIQ, 5)
+        single = MentalAbility(self.opposite, 3)   # only equal IIQs duplicate
+        self.assertEqual(abilities.duplicates(single), [pair])
+        self.assertEqual(abilities.offer(single), None)
+        self.assertEqual(abilities.offer(MentalAbility(self.primary, 1)), 1)
+        self.assertEqual(len(abilities), 3)
+
+    def testmatchesscan(self):
+        """Offer random abilities, agreeing with a scan of every ability."""
+        abilities = AbilitySet()
+        for i in range(300):
+            ability = PhysicalOrMentalAbility()
+            scanned = [a for a in abilities if a.duplicate(ability)]
+            self.assertEqual(abilities.duplicates(ability), scanned)
+            self.assertEqual(ability in abilities,
+                             any(a == ability for a in abilities))
+            abilities.offer(ability)
+        self.assertEqual(abilities.IIQ, sum(map(IIQcost, abilities)))
+
+    def testremove(self):
+        """Remove an ability, and one that is absent, to generate an error."""
+        ability = PhysicalAbility('Thrown Weapons', 2)
+        abilities = AbilitySet([ability])
+        self.assertRaises(AbilityError, abilities.remove,
+                          PhysicalAbility('Thrown Weapons', 2))
+        abilities.remove(ability)
+        self.assertEqual((len(abilities), abilities.IIQ), (0, 0))
+        self.assertEqual(abilities.duplicates(ability), [])
+
+
 class TestFactories(unittest.TestCase):
 
     def testrandomability(self):
@@ -427,6 +479,43 @@ class TestFactories(unittest.TestCase):
         for i in range(100):
             UniversityAbility()
 
+class TestKey(unittest.TestCase):
+
+    def testkey(self):
+        """Key each new ability by its name, as str() gives it."""
+        for cls in (PhysicalAbility, MentalAbility,
+                    MentalAbilityWithOpposites):
+            for i in range(200):
+                ability = cls()
+                self.assertEqual(ability._key, str(ability))
+
+    def testequal(self):
+        """Hash and compare equal abilities, built apart, as equal."""
+        for cls in (PhysicalAbility, MentalAbility,
+                    MentalAbilityWithOpposites):
+            for i in range(200):
+                ability = cls()
+                other = cls(ability.name, ability.IIQ, ability.element)
+                self.assertEqual(ability, other)
+                self.assertEqual(hash(ability), hash(other))
+                self.assertEqual(len({ability, other}), 1)
+
+    def testdistinct(self):
+        """Key abilities differing only by element or opposite apart."""
+        abilities = [MentalAbilityWithOpposites('Proof', 2, element)
+                     for element in MentalAbility.elements['Proof']]
+        abilities += [MentalAbilityWithOpposites('Proof [+ Sensitize]', 2,
+                                                 'Fire'),
+                      MentalAbilityWithOpposites('Sensitize', 2, 'Fire'),
+                      MentalAbilityWithOpposites('Aid', 2),
+                      MentalAbilityWithOpposites('Drain', 2),
+                      MentalAbilityWithOpposites('Aid', opposite=True,
+                                                 IIQ=2),
+                      PhysicalAbility('Literacy', 2, 'Elvish'),
+                      PhysicalAbility('Literacy', 2, 'Dwarvish')]
+        self.assertEqual(len({a._key for a in abilities}), len(abilities))
+        self.assertEqual(len(set(abilities)), len(abilities))
+
 
 if __name__ == '__main__':
     unittest.main()
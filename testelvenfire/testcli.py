@@ -0,0 +1,122 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from elvenfire.cli import *
+
+
+class TestGenerate(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _read(self, results):
+        contents = []
+        for path, written, seconds in results:
+            with open(path) as f:
+                contents.append(f.read())
+        return contents
+
+    def testshards(self):
+        """Write count records into one file per shard."""
+        results = generate('treasure', 10, seed=1, shards=3, out=self.dir)
+        self.assertEqual([os.path.basename(path)
+                          for path, written, seconds in results],
+                         ['treasure-00000.jsonl', 'treasure-00001.jsonl',
+                          'treasure-00002.jsonl'])
+        self.assertEqual([written for path, written, seconds in results],
+                         [4, 3, 3])
+        for text, (path, written, seconds) in zip(self._read(results),
+                                                  results):
+            self.assertEqual(len(text.splitlines()), written)
+
+    def testseed(self):
+        """Write the same files from the same seed, however many workers."""
+        first = self._read(generate('creatures', 8, seed=2, level=3,
+                                    shards=2, out=os.path.join(self.dir, 'a')))
+        second = self._read(generate('creatures', 8, seed=2, level=3,
+                                     workers=2, shards=2,
+                                     out=os.path.join(self.dir, 'b')))
+        self.assertEqual(first, second)
+        third = self._read(generate('creatures', 8, seed=3, level=3,
+                                    shards=2, out=os.path.join(self.dir, 'c')))
+        self.assertNotEqual(first, third)
+
+    def testdefault(self):
+        """Write the same default shards, however many workers."""
+        first = generate('treasure', 20, seed=5,
+                         out=os.path.join(self.dir, 'a'))
+        second = generate('treasure', 20, seed=5, workers=3,
+                          out=os.path.join(self.dir, 'b'))
+        self.assertEqual(len(first), defaultshards)
+        self.assertEqual(self._read(first), self._read(second))
+        self.assertEqual(len(generate('treasure', 3, out=self.dir)), 3)
+
+    def testlevel(self):
+        """Write rooms for every level, numbered on across shards."""
+        results = generate('level', 3, seed=4, level=2, shards=2,
+                           format='csv', out=self.dir)
+        self.assertEqual([written for path, written, seconds in results],
+                         [4, 2])
+        text = self._read(results)
+        self.assertTrue(text[0].startswith('roomtype,'))
+
+    def testerrors(self):
+        """Generate an unknown target or format, to generate an error."""
+        self.assertRaises(CLIError, generate, 'dragons', 1, out=self.dir)
+        self.assertRaises(CLIError, generate, 'rooms', 1, format='xls',
+                          out=self.dir)
+
+
+class TestMain(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _main(self, args):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), \
+             contextlib.redirect_stderr(stderr):
+            status = main(args)
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def testgenerate(self):
+        """Run the generate command, reporting each shard."""
+        status, out, err = self._main(['generate', 'rooms', '--count', '5',
+                                       '--seed', '6', '--workers', '1',
+                                       '--shards', '2', '--out', self.dir])
+        self.assertEqual(status, 0)
+        self.assertTrue(out.startswith('Wrote 5 records to 2 files'))
+        self.assertEqual(len(err.splitlines()), 2)
+        self.assertEqual(sorted(os.listdir(self.dir)),
+                         ['rooms-00000.jsonl', 'rooms-00001.jsonl'])
+
+    def testbadkind(self):
+        """Run generate with an unknown kind, to report an error."""
+        status, out, err = self._main(['generate', 'treasure', '--count', '1',
+                                       '--workers', '1', '--kind', 'Wand',
+                                       '--out', self.dir])
+        self.assertEqual(status, 1)
+        self.assertTrue(err.startswith('error: '))
+
+    def testrender(self):
+        """Run the render command into a file."""
+        path = os.path.join(self.dir, 'level.md')
+        status, out, err = self._main(['render', '2', '--count', '3',
+                                       '--seed', '7', '--format', 'markdown',
+                                       '--out', path])
+        self.assertEqual(status, 0)
+        with open(path) as f:
+            self.assertTrue(f.read().startswith('#'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -176,6 +176,36 @@ class TestWeapon(unittest.TestCase):
         self.assertEqual(w.secondaryweapon.abilities, [DX])
         self.assertEqual(w.primaryweapon.abilities, [ST])
         self.assertEqual(w.abilities, [ST, CHANGLING, DX])
+
+    def testchanglingprimary(self):
+        """The primary of a Changling matches the weapon built on its own."""
+        CHANGLING = WeaponAbility('Changling')
+        DX = AttributeAbility('DX', 1)
+        for type in ('Broadsword', 'Arbalest'):
+            w = Weapon(type=type, abilities=[CHANGLING, DX])
+            built = Weapon(type=type, abilities=[CHANGLING, DX],
+                           secondary=True)
+            self.assertEqual(w.primaryweapon.value, built.value)
+            self.assertEqual(w.primaryweapon.itemtype, built.itemtype)
+            self.assertEqual(str(w.primaryweapon),
+                             str(Weapon(type=type, abilities=[DX],
+                                        secondary=True)))
+            self.assertFalse(w.primaryweapon.abilities is w.abilities)
+            self.assertFalse(w.primaryweapon.changling)
+
+    def testguidedreplacement(self):
+        """Replace Guided on a set melee type with a type not yet present."""
+        GUIDED = WeaponAbility('Guided')
+        FLAMING = WeaponAbility('Flaming')
+        for i in range(50):
+            w = Weapon(type='Broadsword')
+            w.abilities = [GUIDED, FLAMING]
+            w._handlespecials(True, True, False, None)
+            types = [a.type for a in w.abilities]
+            self.assertEqual(len(types), 2)
+            self.assertEqual(len(set(types)), 2)
+            self.assertFalse('Guided' in types)
+            self.assertTrue('Flaming' in types)
         
 
     # Moved to StockItem:
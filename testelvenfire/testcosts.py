@@ -0,0 +1,66 @@
+import random
+import unittest
+from elvenfire.abilities import AbilityError
+from elvenfire.abilities.costs import *
+from elvenfire.abilities.costs import _abilities
+from elvenfire.artifacts import ArtifactError
+from elvenfire.artifacts.values import appraise
+
+
+class TestCosts(unittest.TestCase):
+
+    def testtables(self):
+        """Table each family as its abilities cost when built."""
+        for family in families:
+            keyed = table(family)
+            self.assertTrue(keyed)
+            for key, ability in _abilities(family):
+                self.assertEqual(keyed[key], ability.AC)
+                self.assertEqual(AC(family, *key), ability.AC)
+                self.assertEqual(namedAC(family, str(ability)), ability.AC)
+
+    def testlookup(self):
+        """Look up abilities by name, level and element."""
+        self.assertEqual(AC('Mental', 'Lightning Bolt', 2),
+                         2 * AC('Mental', 'Lightning Bolt', 1))
+        self.assertEqual(AC('Attribute', 'DX', 2), namedAC('Attribute', 'DX+2'))
+        self.assertTrue(table('Amulet') is table('Amulet'))
+
+    def testerrors(self):
+        """Look up an unknown family or ability, to generate an error."""
+        self.assertRaises(AbilityError, table, 'Divine')
+        self.assertRaises(AbilityError, AC, 'Mental', 'Lightning Bolt', 9)
+        self.assertRaises(AbilityError, AC, 'Weapon', 'Enhanced')
+        self.assertRaises(AbilityError, namedAC, 'Attribute', 'DX+9')
+
+
+class TestAppraise(unittest.TestCase):
+
+    def testartifacts(self):
+        """Appraise artifacts from their abilities' ACs, as they are worth."""
+        from elvenfire.artifacts.greater import Ring
+        from elvenfire.artifacts.written import Book
+        random.seed(10)
+        for cls in (Ring, Book):
+            for i in range(100):
+                item = cls()
+                ACs = [ability.AC for ability in item.abilities]
+                self.assertEqual(appraise(cls.itemtype, ACs,
+                                          getattr(item, 'language',
+                                                  'Common')),
+                                 item.value)
+
+    def testnamed(self):
+        """Appraise a ring that is never built."""
+        one = appraise('Ring', [namedAC('Attribute', 'DX+1')])
+        two = appraise('Ring', [namedAC('Attribute', 'DX+1'),
+                                namedAC('Attribute', 'DX+1')])
+        self.assertTrue(0 < one < two)
+
+    def testerrors(self):
+        """Appraise an artifact not valued by its abilities."""
+        self.assertRaises(ArtifactError, appraise, 'Potion', [1000])
+
+
+if __name__ == '__main__':
+    unittest.main()
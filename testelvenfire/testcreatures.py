@@ -0,0 +1,134 @@
+import random
+import unittest
+from elvenfire.creatures.basics import *
+from elvenfire.creatures.character import *
+from elvenfire.creatures.pool import *
+from elvenfire.labyrinth.parties import PCParty
+
+
+class TestStatSet(unittest.TestCase):
+
+    def _stats(self, ST, DX, IQ):
+        """Return a Skeleton's StatSet (base IQ 0), raised to ST, DX, IQ."""
+        stats = StatSet(16, 12, 0, 9, 10, [11.5], randomize=False)
+        (stats.ST, stats.DX, stats.IQ) = (ST, DX, IQ)
+        return stats
+
+    def testlevel(self):
+        """Verify the effective level of stats raised above their bases."""
+        self.assertEqual(self._stats(16, 12, 0).level(), 0)
+        self.assertEqual(self._stats(18, 12, 0).level(), 2)
+        self.assertEqual(self._stats(34, 12, 0).level(), 18 + 2)
+
+    def testzerobase(self):
+        """Raise a stat with a base of 0, which must not loop forever."""
+        self.assertEqual(self._stats(16, 12, 1).level(), 1)
+        self.assertEqual(self._stats(16, 12, 2).level(), 2 + 1)
+
+
+class TestCharacter(unittest.TestCase):
+
+    def testrandom(self):
+        """Ensure that characters can be randomly generated without errors."""
+        for i in range(100):
+            c = PlayerCharacter()
+            self.assertTrue(sum(a.IIQ for a in c.abilities) <= c.stats.IQ)
+
+    def testnoIIQremaining(self):
+        """Add a required ability once IIQ is spent, which adds nothing."""
+        c = PlayerCharacter()
+        count = len(list(c.abilities))
+        self.assertEqual(c._addability(0, 'Thrown Weapons', physical=True), 0)
+        self.assertEqual(len(list(c.abilities)), count)
+
+    def testaddabilitycap(self):
+        """Draw abilities that are always refused, to generate an error."""
+        class Refusing (AbilitySet):
+            def offer(self, ability):
+                return None
+        c = PlayerCharacter()
+        c.abilities = Refusing(c.abilities)
+        self.assertRaises(AbilityError, c._addability, 5)
+        self.assertEqual(c._addability(5, 'Thrown Weapons', physical=True), 5)
+
+
+class TestCharacterPool(unittest.TestCase):
+
+    def testfill(self):
+        """Build size templates per band, then only clone them."""
+        pool = CharacterPool(size=3, renew=0)
+        pool.fill([10, 15, 20])
+        self.assertEqual((len(pool), pool.generated), (6, 6))
+        for charlevel in range(20, 30):
+            self.assertTrue(isinstance(pool.character(charlevel),
+                                       PlayerCharacter))
+        self.assertEqual((pool.generated, pool.cloned), (6, 10))
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+
+    def testbands(self):
+        """Share templates across a band, but not between bands."""
+        pool = CharacterPool(size=2, renew=0, bandwidth=5)
+        self.assertEqual([pool.band(level) for level in (0, 4, 5, 42)],
+                         [0, 0, 1, 8])
+        for charlevel in (40, 41, 44, 42, 43):
+            pool.character(charlevel)
+        self.assertEqual(pool.generated, 2)
+        pool.character(45)
+        self.assertEqual(pool.generated, 3)
+
+    def testrenew(self):
+        """Replace the template drawn every time, with renew=1."""
+        pool = CharacterPool(size=2, renew=1)
+        for i in range(10):
+            pool.character(charlevel=5)
+        self.assertEqual(pool.generated, 10)
+
+    def testrace(self):
+        """Keep templates for a given race apart from any race."""
+        pool = CharacterPool(size=2)
+        for i in range(5):
+            self.assertEqual(pool.character(5, race='Dwarf').race, 'Dwarf')
+        pool.character(5)
+        self.assertEqual(len(pool), 3)
+
+    def testclone(self):
+        """Change a clone, leaving its template as it was."""
+        template = PlayerCharacter(charlevel=30)
+        before = (str(template.stats), list(map(str, template.abilities)),
+                  len(template.inventory), len(template.equipped))
+        twin = clone(template)
+        self.assertEqual(str(twin.stats), before[0])
+        twin.stats.ST += 5
+        twin.stats.damage.append('1d6')
+        twin.abilities.append(PhysicalAbility('Thrown Weapons', 1))
+        twin.inventory.append(None)
+        twin.equipped.append(None)
+        self.assertEqual((str(template.stats),
+                          list(map(str, template.abilities)),
+                          len(template.inventory), len(template.equipped)),
+                         before)
+
+    def testcopies(self):
+        """Give clones items and abilities of their own, and new names."""
+        random.seed(12)
+        pool = CharacterPool(size=1, renew=0)
+        (a, b) = (pool.character(35), pool.character(35))
+        self.assertNotEqual(a.name, b.name)
+        self.assertEqual(a.race, b.race)
+        self.assertEqual(list(map(str, a.inventory)),
+                         list(map(str, b.inventory)))
+        for i, item in enumerate(a.equipped):
+            self.assertFalse(item is b.equipped[i])
+            self.assertTrue(any(item is other for other in a.inventory))
+        for i, ability in enumerate(a.abilities):
+            self.assertFalse(ability is b.abilities[i])
+            self.assertEqual(ability, b.abilities[i])
+
+    def testparty(self):
+        """Draw a party's characters from a pool passed to it."""
+        pool = CharacterPool(size=2, renew=0)
+        party = PCParty(3, 34, pool=pool)
+        self.assertEqual(pool.cloned, len(party.creatures))
+        self.assertTrue(pool.generated <= 2)
+        self.assertEqual(PCParty(3, 34).pool, None)
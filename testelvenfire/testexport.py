@@ -0,0 +1,142 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from elvenfire import streams
+from elvenfire.export import *
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow, pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+
+class TestExport(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _path(self, name):
+        return os.path.join(self.dir, name)
+
+    def testrows(self):
+        """Flatten each kind of record into cells of its column types."""
+        records = {'artifacts' : streams.iter_artifacts(seed=1, count=20),
+                   'creatures' : streams.iter_creatures(seed=1, count=10),
+                   'rooms' : streams.iter_rooms(2, seed=1, count=5)}
+        types = {'int' : int, 'float' : (int, float), 'str' : str}
+        for kind, feed in records.items():
+            cols = columns(kind)
+            for row in rows(feed, kind):
+                self.assertEqual(len(row), len(cols))
+                for cell, (name, type) in zip(row, cols):
+                    self.assertTrue(isinstance(cell, types[type]),
+                                    '%s %s %r' % (kind, name, cell))
+
+    def testslots(self):
+        """Give artifacts columns for as many abilities as asked."""
+        self.assertEqual(len(columns('artifacts', slots=2)),
+                         len(columns('artifacts', slots=0)) + 6)
+        for row in rows(streams.iter_artifacts('Book', seed=2, count=10),
+                        'artifacts', slots=1):
+            self.assertEqual(len(row), len(columns('artifacts', slots=1)))
+
+    def testorder(self):
+        """Fill artifact ability columns highest AC first, however held."""
+        from elvenfire.artifacts.greater import Ring
+        from elvenfire.abilities.charabilities import MentalAbility
+        ring = Ring(abilities=[MentalAbility('Aid', 1),
+                               MentalAbility('Fireball', 3),
+                               MentalAbility('Avert', 2)])
+        ring.abilities.reverse()
+        row = artifactrow(ring, slots=2)
+        names = [name for name, type in columns('artifacts', slots=2)]
+        ACs = [row[names.index('ability%d_ac' % i)] for i in (1, 2)]
+        self.assertEqual(ACs, sorted([a.AC for a in ring.abilities],
+                                     reverse=True)[:2])
+        self.assertEqual(row[names.index('abilities')], 3)
+
+    def testcsv(self):
+        """Write a CSV file in chunks, reading the same rows back."""
+        path = self._path('rooms.csv')
+        expected = list(rows(streams.iter_rooms(1, seed=3, count=7), 'rooms'))
+        count = export(streams.iter_rooms(1, seed=3, count=7), 'rooms', path,
+                       chunksize=3)
+        self.assertEqual(count, 7)
+        with open(path, newline='') as f:
+            lines = list(csv.reader(f))
+        self.assertEqual(lines[0], [name for name, type in columns('rooms')])
+        self.assertEqual(lines[1:], [[str(cell) for cell in row]
+                                     for row in expected])
+
+    def testjsonl(self):
+        """Write a JSON Lines file, one object per record."""
+        path = self._path('artifacts.txt')
+        expected = list(rows(streams.iter_artifacts(seed=4, count=12),
+                             'artifacts'))
+        count = export(streams.iter_artifacts(seed=4, count=12), 'artifacts',
+                       path, format='.jsonl', chunksize=5)
+        self.assertEqual(count, 12)
+        names = [name for name, type in columns('artifacts')]
+        with open(path) as f:
+            objects = [json.loads(line) for line in f]
+        self.assertEqual(objects, [dict(zip(names, row)) for row in expected])
+
+    def testempty(self):
+        """Write no records, leaving only a header."""
+        path = self._path('empty.csv')
+        self.assertEqual(export([], 'creatures', path), 0)
+        with open(path) as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+    @unittest.skipUnless(numpy, 'requires numpy')
+    def testnpz(self):
+        """Write an .npz file, one array per column."""
+        path = self._path('creatures.npz')
+        expected = list(rows(streams.iter_creatures(seed=5, count=9),
+                             'creatures'))
+        export(streams.iter_creatures(seed=5, count=9), 'creatures', path,
+               chunksize=4)
+        arrays = numpy.load(path)
+        for i, (name, type) in enumerate(columns('creatures')):
+            self.assertEqual(list(arrays[name]), [row[i] for row in expected])
+
+    @unittest.skipUnless(pyarrow, 'requires pyarrow')
+    def testarrow(self):
+        """Write an Arrow IPC file, one batch per chunk."""
+        path = self._path('artifacts.arrow')
+        expected = list(rows(streams.iter_artifacts(seed=6, count=11),
+                             'artifacts'))
+        count = export(streams.iter_artifacts(seed=6, count=11), 'artifacts',
+                       path, chunksize=4)
+        self.assertEqual(count, 11)
+        with pyarrow.ipc.open_file(path) as reader:
+            self.assertEqual(reader.num_record_batches, 3)
+            table = reader.read_all()
+        self.assertEqual(table.schema.names,
+                         [name for name, type in columns('artifacts')])
+        self.assertEqual([list(row.values()) for row in table.to_pylist()],
+                         expected)
+
+    def testerrors(self):
+        """Export an unknown kind or format, to generate an error."""
+        self.assertRaises(ExportError, columns, 'dragons')
+        self.assertRaises(ExportError, export, [], 'dragons',
+                          self._path('x.csv'))
+        self.assertRaises(ExportError, export, [], 'rooms',
+                          self._path('x.xls'))
+        self.assertFalse(os.path.exists(self._path('x.xls')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,21 @@ from elvenfire.artifacts import ArtifactError
 from elvenfire.abilities.charabilities import *
 
 
+class _ScriptedRing (Ring):
+
+    """A Ring drawing count abilities from script, in order."""
+
+    itemtype = 'Ring'
+    script = []
+    count = 1
+
+    def _numabilities(self):
+        return self.count
+
+    def _newability(self):
+        return self.script.pop(0)
+
+
 class TestRod(unittest.TestCase):
 
     def testcharges(self):
@@ -86,6 +101,31 @@ class TestRing(unittest.TestCase):
         for i in range(100):
             Ring()
 
+    def testduplicates(self):
+        """Replace a worse duplicate in place, and redraw an identical one."""
+        _ScriptedRing.count = 3
+        _ScriptedRing.script = [MentalAbility('Lightning Bolt', 1),
+                                MentalAbility('Avert', 1),
+                                MentalAbility('Lightning Bolt', 2),
+                                MentalAbility('Avert', 1),
+                                MentalAbility('Sleep', 1)]
+        r = _ScriptedRing()
+        self.assertEqual(sorted(map(str, r.abilities)),
+                         ['Avert 1', 'Lightning Bolt 2', 'Sleep 1'])
+        self.assertEqual(_ScriptedRing.script, [])
+
+    def testredraws(self):
+        """Draw only identical abilities, to generate an error."""
+        _ScriptedRing.count = 2
+        _ScriptedRing.script = [MentalAbility('Avert', 1)
+                                for i in range(252)]
+        self.assertRaises(ArtifactError, _ScriptedRing)
+        self.assertEqual(_ScriptedRing.script, [])
+        _ScriptedRing.script = [MentalAbility('Avert', 1)
+                                for i in range(251)]
+        _ScriptedRing.script.append(MentalAbility('Sleep', 1))
+        self.assertEqual(len(_ScriptedRing().abilities), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
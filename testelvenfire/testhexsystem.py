@@ -0,0 +1,104 @@
+import unittest
+from elvenfire.labyrinth.hexsystem import *
+from elvenfire.labyrinth.hexsystem.geomorphs import *
+
+
+class TestHexLoc(unittest.TestCase):
+
+    def testhash(self):
+        """Verify that the hexes of a geomorph hash (mostly) apart."""
+        locs = list(Geomorph(5).hexes)
+        hashes = set(hash(loc) for loc in locs)
+        self.assertTrue(len(hashes) > len(locs) * 3 // 4)
+        self.assertEqual(hash(HexLoc(1, 0, 1)), hash(HexLoc(0, 1, 0)))
+
+    def testnormalize(self):
+        """Normalize locations, including those with a and c of mixed sign."""
+        for (loc, normal) in (((2, 0, 1), (1, 1, 0)),
+                              ((-1, 5, 0), (0, 4, 1)),
+                              ((2, 0, -1), (3, -1, 0)),
+                              ((-2, 0, -3), (1, -3, 0))):
+            (a, b, c) = HexLoc(*loc, normalize=True)._normalize()
+            self.assertEqual((a, b, c), normal)
+            self.assertTrue(a == 0 or c == 0)
+            self.assertTrue(a >= 0 and c >= 0)
+            self.assertEqual(HexLoc(*loc), HexLoc(*normal))
+
+    def testwithin(self):
+        """Verify within() against the hexes of geomorphs of each size."""
+        self.assertFalse(HexLoc(0, -5, 6).within(5))
+        self.assertFalse(HexLoc(6, -5, 0).within(5))
+        self.assertTrue(HexLoc(0, -5, 5).within(5))
+        for size in range(1, 7):
+            locs = set(Geomorph(size).hexes)
+            for a in range(-size - 2, size + 3):
+                for b in range(-size - 2, size + 3):
+                    for c in (0, a):
+                        loc = HexLoc(a if c == 0 else 0, b, c, True)
+                        self.assertEqual(loc.within(size), loc in locs)
+
+    def testrotate(self):
+        """Rotate neighbors of the center, which must follow each other."""
+        up = HexLoc(0, 1, 0)
+        for direction, neighbor in zip((UP, UPRIGHT, DOWNRIGHT, DOWN,
+                                        DOWNLEFT, UPLEFT),
+                                       HexLoc(0, 0, 0).neighbors()):
+            loc = HexLoc(0, 1, 0)
+            loc.rotate(direction)
+            self.assertEqual(loc, neighbor)
+
+    def testrotatetwice(self):
+        """Rotate twice by UPRIGHT, which must match rotating to DOWNRIGHT."""
+        for loc in Geomorph(5).hexes:
+            once = HexLoc(loc.a, loc.b, loc.c)
+            once.rotate(DOWNRIGHT)
+            twice = HexLoc(loc.a, loc.b, loc.c)
+            twice.rotate(UPRIGHT)
+            twice.rotate(UPRIGHT)
+            self.assertEqual(once, twice)
+
+
+    def testsides(self):
+        """Verify that the six sides are distinct bits of a side bitmask."""
+        sides = (UPSIDE, UPRIGHT, DOWNRIGHT, DOWN, DOWNLEFT, UPLEFT)
+        self.assertEqual(len(set(sides)), 6)
+        self.assertEqual(sum(sides), 0x3F)
+
+
+class TestGeomorph(unittest.TestCase):
+
+    def testrotate(self):
+        """Rotate a geomorph in each direction, which must keep every hex."""
+        for direction in (UP, UPRIGHT, DOWNRIGHT, DOWN, DOWNLEFT, UPLEFT):
+            g = Geomorph(5)
+            g.rotate(direction)
+            self.assertEqual(set(g.hexes), set(Geomorph(5).hexes))
+            for hex in g.edgehexes():
+                self.assertEqual(hex.type, HALLWAY)
+
+    def testrotatedoors(self):
+        """Rotate a hex's doors, and secret doors, with the hex."""
+        hex = GeomorphHex(HexLoc(0, 1, 0), ROOM_A, UPSIDE | DOWN, UPLEFT)
+        hex.rotate(UPRIGHT)
+        self.assertEqual(hex.loc, HexLoc(0, 0, 1))
+        self.assertEqual(hex.doors, UPRIGHT | DOWNLEFT)
+        self.assertEqual(hex.secret, UPSIDE)
+        hex.rotate(DOWN)
+        self.assertEqual(hex.doors, DOWNLEFT | UPRIGHT)
+        self.assertEqual(hex.secret, DOWN)
+        hex = GeomorphHex(HexLoc(0, 0, 0))
+        hex.rotate(DOWNLEFT)
+        self.assertEqual((hex.doors, hex.secret), (None, None))
+
+    def testroomlist(self):
+        """Find the rooms of a geomorph: contiguous hexes of one type."""
+        g = Geomorph(5)
+        for loc in (HexLoc(0, 0, 0), HexLoc(0, 1, 0), HexLoc(0, 2, 0)):
+            g.hexes[loc].type = ROOM_A
+        for loc in (HexLoc(0, -2, 0), HexLoc(0, -3, 0)):
+            g.hexes[loc].type = ROOM_B
+        g.hexes[HexLoc(0, -4, 0)].type = ROOM_A
+        rooms = sorted(g.roomlist(), key=len)
+        self.assertEqual([len(room) for room in rooms], [1, 2, 3])
+        self.assertEqual(len(g.roomlist(ROOM_A)), 2)
+        self.assertEqual(g.roomlist(SECRET), [])
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import unittest
+
+
+def _loaded(statements, modules):
+    """Run statements in a fresh interpreter; return which modules loaded."""
+    code = statements + "\nimport sys\nprint([m in sys.modules for m in %r])" \
+           % (modules,)
+    output = subprocess.run([sys.executable, '-c', code], check=True,
+                            capture_output=True, text=True).stdout
+    return dict(zip(modules, eval(output)))
+
+
+class TestDeferredImports(unittest.TestCase):
+
+    creatures = ['elvenfire.creatures.character',
+                 'elvenfire.creatures.trainable',
+                 'elvenfire.creatures.nontrainable',
+                 'elvenfire.creatures.special']
+
+    def testrooms(self):
+        """Import rooms, which must not load any creature module."""
+        loaded = _loaded("import elvenfire.labyrinth.rooms", self.creatures)
+        self.assertEqual(list(loaded.values()), [False] * 4)
+
+    def testparty(self):
+        """Populate a party, which loads only its own creature module."""
+        loaded = _loaded("from elvenfire.labyrinth.parties import "
+                         "TrainableParty\nTrainableParty(1, 30)",
+                         self.creatures)
+        self.assertEqual(list(loaded.values()), [False, True, False, False])
+
+    def testsubmodules(self):
+        """Reach submodules as attributes, loading them on first use."""
+        loaded = _loaded("import elvenfire", ['elvenfire.streams'])
+        self.assertFalse(loaded['elvenfire.streams'])
+        loaded = _loaded("import elvenfire\nelvenfire.streams.iter_rooms",
+                         ['elvenfire.streams'])
+        self.assertTrue(loaded['elvenfire.streams'])
+        loaded = _loaded("import elvenfire.artifacts as a\na.greater.Ring",
+                         ['elvenfire.artifacts.greater',
+                          'elvenfire.artifacts.potion'])
+        self.assertEqual(list(loaded.values()), [True, False])
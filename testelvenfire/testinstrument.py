@@ -0,0 +1,128 @@
+import importlib
+import random
+import unittest
+from elvenfire.instrument import *
+
+
+class TestInstrument(unittest.TestCase):
+
+    def tearDown(self):
+        disable()
+
+    def testrestore(self):
+        """Enable and disable, leaving every stage and draw as it was."""
+        before = [getattr(importlib.import_module(module), classname)
+                  .__dict__[method] for stage, module, classname, method
+                  in stages]
+        draws = [random.__dict__[name] for name in drawfunctions]
+        enable()
+        self.assertTrue(enabled())
+        self.assertTrue(random.choice is not draws[drawfunctions.index(
+            'choice')])
+        disable()
+        self.assertFalse(enabled())
+        after = [getattr(importlib.import_module(module), classname)
+                 .__dict__[method] for stage, module, classname, method
+                 in stages]
+        self.assertEqual(before, after)
+        self.assertEqual(draws, [random.__dict__[name]
+                                 for name in drawfunctions])
+
+    def testtwice(self):
+        """Enable instrumentation twice, to generate an error."""
+        enable()
+        self.assertRaises(InstrumentError, enable)
+
+    def testlabels(self):
+        """Count draws under each label, and restore the label after."""
+        profile = enable()
+        random.random()
+        with profile.label('three'):
+            for i in range(3):
+                random.randint(1, 6)
+        random.choice([1, 2])
+        self.assertEqual(profile.draws, {'all' : 2, 'three' : 3})
+        self.assertEqual(profile.drawcount, 5)
+        self.assertTrue(profile.wall['three'] >= 0)
+
+    def testlevelprofile(self):
+        """Profile two levels, recording every room stage under each."""
+        random.seed(1)
+        profile = levelprofile(range(1, 3), rooms=20)
+        self.assertFalse(enabled())
+        self.assertEqual(profile.labels(), ['level 1', 'level 2'])
+        for label in profile.labels():
+            stats = profile.stats[label]
+            self.assertEqual(stats['Room.setcontents'].calls, 20)
+            self.assertTrue('Trap.newtraps' in stats)
+            for s in stats.values():
+                self.assertTrue(0 <= s.own <= s.total + 1e-9)
+            self.assertTrue(profile.draws[label] >=
+                            sum(s.draws for s in stats.values()))
+        self.assertTrue(any('Lock.newlocks' in profile.stats[label]
+                            for label in profile.labels()))
+        self.assertTrue('level 1' in profile.report())
+        self.assertEqual(sorted(profile.asdict()), ['level 1', 'level 2'])
+
+    def testnested(self):
+        """Time a stage called inside another, apart from its caller."""
+        random.seed(2)
+        profile = levelprofile([4], rooms=20)
+        stats = profile.stats['level 4']
+        outer = stats['Room.setcontents']
+        inner = stats['ContainerSet.__init__']
+        self.assertTrue(inner.total <= outer.total)
+        self.assertTrue(outer.own <= outer.total - inner.total + 1e-9)
+
+
+class TestTally(unittest.TestCase):
+
+    def tearDown(self):
+        disable()
+
+    def testoff(self):
+        """Tally a site with instrumentation off, which records nothing."""
+        with tally('site') as attempt:
+            attempt.reject()
+            attempt.accept()
+        self.assertFalse(enabled())
+
+    def testrejects(self):
+        """Count rejections and the draws wasted on them."""
+        profile = enable()
+        for rejects in (0, 2, 3):
+            with tally('site') as attempt:
+                for i in range(rejects):
+                    random.random()
+                    random.random()
+                    attempt.reject()
+                random.random()
+                attempt.accept()
+        stats = profile.sites['all']['site']
+        self.assertEqual(stats.calls, 3)
+        self.assertEqual(stats.rejects, 5)
+        self.assertEqual(stats.wasted, 10)
+        self.assertEqual(stats.draws, 13)
+        self.assertEqual(stats.histogram, {0 : 1, 2 : 1, 3 : 1})
+        self.assertEqual(stats.buckets(), '0:1 2-3:2')
+
+    def testrecursive(self):
+        """Reach a site again while it is open, counting one call."""
+        profile = enable()
+        with tally('site') as outer:
+            outer.reject()
+            with tally('site') as inner:
+                self.assertTrue(inner is outer)
+                inner.reject()
+        stats = profile.sites['all']['site']
+        self.assertEqual((stats.calls, stats.rejects), (1, 2))
+
+    def testgenerators(self):
+        """Profile rooms, recording the retrying sites they reach."""
+        random.seed(3)
+        profile = levelprofile([5], rooms=20)
+        sites = profile.sites['level 5']
+        self.assertTrue('_Party._populate' in sites)
+        for s in sites.values():
+            self.assertEqual(s.calls, sum(s.histogram.values()))
+            self.assertTrue(s.wasted <= s.draws)
@@ -0,0 +1,134 @@
+import bisect
+import math
+import random
+import unittest
+from elvenfire import OddsTable, dieodds, _bonus5result
+from elvenfire.labyrinth.containers import *
+from elvenfire.labyrinth.containers import _containerrows
+from elvenfire.labyrinth.traps import *
+from elvenfire.labyrinth.traps import _trapsbyroll
+from elvenfire.labyrinth.locks import *
+
+
+class TestOddsTable(unittest.TestCase):
+
+    def testtable(self):
+        """Build a table of 2d6, with results and bounds in order."""
+        table = OddsTable(sorted(dieodds(6, 2).items()))
+        self.assertEqual(table.results, list(range(2, 13)))
+        self.assertEqual(table.bounds[-1], 1.0)
+        self.assertEqual(table.bounds, sorted(table.bounds))
+        self.assertAlmostEqual(table.odds[7], 6 / 36)
+
+    def testimpossible(self):
+        """Leave out results with no chance of occurring."""
+        table = OddsTable([('a', 0.5), ('b', 0), ('c', 0.5)])
+        self.assertEqual(table.results, ['a', 'c'])
+        self.assertEqual(set(table.samples(100)), set(['a', 'c']))
+
+    def testdrawfordraw(self):
+        """Sample with the same seed as sample() and samples()."""
+        table = OddsTable([(1, 0.25), (2, 0.5), (3, 0.25)])
+        random.seed(7)
+        single = [table.sample() for i in range(500)]
+        random.seed(7)
+        self.assertEqual(table.samples(500), single)
+        random.seed(7)
+        formula = [1 + (x >= 0.25) + (x >= 0.75)
+                   for x in [random.random() for i in range(500)]]
+        self.assertEqual(single, formula)
+
+
+class TestDifficulties(unittest.TestCase):
+
+    def testroottable(self):
+        """Look up ceil(sqrt(uniform(low, high))) from the same draw."""
+        for (low, high) in ((0, 9), (0, 16), (2, 30)):
+            table = roottable(low, high)
+            self.assertAlmostEqual(sum(table.odds.values()), 1.0)
+            random.seed(8)
+            for i in range(1000):
+                x = random.random()
+                root = table.results[bisect.bisect_right(table.bounds, x)]
+                self.assertEqual(root, math.ceil(math.sqrt(low + (high - low)
+                                                           * x)))
+
+    def testpicklevels(self):
+        """Give each picklevel its exact odds from two Bonus5 rolls."""
+        for level in (1, 3, 8):
+            counts = {}
+            for a in range(1, 21):
+                for b in range(1, 21):
+                    total = (1 + _bonus5result(a, level) +
+                             _bonus5result(b, level))
+                    counts[total] = counts.get(total, 0) + 1
+            table = picklevels(level)
+            self.assertEqual(sorted(table.odds), sorted(counts))
+            for total, count in counts.items():
+                self.assertAlmostEqual(table.odds[total], count / 400)
+
+    def testnewlocks(self):
+        """Draw locks in bulk, each with a possible picklevel."""
+        random.seed(9)
+        locks = Lock.newlocks(4, 500)
+        self.assertEqual(len(locks), 500)
+        possible = set(picklevels(4).results)
+        for lock in locks:
+            self.assertTrue(lock.picklevel in possible)
+            self.assertTrue(lock.strength >= 6 + 5)
+        self.assertEqual(Lock.newlocks(4, 0), [])
+
+
+class TestTraps(unittest.TestCase):
+
+    def testtrapsbyroll(self):
+        """Give each trap type as many rolls as it has on traprolls."""
+        low = 0
+        for maxroll, trapclass in traprolls:
+            self.assertEqual(_trapsbyroll[low:maxroll],
+                             [trapclass] * (maxroll - low))
+            low = maxroll
+        self.assertEqual(len(_trapsbyroll), 100)
+
+    def testnewtraps(self):
+        """Draw traps in bulk, of every type, each set for the level."""
+        random.seed(4)
+        traps = Trap.newtraps(5, 2000)
+        self.assertEqual(len(traps), 2000)
+        self.assertEqual(set(type(t) for t in traps),
+                         set(trapclass for maxroll, trapclass in traprolls))
+        for trap in traps:
+            self.assertTrue(None not in (trap.detect, trap.remove, trap.avoid))
+        self.assertEqual(Trap.newtraps(5, 0), [])
+
+
+class TestContainers(unittest.TestCase):
+
+    def testrows(self):
+        """Look up each d100 roll on the row whose range holds it."""
+        low = 0
+        for row in containerrolls:
+            for roll in range(low + 1, row[0] + 1):
+                self.assertTrue(_containerrows[roll] is row)
+            low = row[0]
+
+    def testcontainersets(self):
+        """Generate container sets, each container with its own trap."""
+        random.seed(5)
+        for i in range(200):
+            containers = ContainerSet(3)
+            self.assertEqual(len(containers.containers), containers.num)
+            traps = [c.trap for c in containers.containers]
+            self.assertTrue(all(isinstance(t, Trap) for t in traps))
+            self.assertEqual(len(set(map(id, traps))), len(traps))
+            str(containers)
+
+    def testlocked(self):
+        """Lock every container of a locked type, and none of the others."""
+        random.seed(6)
+        for i in range(200):
+            containers = ContainerSet(2, num=3)
+            locked = ('locked' in containers.desc and
+                      'unlocked' not in containers.desc)
+            for c in containers.containers:
+                self.assertEqual(c.lock is not None, locked, containers.desc)
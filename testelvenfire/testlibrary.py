@@ -0,0 +1,176 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from elvenfire.labyrinth.hexsystem import *
+from elvenfire.labyrinth.hexsystem.geomorphs import *
+from elvenfire.labyrinth.hexsystem.library import *
+
+
+designs = """# Test designs
+geomorph 3 Guard Room
+0 0 0 ROOM_A doors UP DOWN
+0 1 0 ROOM_A secret UPLEFT
+1 -1 0 SECRET
+
+geomorph 3 Plain
+end
+"""
+
+
+def _guardroom():
+    geomorph = Geomorph(3)
+    center = geomorph.hexes[HexLoc(0, 0, 0)]
+    center.type = ROOM_A
+    center.doors = UPSIDE | DOWN
+    above = geomorph.hexes[HexLoc(0, 1, 0)]
+    above.type = ROOM_A
+    above.secret = UPLEFT
+    return geomorph
+
+
+def _bordered():
+    geomorph = Geomorph(3)
+    for loc, hex in geomorph.hexes.items():
+        if loc.distance() == 3 and hex.type == EMPTY:
+            hex.type = ROOM_B
+            break
+    return geomorph
+
+
+class TestPack(unittest.TestCase):
+
+    def testroundtrip(self):
+        """Unpack a packed geomorph, hex for hex."""
+        for geomorph in (Geomorph(1), Geomorph(5), _guardroom()):
+            copy = unpack(geomorph.size, *pack(geomorph))
+            self.assertEqual(pack(copy), pack(geomorph))
+            for loc, hex in geomorph.hexes.items():
+                other = copy.hexes[loc]
+                self.assertEqual((other.type, other.doors, other.secret),
+                                 (hex.type, hex.doors, hex.secret))
+
+    def testsize(self):
+        """Pack a size 5 geomorph into 184 bytes."""
+        self.assertEqual(sum(map(len, pack(Geomorph(5)))), 184)
+
+    def testcheck(self):
+        """Find a room on the border, and none in a plain geomorph."""
+        self.assertEqual(check(Geomorph(4)), [])
+        self.assertEqual(check(_guardroom()), [])
+        problems = check(_bordered())
+        self.assertEqual(len(problems), 1)
+        self.assertTrue(problems[0].startswith('ROOM_B hex on border'))
+
+
+class TestText(unittest.TestCase):
+
+    def testread(self):
+        """Read a text library, skipping comments and blank lines."""
+        items = list(readtext(io.StringIO(designs.replace(
+            '1 -1 0 SECRET\n', '1 -1 0 SECRET\nend\n'))))
+        self.assertEqual([name for name, geomorph in items],
+                         ['Guard Room', 'Plain'])
+        guard = items[0][1]
+        self.assertEqual(guard.hexes[HexLoc(0, 0, 0)].doors, UPSIDE | DOWN)
+        self.assertEqual(guard.hexes[HexLoc(1, -1, 0)].type, SECRET)
+        self.assertEqual(pack(items[1][1]), pack(Geomorph(3)))
+
+    def testroundtrip(self):
+        """Write geomorphs as text and read the same ones back."""
+        items = [('Guard Room', _guardroom()), ('Bordered', _bordered()),
+                 ('Plain', Geomorph(3))]
+        file = io.StringIO()
+        writetext(items, file)
+        file.seek(0)
+        read = list(readtext(file))
+        self.assertEqual([(name, pack(g)) for name, g in read],
+                         [(name, pack(g)) for name, g in items])
+
+    def testerrors(self):
+        """Read a malformed text library, to generate an error."""
+        for text in (designs,                           # missing end
+                     'end\n',
+                     '0 0 0 ROOM_A\n',
+                     'geomorph 3 A\n0 0 0 CAVE\nend\n',
+                     'geomorph 3 A\n0 0 0 ROOM_A doors SIDEWAYS\nend\n',
+                     'geomorph 3 A\n0 9 0 ROOM_A\nend\n',
+                     'geomorph 3 A\n0 0 0 ROOM_A UP\nend\n',
+                     'geomorph 3 A\ngeomorph 3 B\nend\n'):
+            self.assertRaises(LibraryError, list, readtext(io.StringIO(text)))
+
+
+class TestLibrary(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'designs.geo')
+        self.items = [('Guard Room', _guardroom()), ('Bordered', _bordered()),
+                      ('Plain', Geomorph(3)), ('Guard Room', Geomorph(3))]
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def testroundtrip(self):
+        """Write a binary library and build each geomorph back from it."""
+        self.assertEqual(write(self.items, self.path), 4)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+        with GeomorphLibrary(self.path) as library:
+            self.assertEqual(len(library), 4)
+            self.assertEqual(library.size, 3)
+            self.assertEqual(library.names, [name for name, g in self.items])
+            self.assertEqual([pack(g) for g in library],
+                             [pack(g) for name, g in self.items])
+            self.assertEqual(pack(library[-1]), pack(Geomorph(3)))
+            self.assertFalse(library[0] is library[0])
+            self.assertEqual(library.find('Guard Room'), 0)
+            self.assertRaises(LibraryError, library.find, 'Throne Room')
+            self.assertRaises(IndexError, library.__getitem__, 4)
+
+    def testvalidate(self):
+        """Validate a whole library as check() does each geomorph."""
+        write(self.items * 20, self.path)
+        with GeomorphLibrary(self.path) as library:
+            expected = [(i, problem) for i, (name, geomorph)
+                        in enumerate(self.items * 20)
+                        for problem in check(geomorph)]
+            self.assertEqual(library.validate(), expected)
+            self.assertEqual(len(expected), 20)
+
+    def testcompile(self):
+        """Compile a text library, and check and dump it from main()."""
+        source = os.path.join(self.dir, 'designs.txt')
+        with open(source, 'w') as f:
+            writetext(self.items, f)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(main(['compile', source, self.path]), 0)
+            self.assertEqual(main(['check', self.path]), 1)
+            self.assertEqual(main(['dump', self.path]), 0)
+            self.assertEqual(main([]), 2)
+        self.assertTrue('4 geomorphs, 1 invalid' in out.getvalue())
+        with open(source) as f:
+            self.assertTrue(f.read() in out.getvalue())
+
+    def testerrors(self):
+        """Write or open a bad library, to generate an error."""
+        self.assertRaises(LibraryError, write, [], self.path)
+        self.assertRaises(LibraryError, write,
+                          [('A', Geomorph(3)), ('B', Geomorph(4))], self.path)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertRaises(LibraryError, GeomorphLibrary, self.path)
+        with open(self.path, 'wb') as f:
+            f.write(b'not a geomorph library')
+        self.assertRaises(LibraryError, GeomorphLibrary, self.path)
+        write(self.items, self.path)
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        with open(self.path, 'wb') as f:
+            f.write(data[:-10])
+        self.assertRaises(LibraryError, GeomorphLibrary, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import io
+import unittest
+from elvenfire import streams
+from elvenfire.labyrinth.render import *
+
+
+class _Flushed (io.StringIO):
+
+    """A file that records its length at each flush."""
+
+    def __init__(self):
+        io.StringIO.__init__(self)
+        self.flushes = []
+
+    def flush(self):
+        self.flushes.append(self.tell())
+
+
+class TestRender(unittest.TestCase):
+
+    def testtext(self):
+        """Write rooms exactly as str(room), flushing after each."""
+        rooms = list(streams.iter_rooms(2, seed=1, count=4))
+        file = _Flushed()
+        self.assertEqual(render(rooms, file), 4)
+        self.assertEqual(file.getvalue(), ''.join(str(room) for room in rooms))
+        self.assertEqual(len(file.flushes), 5)
+        self.assertEqual(file.flushes, sorted(file.flushes))
+
+    def testformats(self):
+        """Write a titled level as Markdown and as escaped HTML."""
+        rooms = list(streams.iter_rooms(3, seed=2, count=3))
+        file = io.StringIO()
+        render(rooms, file, 'markdown', title='Deep')
+        text = file.getvalue()
+        self.assertTrue(text.startswith('# Deep\n'))
+        self.assertEqual(text.count('\n## '), 3)
+        file = io.StringIO()
+        render(rooms, file, 'html', title='Level <3>')
+        text = file.getvalue()
+        self.assertTrue('<h1>Level &lt;3&gt;</h1>' in text)
+        self.assertEqual(text.count('<section class="room">'), 3)
+        self.assertTrue(text.endswith('</html>\n'))
+
+    def testunknown(self):
+        """Render an unknown format, to generate an error."""
+        self.assertRaises(RenderError, render, [], io.StringIO(), 'pdf')
+        self.assertRaises(RenderError, renderlevel, io.StringIO(), 1, 1,
+                          format='pdf')
+
+
+class TestRenderLevel(unittest.TestCase):
+
+    def _level(self, **options):
+        file = io.StringIO()
+        count = renderlevel(file, 2, 7, seed=3, chunksize=3, **options)
+        self.assertEqual(count, 7)
+        return file.getvalue()
+
+    def testseed(self):
+        """Write the same level from the same seed, however many workers."""
+        text = self._level()
+        self.assertEqual(self._level(workers=2), text)
+        self.assertTrue(text.startswith('Level 2\n'))
+        self.assertNotEqual(self._level(title='Other'), text)
+
+    def testnumbers(self):
+        """Number rooms on from chunk to chunk."""
+        text = self._level(format='markdown')
+        names = [line[3:] for line in text.splitlines()
+                 if line.startswith('## ')]
+        self.assertEqual(names, ['Room %d' % i for i in range(1, 8)])
+
+
+if __name__ == '__main__':
+    unittest.main()
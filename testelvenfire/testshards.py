@@ -0,0 +1,46 @@
+import unittest
+from elvenfire import streams
+from elvenfire.shards import *
+
+
+class TestShards(unittest.TestCase):
+
+    def testspans(self):
+        """Divide records among shards, the first taking any extra."""
+        self.assertEqual(shardspans(10, 3), [(0, 4), (4, 3), (7, 3)])
+        self.assertEqual(shardspans(1, 2), [(0, 1), (1, 0)])
+
+    def testshardcount(self):
+        """Default to a fixed number of shards, or one per record."""
+        self.assertEqual(shardcount(1000), defaultshards)
+        self.assertEqual(shardcount(3), 3)
+        self.assertEqual(shardcount(0), 1)
+        self.assertEqual(shardcount(3, 5), 5)
+
+    def testshardseed(self):
+        """Seed each shard of a run differently, or not at all."""
+        seeds = [shardseed(5, 'rooms', shard) for shard in range(4)]
+        self.assertEqual(len(set(seeds)), 4)
+        self.assertEqual(seeds[0], shardseed(5, 'rooms', 0))
+        self.assertNotEqual(seeds[0], shardseed(5, 'treasure', 0))
+        self.assertEqual(shardseed(None, 'rooms', 0), None)
+
+    def testrecords(self):
+        """Generate one shard of each target, numbering rooms on."""
+        options = {'kind' : None, 'level' : 2, 'difficulty' : 2}
+        for target in targets:
+            records = list(targetrecords(target, 1, 4, 2, options))
+            self.assertEqual(len(records), 4 if target == 'level' else 2)
+        rooms = targetrecords('rooms', 1, 4, 2, options)
+        self.assertEqual([room.name for room in rooms], ['Room 5', 'Room 6'])
+        self.assertEqual(targetkind('treasure'), 'artifacts')
+        self.assertEqual(targetkind('level'), 'rooms')
+
+    def testunknown(self):
+        """Generate an unknown target, to generate an error."""
+        self.assertRaises(streams.StreamError, targetrecords, 'dragons',
+                          None, 0, 1, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import multiprocessing
+import unittest
+from multiprocessing import shared_memory
+from elvenfire import export, shared, streams
+from elvenfire.shards import shardseed, shardspans, targetrecords
+from elvenfire.shared import *
+
+
+class TestSharedRecords(unittest.TestCase):
+
+    def testroundtrip(self):
+        """Read back every cell and object of packed artifacts."""
+        items = list(streams.iter_artifacts(seed=1, count=25))
+        expected = list(export.rows(items, 'artifacts'))
+        with pack(items, 'artifacts', objects=True) as records:
+            self.assertEqual(len(records), 25)
+            self.assertEqual(records.columns, export.columns('artifacts'))
+            self.assertEqual([[row[name] for name, type in records.columns]
+                              for row in records], expected)
+            self.assertEqual(records[-1], records.row(24))
+            self.assertEqual(list(records.column('value')),
+                             [row[3] for row in expected])
+            self.assertEqual(records.column('name')[2:4],
+                             [row[2] for row in expected[2:4]])
+            self.assertEqual(str(records.object(7)), str(items[7]))
+
+    def testattach(self):
+        """Open a block by name, as another process would."""
+        rooms = list(streams.iter_rooms(2, seed=2, count=4))
+        with pack(rooms, 'rooms') as records:
+            other = SharedRecords(records.name)
+            self.assertEqual(list(other), list(records))
+            other.close(unlink=False)
+            name = records.name
+        self.assertRaises(SharedError, SharedRecords, name)
+
+    def testempty(self):
+        """Pack no records."""
+        with pack([], 'creatures') as records:
+            self.assertEqual(len(records), 0)
+            self.assertEqual(list(records.column('ST')), [])
+
+    def testerrors(self):
+        """Ask for a missing column, row, or object, to generate an error."""
+        with pack(streams.iter_creatures(seed=3, count=2),
+                  'creatures') as records:
+            self.assertRaises(SharedError, records.column, 'colour')
+            self.assertRaises(IndexError, records.row, 2)
+            self.assertRaises(SharedError, records.object, 0)
+
+
+class TestGenerate(unittest.TestCase):
+
+    def testseed(self):
+        """Generate the records of a one-process run, in shard order."""
+        blocks = generate('creatures', 7, seed=4, level=2, workers=2,
+                          shards=3)
+        try:
+            rows = [row for records in blocks for row in records]
+        finally:
+            for records in blocks:
+                records.close()
+        expected = []
+        for shard, (start, size) in enumerate(shardspans(7, 3)):
+            feed = targetrecords('creatures', shardseed(4, 'creatures', shard),
+                                 start, size, {'kind' : None, 'level' : 2,
+                                               'difficulty' : 2})
+            expected += export.rows(feed, 'creatures')
+        names = [name for name, type in export.columns('creatures')]
+        self.assertEqual(rows, [dict(zip(names, row)) for row in expected])
+
+    def testunknown(self):
+        """Generate an unknown target, to generate an error."""
+        self.assertRaises(SharedError, generate, 'dragons', 1)
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == 'fork',
+                         'workers must inherit the failing shard')
+    def testfailure(self):
+        """Free the blocks of finished shards when another shard fails."""
+        def failing(target, seed, start, count, options):
+            if start:
+                raise ValueError('shard at %d' % start)
+            return saved(target, seed, start, count, options)
+        freed = []
+        def unlink(name):
+            freed.append(name)
+            unlinksaved(name)
+        saved, unlinksaved = shared.targetrecords, shared._unlink
+        shared.targetrecords, shared._unlink = failing, unlink
+        try:
+            self.assertRaises(ValueError, generate, 'treasure', 4, seed=5,
+                              workers=2)
+        finally:
+            shared.targetrecords, shared._unlink = saved, unlinksaved
+        self.assertEqual(len(freed), 1)
+        self.assertRaises(FileNotFoundError, shared_memory.SharedMemory,
+                          freed[0])
+
+    def testopen(self):
+        """Free every block when one of them cannot be opened."""
+        opened, freed = [], []
+        def failing(name=None, memory=None):
+            if memory is not None:    # packing, in a worker
+                return saved(memory=memory)
+            if opened:
+                raise SharedError('cannot open %s' % name)
+            opened.append(saved(name))
+            return opened[-1]
+        def unlink(name):
+            freed.append(name)
+            unlinksaved(name)
+        saved, unlinksaved = shared.SharedRecords, shared._unlink
+        shared.SharedRecords, shared._unlink = failing, unlink
+        try:
+            self.assertRaises(SharedError, generate, 'treasure', 6, seed=6,
+                              shards=3)
+        finally:
+            shared.SharedRecords, shared._unlink = saved, unlinksaved
+        self.assertEqual(len(freed), 2)
+        for name in [opened[0].name] + freed:
+            self.assertRaises(FileNotFoundError, shared_memory.SharedMemory,
+                              name)
+
+
+if __name__ == '__main__':
+    unittest.main()
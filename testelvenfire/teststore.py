@@ -0,0 +1,78 @@
+import random
+import unittest
+from elvenfire.artifacts.combat import Weapon
+from elvenfire.artifacts.greater import Ring
+from elvenfire.storemanager import StoreError
+from elvenfire.storemanager.stockitems import *
+from elvenfire.storemanager.store import *
+
+
+class TestStore(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(9)
+        self.store = Store('test', [Weapon() for i in range(300)] +
+                                   [Ring() for i in range(300)])
+        self.names = sorted({name for number, price, item in self.store
+                             for name in itemabilities(item)})
+
+    def _scan(self, kind=None, maxST=None, ability=None, low=0, high=None):
+        """Return the numbers of matching items, by checking every item."""
+        if isinstance(ability, str):
+            ability = (ability,)
+        return [number for number, price, item in self.store
+                if (kind is None or itemkind(item) == kind) and
+                   (maxST is None or requiredST(item) <= maxST) and
+                   (ability is None or
+                    set(ability) & set(itemabilities(item))) and
+                   low <= price and (high is None or price < high)]
+
+    def testfind(self):
+        """Find the items a scan finds, cheapest first."""
+        queries = [{}, {'kind' : 'Ring'}, {'kind' : 'Weapon', 'maxST' : 11},
+                   {'low' : 1000, 'high' : 20000},
+                   {'ability' : self.names[0]},
+                   {'ability' : tuple(self.names[:10])},
+                   {'ability' : tuple(self.names), 'maxST' : 12}]
+        for query in queries:
+            found = list(self.store.find(**query))
+            prices = [price for number, price, item in found]
+            self.assertEqual(prices, sorted(prices))
+            self.assertEqual(sorted(number for number, price, item in found),
+                             sorted(self._scan(**query)))
+
+    def testcount(self):
+        """Count as many items as find() yields, however many abilities."""
+        queries = [{}, {'kind' : 'Weapon', 'maxST' : 12},
+                   {'ability' : self.names[-1], 'low' : 500},
+                   {'ability' : tuple(self.names)},
+                   {'ability' : tuple(self.names) * 2, 'high' : 5000},
+                   {'kind' : 'Ring', 'ability' : tuple(self.names[::2])}]
+        for query in queries:
+            self.assertEqual(self.store.count(**query),
+                             len(list(self.store.find(**query))))
+
+    def testremove(self):
+        """Sell the cheapest item, leaving it out of later queries."""
+        number, price, item = self.store.cheapest('Ring')
+        self.assertTrue(self.store.remove(number) is item)
+        self.assertFalse(number in self.store)
+        self.assertEqual(len(self.store), 599)
+        self.assertEqual(self.store.count(kind='Ring'), 299)
+        self.assertRaises(StoreError, self.store.remove, number)
+        self.assertRaises(StoreError, self.store.price, number)
+        self.assertEqual(self.store.kinds(), ['Ring', 'Weapon'])
+
+    def testadd(self):
+        """Add an item at a given price, and one with no value."""
+        class Rock:
+            pass
+        number = self.store.add(Rock(), price=1)
+        self.assertEqual(self.store.cheapest()[0], number)
+        self.assertEqual(self.store.price(number), 1)
+        self.assertRaises(StoreError, self.store.add, Rock())
+        self.assertRaises(StoreError, itemprice, Rock())
+
+
+if __name__ == '__main__':
+    unittest.main()
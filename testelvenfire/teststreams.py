@@ -0,0 +1,94 @@
+import itertools
+import random
+import unittest
+from elvenfire.streams import *
+from elvenfire.utilities import RandomStream
+
+
+class TestRandomStream(unittest.TestCase):
+
+    def testreproducible(self):
+        """Draw from two streams with one seed, which must match."""
+        first, second = RandomStream(7), RandomStream(7)
+        with first:
+            a = [random.random() for i in range(5)]
+        with second:
+            b = [random.random() for i in range(5)]
+        self.assertEqual(a, b)
+
+    def testprivate(self):
+        """Use a stream, which must leave the random module's state alone."""
+        random.seed(3)
+        expected = random.random()
+        random.seed(3)
+        with RandomStream(1):
+            random.random()
+        self.assertEqual(random.random(), expected)
+
+
+class TestFeeds(unittest.TestCase):
+
+    def testrooms(self):
+        """Yield the same rooms for the same seed, numbered from start."""
+        first = [str(r) for r in iter_rooms(2, seed=5, count=4)]
+        second = [str(r) for r in iter_rooms(2, seed=5, count=4)]
+        self.assertEqual(first, second)
+        rooms = list(iter_rooms(2, seed=5, count=3, start=10))
+        self.assertEqual([r.name for r in rooms],
+                         ['Room 10', 'Room 11', 'Room 12'])
+
+    def testinterleaved(self):
+        """Interleave two feeds and the caller's draws, changing nothing."""
+        alone = [str(a) for a in iter_artifacts('Ring', seed=1, count=5)]
+        feed = iter_artifacts('Ring', seed=1)
+        other = iter_artifacts('Ring', seed=2)
+        mixed = []
+        for i in range(5):
+            mixed.append(str(next(feed)))
+            next(other)
+            random.random()
+        self.assertEqual(mixed, alone)
+
+    def testunbounded(self):
+        """Take items from an unbounded feed with islice()."""
+        creatures = list(itertools.islice(iter_creatures('Trainable'), 7))
+        self.assertEqual(len(creatures), 7)
+
+    def testartifactkinds(self):
+        """Yield artifacts of each kind, and of a random mix."""
+        for kind in artifactkinds:
+            for artifact in iter_artifacts(kind, count=3):
+                self.assertEqual(type(artifact).__name__, kind)
+        self.assertEqual(len(list(iter_artifacts(count=20))), 20)
+
+    def testcreaturekinds(self):
+        """Yield creatures of each kind, and of a random mix."""
+        for kind in creaturekinds:
+            self.assertEqual(len(list(iter_creatures(kind, count=2))), 2)
+        self.assertEqual(len(list(iter_creatures(count=10, level=3))), 10)
+
+    def testinvalidkind(self):
+        """Ask for an unknown kind, to generate an error."""
+        self.assertRaises(StreamError, iter_artifacts, 'Wand')
+        self.assertRaises(StreamError, iter_creatures, 'Dragon')
+
+
+class TestSingles(unittest.TestCase):
+
+    def testnewartifact(self):
+        """Create one artifact of each kind, from the artifact registry."""
+        from elvenfire.artifacts import artifactclass
+        for kind in artifactkinds:
+            self.assertTrue(isinstance(newartifact(kind),
+                                       artifactclass(kind)))
+
+    def testnewartifactkinds(self):
+        """Ask for a registered type not in artifactkinds, for an error."""
+        self.assertRaises(StreamError, newartifact, 'HealingPotion')
+        self.assertRaises(StreamError, iter_artifacts, 'Grenade')
+
+    def testnewcreature(self):
+        """Create one creature of each kind."""
+        for kind in creaturekinds:
+            self.assertTrue(newcreature(kind, 1) is not None)
+        self.assertRaises(StreamError, newcreature, 'Dragon', 1)
@@ -0,0 +1,109 @@
+import importlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from elvenfire import tables
+from elvenfire.tables import *
+
+
+class TestTableCache(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = build(os.path.join(self.dir, 'tables.bin'))
+        self.cache = TableCache(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def testcontents(self):
+        """Read every table back from the cache, equal to its literal."""
+        for name, module, attribute in sources:
+            literal = getattr(importlib.import_module(module), attribute)
+            cached = self.cache.get(name)
+            self.assertFalse(self.cache.stale(name))
+            self.assertEqual(len(cached), len(literal))
+            if isinstance(literal, dict):
+                self.assertTrue(isinstance(cached, CachedMapping))
+                for key in literal:
+                    self.assertEqual(cached[key], literal[key])
+            else:
+                self.assertTrue(isinstance(cached, CachedTable))
+                self.assertEqual(cached, literal)
+                self.assertEqual(cached[-1], literal[-1])
+                self.assertEqual(cached[1:3], literal[1:3])
+
+    def testadded(self):
+        """Add a key to a cached mapping, without touching the file."""
+        descs = self.cache.get('mental.abilitydescs')
+        size = len(descs)
+        descs['Imaginary'] = ['A test description']
+        self.assertEqual(descs['Imaginary'], ['A test description'])
+        self.assertEqual(len(descs), size + 1)
+        self.assertFalse('Imaginary' in TableCache(self.path).get(
+            'mental.abilitydescs'))
+
+    def testerrors(self):
+        """Open a missing or foreign file, or ask for an unknown table."""
+        self.assertRaises(TableError, TableCache,
+                          os.path.join(self.dir, 'missing.bin'))
+        other = os.path.join(self.dir, 'other.bin')
+        with open(other, 'wb') as f:
+            f.write(b'not a table cache at all')
+        self.assertRaises(TableError, TableCache, other)
+        self.assertRaises(TableError, self.cache.get, 'dragons')
+
+
+class TestLoad(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'tables.bin')
+        self.saved = tables.cachepath
+
+    def tearDown(self):
+        tables.cachepath = self.saved
+        shutil.rmtree(self.dir)
+
+    def testcached(self):
+        """Load a table from a current cache."""
+        tables.cachepath = build(self.path)
+        self.assertTrue(isinstance(load('special.creatures'), CachedTable))
+
+    def testmissing(self):
+        """Load a table with no cache file, or with the cache disabled."""
+        from elvenfire.data.special import creatures
+        tables.cachepath = self.path
+        self.assertTrue(load('special.creatures') is creatures)
+        tables.cachepath = None
+        self.assertTrue(load('special.creatures') is creatures)
+
+    def teststale(self):
+        """Load a table whose source changed since the cache was built."""
+        from elvenfire.data.special import creatures
+        tables.cachepath = build(self.path)
+        cache = TableCache(self.path)
+        kind, offsets, stamp = cache.index['special.creatures']
+        cache.index['special.creatures'] = (kind, offsets, (0, 0))
+        tables._caches[self.path] = cache
+        self.assertTrue(cache.stale('special.creatures'))
+        self.assertTrue(load('special.creatures') is creatures)
+
+    def testliterals(self):
+        """Define the classes from a current cache, without the literals."""
+        build(self.path)
+        code = ("import sys\n"
+                "from elvenfire import tables\n"
+                "tables.cachepath = %r\n"
+                "from elvenfire.labyrinth.rooms import Room\n"
+                "Room(3, 1)\n"
+                "from elvenfire.creatures.special import SpecialCreature\n"
+                "print(type(SpecialCreature.creatures).__name__, "
+                "[m for m in sys.modules if m.startswith('elvenfire.data.')])\n"
+                % self.path)
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                capture_output=True, text=True).stdout
+        self.assertEqual(output.strip(), 'CachedTable []')
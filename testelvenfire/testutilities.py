@@ -0,0 +1,76 @@
+import random
+import threading
+import unittest
+from elvenfire.utilities import *
+
+
+class TestOutcomes(unittest.TestCase):
+
+    def testenumerate(self):
+        """Enumerate every path of choice(), randint() and uniform()."""
+        def draw():
+            coin = random.choice(['heads', 'tails'])
+            if coin == 'heads':
+                return (coin, random.randint(1, 3))
+            return (coin, random.uniform(0, 1) < 0.25)
+        pairs = dict((repr(result), chance) for result, chance
+                     in outcomes(draw, key=repr, steps=4))
+        self.assertEqual(sorted(pairs), sorted(map(repr, [
+            ('heads', 1), ('heads', 2), ('heads', 3),
+            ('tails', True), ('tails', False)])))
+        self.assertAlmostEqual(sum(pairs.values()), 1.0)
+        self.assertAlmostEqual(pairs[repr(('heads', 2))], 1 / 6)
+        self.assertAlmostEqual(pairs[repr(('tails', True))], 1 / 8)
+
+    def testmerged(self):
+        """Merge results with equal keys, keeping the first."""
+        pairs = outcomes(lambda: [random.randint(1, 4)],
+                         key=lambda result: result[0] % 2)
+        self.assertEqual(sorted(pairs), [([1], 0.5), ([2], 0.5)])
+
+    def testuntouched(self):
+        """Enumerate without replacing the random module's functions."""
+        choice = random.choice
+        def draw():
+            self.assertTrue(random.choice is choice)
+            return random.choice('abc')
+        random.seed(4)
+        state = random.getstate()
+        self.assertEqual(len(outcomes(draw)), 3)
+        self.assertEqual(random.getstate(), state)
+        self.assertEqual(random.choice('abc'), random.Random(4).choice('abc'))
+
+    def testthreads(self):
+        """Let another thread draw as usual while enumerating."""
+        rolls = []
+        def roll():
+            rolls.extend(random.randint(1, 6) for i in range(200))
+        def draw():
+            thread = threading.Thread(target=roll)
+            thread.start()
+            thread.join()
+            return random.choice('abc')
+        pairs = outcomes(draw)
+        self.assertEqual(sorted(pairs), [('a', 1 / 3), ('b', 1 / 3),
+                                         ('c', 1 / 3)])
+        self.assertEqual(len(rolls), 600)
+        self.assertEqual(set(rolls), set(range(1, 7)))
+
+
+class TestRandomStream(unittest.TestCase):
+
+    def testreproduce(self):
+        """Draw the same numbers from two streams with the same seed."""
+        first = RandomStream(7)
+        second = RandomStream(7)
+        with first:
+            a = [random.random() for i in range(3)]
+        outside = random.getstate()
+        with second:
+            b = [random.random() for i in range(3)]
+        self.assertEqual(a, b)
+        self.assertEqual(random.getstate(), outside)
+
+
+if __name__ == '__main__':
+    unittest.main()
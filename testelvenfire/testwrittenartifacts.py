@@ -1,3 +1,4 @@
+import random
 import unittest
 from elvenfire.artifacts.written import *
 from elvenfire.artifacts import ArtifactError
@@ -62,6 +63,14 @@ class TestScroll(unittest.TestCase):
         for i in range(100):
             Scroll()
 
+    def testseed(self):
+        """Generate the same Scrolls from the same seed, as always."""
+        random.seed(34)
+        self.assertEqual([str(Scroll()) for i in range(2)],
+                         ['Scroll of Stone Flesh 5: Hob/Goblin',
+                          'Scroll of (Healing 1; Iceball 1; Create: Wall 3; '
+                          'Sleep 3; Control Animal 1): Common'])
+
 
 class TestBook(unittest.TestCase):
 
@@ -113,6 +122,16 @@ class TestBook(unittest.TestCase):
         for i in range(100):
             Book()
 
+    def testseed(self):
+        """Generate the same Books from the same seed, as always."""
+        random.seed(34)
+        self.assertEqual([str(Book()) for i in range(2)],
+                         ['Book of (Healing 1; Knock 1; Stone Flesh 1; '
+                          'Fireball 2; Storm [+ Calm]: Fire 3): Hob/Goblin',
+                          'Book of (Aid 2; Create Artifact 2; Speed 1; '
+                          'Stone Flesh 1; Physicker 2; '
+                          'Teleport [+ Recall] 1): Common'])
+
 
 if __name__ == '__main__':
     unittest.main()